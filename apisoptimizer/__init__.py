@@ -1,4 +1,6 @@
 from apisoptimizer.colony import Colony
+from apisoptimizer.islands import Islands
+from apisoptimizer.async_colony import AsyncColony
 from apisoptimizer.bee import Bee
 from apisoptimizer.parameter import Parameter
 from apisoptimizer.logging import logger
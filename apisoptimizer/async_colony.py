@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# async_colony.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+import asyncio
+
+# ApisOptimizer imports
+from apisoptimizer.colony import Colony
+from apisoptimizer.logging import logger
+
+# Colony options AsyncColony cannot honor: evaluations are awaited on the
+#   event loop (no worker processes, timeouts or pruning reporters), and
+#   bees are settled one result at a time (no generations)
+UNSUPPORTED = ('num_processes', 'share_arrays', 'evaluator', 'backend',
+               'timeout', 'max_retries', 'pruner', 'batch', 'steady_state',
+               'fidelities', 'checkpoint', 'checkpoint_every',
+               'checkpoint_interval', 'callback')
+
+
+class AsyncColony(Colony):
+
+    def __init__(self, num_employers, objective_fn, obj_fn_args=None,
+                 max_concurrency=64, **colony_kwargs):
+        '''
+        AsyncColony object: Colony whose objective function is a coroutine
+        function, awaited on the running event loop; initialize() and
+        search() are coroutines that keep up to max_concurrency evaluations
+        in flight (e.g. requests to a model server), each costing an asyncio
+        task instead of a worker process
+
+        Args:
+            num_employers (int): number of employer bees (and initial food)
+            objective_fn (coroutine function): user supplied function to
+                                               determine fitness, awaited as
+                                               objective_fn(params, args)
+            obj_fn_args (any): any additional arguments for user's objective
+                               function
+            max_concurrency (int): maximum number of evaluations in flight
+            **colony_kwargs: additional keyword arguments for Colony (e.g.
+                             seed, selection, cache_size, store); options
+                             in UNSUPPORTED are rejected: bees are settled
+                             one result at a time, so generation is not
+                             advanced, and there are no worker processes,
+                             timeouts, pruning, checkpoints or callbacks
+        '''
+
+        if not asyncio.iscoroutinefunction(objective_fn):
+            raise ValueError('Supplied objective function is not a coroutine '
+                             'function!')
+        for arg in UNSUPPORTED:
+            if arg in colony_kwargs:
+                raise ValueError('{} is not supported by AsyncColony'.format(
+                    arg
+                ))
+        if max_concurrency < 1:
+            raise ValueError('Maximum concurrency must be at least 1: {}'
+                             .format(max_concurrency))
+        super().__init__(num_employers, objective_fn, obj_fn_args,
+                         **colony_kwargs)
+        self.__obj_fn = objective_fn
+        self.__obj_fn_args = obj_fn_args
+        self.__num_bees = num_employers * 2
+        self.__max_concurrency = max_concurrency
+
+    @property
+    def max_concurrency(self):
+        '''Returns int: maximum number of evaluations in flight
+        '''
+
+        return self.__max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, num):
+        '''Args:
+            num (int): maximum number of evaluations in flight
+        '''
+
+        assert type(num) is int, \
+            'Invalid concurrency type: {}'.format(type(num))
+        self.__max_concurrency = num
+
+    async def initialize(self):
+        '''
+        Finds initial positions for employers, deploys onlookers to
+        neighboring positions of employers with good fitness
+        '''
+
+        logger.log('info', 'Initializing population of size {}'.format(
+            self.__num_bees
+        ), call_loc='INIT')
+        self.reset()
+        await self.__run(self.__num_bees)
+
+    async def search(self):
+        '''
+        Run the colony's search/follow/abandon process: settles one food
+        source per bee, applying each result as soon as it arrives
+        '''
+
+        logger.log('info', 'Running search iteration', call_loc='SEARCH')
+        await self.__run(self.__num_bees)
+
+    def run(self, *args, **kwargs):
+        '''
+        Not supported: await search() in a loop instead
+        '''
+
+        raise Exception('run() is not supported by AsyncColony; await '
+                        'search() in a loop')
+
+    def iter_search(self, *args, **kwargs):
+        '''
+        Not supported: await search() in a loop instead
+        '''
+
+        raise Exception('iter_search() is not supported by AsyncColony; '
+                        'await search() in a loop')
+
+    async def __run(self, num_results):
+        '''
+        Evaluates candidates from ask() concurrently, telling each result as
+        soon as it arrives, until at least num_results bees have been
+        settled (by tell(), or by ask() from the evaluation cache or store)
+        and no candidates are outstanding
+
+        Args:
+            num_results (int): number of results to tell
+        '''
+
+        pending = set()
+        told = 0
+        try:
+            # Bees sharing a candidate (or looked up) can settle more than
+            #   num_results bees; outstanding candidates are still told
+            while told < num_results or pending:
+                room = min(self.__max_concurrency - len(pending),
+                           num_results - told - len(pending))
+                looked_up = 0
+                if room > 0:
+                    # ask() settles bees whose candidates are in the
+                    #   evaluation cache or store itself
+                    known = self.cache_hits + self.store_hits
+                    for bee_id, params in self.ask(room):
+                        pending.add(asyncio.ensure_future(
+                            self.__evaluate(bee_id, params)
+                        ))
+                    looked_up = self.cache_hits + self.store_hits - known
+                    told += looked_up
+                if not pending:
+                    if looked_up > 0:
+                        continue
+                    raise Exception('No candidates to evaluate')
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                errors = [task.exception() for task in done]
+                told += self.tell([task.result() for task, error
+                                   in zip(done, errors) if error is None])
+                for error in errors:
+                    if error is not None:
+                        raise error
+        except BaseException:
+            # Forget candidates whose results will not be told
+            for task in pending:
+                task.cancel()
+            self.close()
+            raise
+
+    async def __evaluate(self, bee_id, params):
+        '''
+        Awaits the objective function for a candidate from ask()
+
+        Args:
+            bee_id (int): bee that proposed the candidate
+            params (dict): dictionary of parameter names and Parameter
+                objects
+
+        Returns:
+            tuple: (bee_id, objective function value)
+        '''
+
+        return (bee_id, await self.__obj_fn(params, self.__obj_fn_args))
@@ -8,12 +8,61 @@
 
 # Stdlib imports
 from random import randint
-from copy import deepcopy
+from copy import copy
+
+# 3rd party, open src. imports
+from numpy import abs as np_abs, asarray, errstate, where
+
+
+def calc_fitness_scores(obj_fn_vals):
+    '''
+    Derive fitness scores for an array of objective function values (array
+    form of Bee's fitness score)
+
+    Args:
+        obj_fn_vals (numpy.ndarray): values from objective function
+
+    Returns:
+        numpy.ndarray: fitness scores, i.e. normalized objective function
+            values
+    '''
+
+    obj_fn_vals = asarray(obj_fn_vals, dtype=float)
+    # 1 / (obj_fn_val + 1) is only used for non-negative values
+    with errstate(divide='ignore'):
+        return where(
+            obj_fn_vals >= 0,
+            1 / (obj_fn_vals + 1),
+            1 + np_abs(obj_fn_vals)
+        )
+
+
+def calc_obj_fn_val(fitness):
+    '''
+    Recovers the objective function value a fitness score was derived from
+    (inverse of calc_fitness_scores)
+
+    Args:
+        fitness (float): fitness score
+
+    Returns:
+        float: objective function value; infinity if fitness is not positive
+    '''
+
+    if fitness <= 0:
+        return float('inf')
+    if fitness <= 1:
+        return 1 / fitness - 1
+    return 1 - fitness
 
 
 class Bee:
 
-    def __init__(self, param_dict, obj_fn_val, stay_limit, is_employer=False):
+    __slots__ = ('param_dict', 'fitness_score', 'obj_fn_val', 'is_employer',
+                 '__stay_count', '__stay_limit', 'abandon')
+
+    def __init__(self, param_dict, obj_fn_val, stay_limit, is_employer=False,
+                 stay_count=0):
         '''
         Bee object for employer and onlooker bees
 
@@ -25,15 +74,17 @@ class Bee:
             stay_limit (int): how many neighboring food sources to search
                               before the current one is abandoned
             is_employer (bool): distinguishes an employer from an onlooker
+            stay_count (int): how many neighboring food sources have already
+                              been searched from the current one
         '''
 
         self.param_dict = param_dict
         self.fitness_score = self.__calc_fitness_score(obj_fn_val)
         self.obj_fn_val = obj_fn_val
         self.is_employer = is_employer
-        self.__stay_count = 0
+        self.__stay_count = stay_count
         self.__stay_limit = stay_limit
-        self.abandon = False
+        self.abandon = stay_count > stay_limit
 
     def mutate(self):
         '''
@@ -45,7 +96,11 @@ class Bee:
         param_to_change = list(self.param_dict.keys())[
             randint(0, len(self.param_dict) - 1)
         ]
-        new_param_dict = deepcopy(self.param_dict)
+        # Only the mutated parameter is copied, the others are shared
+        new_param_dict = dict(self.param_dict)
+        new_param_dict[param_to_change] = copy(
+            self.param_dict[param_to_change]
+        )
         new_param_dict[param_to_change].mutate()
         return new_param_dict
 
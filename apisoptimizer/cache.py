@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# cache.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+from collections import OrderedDict
+
+# 3rd party, open src. imports
+import numpy as np
+
+
+class EvaluationCache:
+
+    def __init__(self, max_size, tolerance=None):
+        '''
+        EvaluationCache object: memoizes objective function values keyed on
+        parameter values, evicting the least recently used entry when full
+
+        Args:
+            max_size (int): maximum number of cached values
+            tolerance (float): if supplied, float parameter values are
+                rounded to the nearest multiple of tolerance before lookup,
+                so values on the same grid point share a cached value;
+                values closer than tolerance can still round to neighboring
+                grid points and miss each other
+        '''
+
+        if max_size < 1:
+            raise ValueError('Cache size must be at least 1: {}'.format(
+                max_size
+            ))
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError('Cache tolerance must be positive: {}'.format(
+                tolerance
+            ))
+        self.__max_size = max_size
+        self.__tolerance = tolerance
+        self.__values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+
+        return len(self.__values)
+
+    @property
+    def max_size(self):
+        '''
+        Maximum number of cached values
+        '''
+
+        return self.__max_size
+
+    def keys(self, food, float_columns):
+        '''
+        Canonical cache keys for food sources
+
+        Args:
+            food (numpy.ndarray): parameter values, shape (num_food, n_params)
+            float_columns (numpy.ndarray): boolean mask of float parameters,
+                the only columns quantized by tolerance
+
+        Returns:
+            list: one hashable key per food source
+        '''
+
+        food = np.array(food, dtype=float, ndmin=2)
+        if self.__tolerance is not None:
+            food[:, float_columns] = np.round(
+                food[:, float_columns] / self.__tolerance
+            )
+        return [tuple(values) for values in food.tolist()]
+
+    def get(self, key):
+        '''
+        Looks up a cached objective function value, counting a hit or miss
+
+        Args:
+            key (tuple): key returned by keys()
+
+        Returns:
+            float or None: cached value, None if not cached
+        '''
+
+        obj_fn_val = self.__values.get(key)
+        if obj_fn_val is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__values.move_to_end(key)
+        return obj_fn_val
+
+    def put(self, key, obj_fn_val):
+        '''
+        Caches an objective function value, evicting the least recently used
+        value if the cache is full
+
+        Args:
+            key (tuple): key returned by keys()
+            obj_fn_val (int or float): objective function value
+        '''
+
+        self.__values[key] = obj_fn_val
+        self.__values.move_to_end(key)
+        if len(self.__values) > self.__max_size:
+            self.__values.popitem(last=False)
+
+    def clear(self):
+        '''
+        Removes every cached value (hit and miss counts are kept)
+        '''
+
+        self.__values.clear()
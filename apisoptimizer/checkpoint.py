@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# checkpoint.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+import json
+import os
+from tempfile import NamedTemporaryFile
+from threading import Thread
+
+# 3rd party, open src. imports
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+
+def write_checkpoint(path, arrays, meta):
+    '''
+    Writes a checkpoint atomically: the checkpoint is written to a temporary
+    file in the same directory, then renamed over path, so path always holds
+    a complete checkpoint
+
+    Args:
+        path (str): path to the checkpoint file
+        arrays (dict): names and NumPy arrays to save
+        meta (dict): JSON-serializable state to save
+    '''
+
+    meta = dict(meta, version=CHECKPOINT_VERSION)
+    directory = os.path.dirname(os.path.abspath(path))
+    with NamedTemporaryFile(dir=directory, suffix='.tmp',
+                            delete=False) as tmp:
+        try:
+            np.savez(tmp, meta=np.array(json.dumps(meta)), **arrays)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+
+
+def read_checkpoint(path):
+    '''
+    Reads a checkpoint written by write_checkpoint
+
+    Args:
+        path (str): path to the checkpoint file
+
+    Returns:
+        tuple: (dict: names and NumPy arrays, dict: saved state)
+    '''
+
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files if name != 'meta'}
+        meta = json.loads(str(data['meta']))
+    if meta.get('version') != CHECKPOINT_VERSION:
+        raise ValueError('Unsupported checkpoint version: {}'.format(
+            meta.get('version')
+        ))
+    return (arrays, meta)
+
+
+class CheckpointWriter:
+
+    def __init__(self):
+        '''
+        CheckpointWriter object: writes checkpoints on a background thread,
+        one at a time; a write waits for the previous one to finish
+        '''
+
+        self.__thread = None
+        self.__error = None
+
+    def write(self, path, arrays, meta):
+        '''
+        Starts writing a checkpoint in the background; the arrays must not
+        be modified while they are written
+
+        Args:
+            path (str): path to the checkpoint file
+            arrays (dict): names and NumPy arrays to save
+            meta (dict): JSON-serializable state to save
+        '''
+
+        self.wait()
+        self.__thread = Thread(
+            target=self.__write, args=(path, arrays, meta), daemon=True
+        )
+        self.__thread.start()
+
+    def wait(self):
+        '''
+        Blocks until the checkpoint being written (if any) is complete;
+        raises the error of a failed write
+        '''
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __write(self, path, arrays, meta):
+        '''
+        Background thread target: writes a checkpoint, keeping any error to
+        raise from wait()
+        '''
+
+        try:
+            write_checkpoint(path, arrays, meta)
+        except Exception as error:
+            self.__error = error
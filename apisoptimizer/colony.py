@@ -7,22 +7,42 @@
 #
 
 # Stdlib imports
-from copy import deepcopy
-from multiprocessing import Pool
+from queue import Empty, Queue
+from time import perf_counter
 
 # 3rd party, open src. imports
-from numpy.random import choice
+import numpy as np
 
 # ApisOptimizer imports
-from apisoptimizer.bee import Bee
-from apisoptimizer.parameter import Parameter
-from apisoptimizer.logging import logger
+from apisoptimizer.bee import Bee, calc_fitness_scores, calc_obj_fn_val
+from apisoptimizer.cache import EvaluationCache
+from apisoptimizer.evaluators import BACKENDS, EvaluationCancelled, \
+    EvaluationTimeout, PoolEvaluator, ThreadEvaluator, _evaluate, \
+    _evaluate_batch, _evaluate_fidelity, _evaluate_pruned, _make_param_dict, \
+    _timed
+from apisoptimizer.checkpoint import CheckpointWriter, read_checkpoint, \
+    write_checkpoint
+from apisoptimizer.store import EvaluationStore
+from apisoptimizer.parameter import Parameter, ParameterSpace
+from apisoptimizer.logging import logger, log_enabled, log_lazy
+from apisoptimizer.pruning import Reporter, get_pruner
+from apisoptimizer.surrogate import get_surrogate
+from apisoptimizer.selection import get_selection
+from apisoptimizer.stats import ColonyStats, RunResult
 
 
 class Colony:
 
     def __init__(self, num_employers, objective_fn, obj_fn_args=None,
-                 num_processes=1):
+                 num_processes=1, share_arrays=False, steady_state=False,
+                 batch=False, seed=None, selection='roulette',
+                 cache_size=None, cache_tolerance=None, store=None,
+                 warm_start=True, checkpoint=None, checkpoint_every=None,
+                 checkpoint_interval=None, evaluator=None,
+                 backend='process', timeout=None, max_retries=0,
+                 timeout_penalty=float('inf'), pruner=None,
+                 fidelities=None, reduction_factor=3, surrogate=None,
+                 surrogate_candidates=5, instrument=False, callback=None):
         '''
         Colony object: optimizes parameters for supplied objective function
 
@@ -33,18 +53,207 @@ class Colony:
             obj_fn_args (any): any additional arguments for user's objective
                                function
             num_processes (int): number of concurrent processes for bee eval
+            share_arrays (bool): if True, NumPy arrays in obj_fn_args (found
+                                 in dictionaries, lists and tuples) are placed
+                                 in shared memory and passed to worker
+                                 processes as read-only views, not copies
+            steady_state (bool): if True, search() applies each bee's result
+                                 as soon as it is available instead of
+                                 waiting for the whole generation
+            batch (bool): if True, objective_fn is a batch objective function,
+                          called as objective_fn(food, names, obj_fn_args)
+                          with a (n_bees, n_params) array of parameter values
+                          and the list of parameter names (column order); it
+                          returns an array of n_bees objective values
+            seed (int): seed for the colony's random number generator
+            selection (str or Selection): how onlookers choose bees to
+                                          follow: 'roulette' (fitness-
+                                          proportional), 'rank',
+                                          'tournament', or a Selection
+                                          object from apisoptimizer.selection
+            cache_size (int): if supplied, objective function values are
+                              memoized for up to cache_size parameter
+                              vectors (least recently used evicted first);
+                              identical food sources are not re-evaluated
+            cache_tolerance (float): if supplied with cache_size, float
+                                     parameter values are rounded to the
+                                     nearest multiple of cache_tolerance
+                                     before lookup; values rounded to the
+                                     same grid point share a cached value
+                                     (values closer than cache_tolerance
+                                     may still round to neighboring points)
+            store (str or EvaluationStore): if supplied, every evaluation
+                                            (parameters, objective function
+                                            value, seconds taken) is appended
+                                            to this SQLite file
+            warm_start (bool): if True and a store is supplied, initialize()
+                               seeds employers with the best stored food
+                               sources, and stored values are reused instead
+                               of re-evaluating
+            checkpoint (str): if supplied with checkpoint_every and/or
+                              checkpoint_interval, path that search()
+                              periodically saves checkpoints to (written in
+                              the background, see save_checkpoint())
+            checkpoint_every (int): save a checkpoint every checkpoint_every
+                                    generations
+            checkpoint_interval (float): save a checkpoint if
+                                         checkpoint_interval seconds have
+                                         passed since the last one
+            evaluator (Evaluator): if supplied, bees are evaluated by this
+                                   Evaluator (see apisoptimizer.evaluators and
+                                   apisoptimizer.distributed) instead of a
+                                   pool of num_processes processes; the
+                                   caller is responsible for shutting it down
+            backend (str): how num_processes > 1 evaluations run
+                           concurrently: 'process' (a pool of processes),
+                           'thread' (a pool of threads, for objective
+                           functions that release the GIL; supports lambdas
+                           and closures) or 'serial' (one at a time in this
+                           process)
+            timeout (float): if supplied, seconds an evaluation may take; a
+                             worker process exceeding it is killed and
+                             replaced (requires the 'process' backend, used
+                             even if num_processes is 1; evaluators such as
+                             TCPEvaluator take their own timeout)
+            max_retries (int): number of times a timed-out evaluation is
+                               retried
+            timeout_penalty (float): objective function value given to food
+                                     sources whose evaluation timed out after
+                                     max_retries retries, or whose objective
+                                     function value is NaN
+            pruner (str or Pruner): if supplied, objective_fn is called as
+                                    objective_fn(params, obj_fn_args,
+                                    reporter) and reports intermediate values
+                                    with reporter.report(step, value); bees'
+                                    neighbor searches are stopped early by
+                                    this pruner: 'incumbent', 'median',
+                                    'percentile', or a Pruner object from
+                                    apisoptimizer.pruning
+            fidelities (list): if supplied, increasing fidelities (e.g.
+                               numbers of epochs or data fractions; the last
+                               one is a full evaluation), and objective_fn
+                               is called as objective_fn(params,
+                               obj_fn_args, fidelity); scouts and
+                               abandoning onlookers are chosen by successive
+                               halving, screening many candidates at low
+                               fidelities and promoting the best to full
+                               evaluation
+            reduction_factor (int): with fidelities, 1/reduction_factor of
+                                    the candidates screened at each fidelity
+                                    are promoted to the next one
+            surrogate (str or Surrogate): if supplied, a cheap model of the
+                                          objective function trained on the
+                                          colony's evaluations: 'knn',
+                                          'rbf', or a Surrogate object from
+                                          apisoptimizer.surrogate; bees
+                                          searching neighboring food sources
+                                          evaluate the candidate it predicts
+                                          is best
+            surrogate_candidates (int): with a surrogate, neighboring food
+                                        sources generated per bee
+            instrument (bool): if True, the wall-clock time of each phase
+                               of initialize() and search() is recorded in
+                               stats (counters are always kept)
+            callback (callable): if supplied, called as callback(colony)
+                                 after each search() generation, e.g. to
+                                 read colony.stats
         '''
 
         if not callable(objective_fn):
             raise ValueError('Supplied objective function not callable!')
+        if backend not in BACKENDS:
+            raise ValueError('Unsupported backend: use {}'.format(BACKENDS))
+        if timeout is not None and evaluator is not None:
+            raise ValueError('Supply the timeout to the evaluator')
+        if timeout is not None and backend != 'process':
+            raise ValueError('Timeouts require the \'process\' backend')
+        if batch and pruner is not None:
+            raise ValueError('Pruning is not supported with batch objective '
+                             'functions')
+        if fidelities is not None:
+            fidelities = list(fidelities)
+            if len(fidelities) == 0 or any(
+                low >= high for low, high in zip(fidelities, fidelities[1:])
+            ):
+                raise ValueError('Fidelities must be a non-empty, increasing '
+                                 'list: {}'.format(fidelities))
+            if batch or pruner is not None:
+                raise ValueError('Fidelities are not supported with batch '
+                                 'objective functions or pruners')
+            if type(reduction_factor) is not int or reduction_factor < 2:
+                raise ValueError('Reduction factor must be an integer of at '
+                                 'least 2: {}'.format(reduction_factor))
+        if callback is not None and not callable(callback):
+            raise ValueError('Supplied callback not callable!')
+        if type(surrogate_candidates) is not int or surrogate_candidates < 1:
+            raise ValueError('Surrogate candidates must be a positive '
+                             'integer: {}'.format(surrogate_candidates))
+        if np.isnan(timeout_penalty):
+            raise ValueError('Timeout penalty must not be NaN')
+        if batch and steady_state:
+            raise ValueError('Steady-state search is not supported with batch'
+                             ' objective functions')
         self.__obj_fn = objective_fn
         self.__obj_fn_args = obj_fn_args
         self.__num_employers = num_employers
         self.__params = []
-        self.__bees = []
+        self.__space = ParameterSpace(self.__params)
+        self.__rng = np.random.default_rng(seed)
+        self.__selection = get_selection(selection)
+        self.__cache = None
+        if cache_size is not None:
+            self.__cache = EvaluationCache(cache_size, cache_tolerance)
+        self.__owns_store = isinstance(store, str)
+        if self.__owns_store:
+            store = EvaluationStore(store)
+        self.__store = store
+        self.__warm_start = warm_start
+        self.__stored_vals = {}
+        self.__store_hits = 0
         self.__num_processes = num_processes
         self.__best_fitness = 0
         self.__best_params = None
+        self.__share_arrays = share_arrays
+        self.__backend = backend
+        self.__timeout = timeout
+        self.__max_retries = max_retries
+        self.__timeout_penalty = timeout_penalty
+        self.__timeouts = 0
+        self.__retries = 0
+        self.__pruner = None if pruner is None else get_pruner(pruner)
+        self.__pruned = 0
+        self.__fidelities = fidelities
+        self.__reduction_factor = reduction_factor
+        self.__screened = 0
+        self.__surrogate = None if surrogate is None \
+            else get_surrogate(surrogate)
+        self.__surrogate_candidates = surrogate_candidates
+        self.__stats = ColonyStats(instrument)
+        self.__callback = callback
+        self.__deadline = None
+        self.__events = None
+        self.__deduplicated = 0
+        self.__own_evaluator = evaluator is None
+        self.__evaluator = evaluator
+        if self.__own_evaluator:
+            self.__evaluator = self.__default_evaluator()
+        self.__evaluator_started = False
+        self.__steady_state = steady_state
+        self.__batch = batch
+        self.__checkpoint = checkpoint
+        self.__checkpoint_every = checkpoint_every
+        self.__checkpoint_interval = checkpoint_interval
+        self.__checkpoint_writer = CheckpointWriter()
+        self.__last_checkpoint = perf_counter()
+        self.__discard_population()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
 
     @property
     def num_processes(self):
@@ -52,6 +261,8 @@ class Colony:
             tuning, and input dim reduction
         '''
 
+        if not self.__own_evaluator:
+            return self.__evaluator.num_workers
         return self.__num_processes
 
     @num_processes.setter
@@ -63,7 +274,34 @@ class Colony:
 
         assert type(num) is int, \
             'Invalid process number type: {}'.format(type(num))
-        self.__num_processes = num
+        if not self.__own_evaluator:
+            raise ValueError('Number of processes is set by the colony\'s '
+                             'evaluator')
+        if num != self.__num_processes:
+            self.close()
+            self.__num_processes = num
+            self.__evaluator = self.__default_evaluator()
+
+    @property
+    def steady_state(self):
+        '''Returns bool: True if search() runs in steady-state mode, i.e.
+            without waiting for a whole generation before applying results
+        '''
+
+        return self.__steady_state
+
+    @steady_state.setter
+    def steady_state(self, steady_state):
+        '''Args:
+            steady_state (bool): if True, search() runs in steady-state mode
+        '''
+
+        assert type(steady_state) is bool, \
+            'Invalid steady_state type: {}'.format(type(steady_state))
+        if steady_state and self.__batch:
+            raise ValueError('Steady-state search is not supported with batch'
+                             ' objective functions')
+        self.__steady_state = steady_state
 
     @property
     def best_fitness(self):
@@ -73,6 +311,14 @@ class Colony:
 
         return self.__best_fitness
 
+    @property
+    def best_obj_fn_val(self):
+        '''
+        Objective function value of best performing bee so far
+        '''
+
+        return calc_obj_fn_val(self.__best_fitness)
+
     @property
     def best_parameters(self):
         '''
@@ -87,9 +333,9 @@ class Colony:
         Average fitness score for the colony
         '''
 
-        if len(self.__bees) == 0:
+        if len(self.__fitness) == 0:
             return 0
-        return (sum([b.fitness_score for b in self.__bees]) / len(self.__bees))
+        return self.__population_sums()[0] / len(self.__fitness)
 
     @property
     def ave_obj_fn_val(self):
@@ -97,9 +343,165 @@ class Colony:
         Average objective function value for the colony
         '''
 
-        if len(self.__bees) == 0:
+        if len(self.__obj_fn_vals) == 0:
+            return 0
+        return self.__population_sums()[1] / len(self.__obj_fn_vals)
+
+    @property
+    def cache_hits(self):
+        '''
+        Number of evaluations answered by the evaluation cache
+        '''
+
+        if self.__cache is None:
             return 0
-        return (sum([b.obj_fn_val for b in self.__bees]) / len(self.__bees))
+        return self.__cache.hits
+
+    @property
+    def cache_misses(self):
+        '''
+        Number of evaluations not found in the evaluation cache
+        '''
+
+        if self.__cache is None:
+            return 0
+        return self.__cache.misses
+
+    @property
+    def timeouts(self):
+        '''
+        Number of evaluations that exceeded the timeout
+        '''
+
+        return self.__timeouts
+
+    @property
+    def retries(self):
+        '''
+        Number of timed-out evaluations that were retried
+        '''
+
+        return self.__retries
+
+    @property
+    def pruned(self):
+        '''
+        Number of evaluations stopped early by the colony's pruner
+        '''
+
+        return self.__pruned
+
+    @property
+    def screened(self):
+        '''
+        Number of low-fidelity evaluations made while screening scouts and
+        abandoning onlookers
+        '''
+
+        return self.__screened
+
+    @property
+    def surrogate(self):
+        '''
+        The colony's Surrogate object (None if it has none); its
+        mean_abs_error and rank_correlation properties report how accurate
+        its predictions were
+        '''
+
+        return self.__surrogate
+
+    @property
+    def stats(self):
+        '''
+        Instrumentation of the colony since it was created: dictionary with
+        'counts' (evaluations: objective function calls that completed,
+        including pruned, low-fidelity and retried ones, but not timed-out
+        or cancelled calls; objective_seconds: time spent in the
+        objective function, search_seconds: time spent in initialize() and
+        search(), abandonments, scouts, and the cache_hits, cache_misses,
+        store_hits, timeouts, retries, pruned, screened and deduplicated
+        counts),
+        'phases' (seconds per phase if the colony is instrumented:
+        'propose', 'selection', 'lookup', 'evaluate', 'remember', 'settle',
+        'evaluator_start', 'checkpoint'; low-fidelity 'screen' evaluations
+        are part of 'propose'), 'last_generation' ('counts' and 'phases' of
+        the last generation), 'workers' and 'worker_utilization' (objective
+        seconds per worker-second of search, up to 1)
+        '''
+
+        stats = self.__stats.snapshot()
+        stats['counts'].update({
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'store_hits': self.__store_hits,
+            'timeouts': self.__timeouts,
+            'retries': self.__retries,
+            'pruned': self.__pruned,
+            'screened': self.__screened,
+            'deduplicated': self.__deduplicated
+        })
+        stats['workers'] = self.__concurrency()
+        search_seconds = stats['counts']['search_seconds']
+        stats['worker_utilization'] = np.nan if search_seconds == 0 else \
+            stats['counts']['objective_seconds'] / (
+                search_seconds * stats['workers']
+            )
+        return stats
+
+    @property
+    def deduplicated(self):
+        '''
+        Number of evaluations saved because several bees proposed the same
+        food source while it was being evaluated (in one generation, in
+        flight in a steady-state search, or outstanding from ask())
+        '''
+
+        return self.__deduplicated
+
+    @property
+    def store_hits(self):
+        '''
+        Number of evaluations answered by values read from the evaluation
+        store (warm start)
+        '''
+
+        return self.__store_hits
+
+    @property
+    def generation(self):
+        '''
+        Number of search() calls since the population was initialized
+        '''
+
+        return self.__generation
+
+    @property
+    def param_names(self):
+        '''
+        Names of the colony's parameters, i.e. the column order of food
+        source arrays passed to batch objective functions
+        '''
+
+        return [p.name for p in self.__params]
+
+    @property
+    def bees(self):
+        '''
+        List of Bee objects for the colony's employers and onlookers; the
+        colony stores its population as arrays, and Bee objects are built on
+        each access
+        '''
+
+        stay_limit = self.__stay_limit()
+        return [
+            Bee(
+                _make_param_dict(self.__params, self.__food[idx]),
+                float(self.__obj_fn_vals[idx]),
+                stay_limit,
+                is_employer=bool(self.__is_employer[idx]),
+                stay_count=int(self.__stay_counts[idx])
+            ) for idx in range(len(self.__food))
+        ]
 
     def add_param(self, name, min_val, max_val, restrict=True):
         '''
@@ -114,6 +516,13 @@ class Colony:
         '''
 
         self.__params.append(Parameter(name, min_val, max_val, restrict))
+        self.__space = ParameterSpace(self.__params)
+        # Workers hold a copy of the parameters; restart them on next use
+        self.close()
+        # Existing food sources do not have a value for the new parameter
+        self.__discard_population()
+        if self.__cache is not None:
+            self.__cache.clear()
         logger.log('debug', 'Added parameter {}, max,min = {},{}'.format(
             name, min_val, max_val
         ), call_loc='PARAM')
@@ -136,84 +545,47 @@ class Colony:
                 self.__num_employers
         ), call_loc='INIT')
 
-        if self.__num_processes > 1:
-            emp_process_pool = Pool(processes=self.__num_processes)
-            emp_results = []
-
-        self.__bees = []
-
-        # Generate employer bees
-        for _ in range(self.__num_employers):
-
-            param_dict = self.__create_param_dict()
-
-            if self.__num_processes > 1:
-                emp_results.append(emp_process_pool.apply_async(
-                    self._start_process,
-                    [param_dict, self.__obj_fn, self.__obj_fn_args]
-                ))
-
-            else:
-                self.__bees.append(Bee(
-                    param_dict,
-                    self.__obj_fn(param_dict, self.__obj_fn_args),
-                    len(self.__params) * self.__num_employers,
-                    is_employer=True
-                ))
-
-        if self.__num_processes > 1:
-            emp_process_pool.close()
-            emp_process_pool.join()
-            onl_process_pool = Pool(processes=self.__num_processes)
-            onl_results = []
-            for bee in emp_results:
-                self.__bees.append(Bee(
-                    bee.get()[0],
-                    bee.get()[1],
-                    len(self.__params) * self.__num_employers,
-                    is_employer=True
-                ))
-
-        # Calculate probabilities of employer being chosen by onlookers
-        employer_probabilities = self.__calc_bee_probs()
+        self.__discard_in_flight()
+        self.__stats.begin_generation()
+
+        # Generate employer bees, seeded with the best stored food sources
+        stored_food = np.empty((0, len(self.__params)))
+        if self.__store is not None and self.__warm_start:
+            stored_food = self.__load_store()[:self.__num_employers]
+            logger.log('info', 'Seeded {} employers from stored evaluations'
+                       .format(len(stored_food)), call_loc='INIT')
+        with self.__stats.time('propose'):
+            employer_food = np.concatenate((stored_food, self.__screen(
+                self.__scout, self.__num_employers - len(stored_food)
+            )))
+        employer_vals = self.__evaluate(employer_food)
+
+        # Prepare selection of employers by onlookers
+        with self.__stats.time('selection'):
+            self.__prepare_selection(calc_fitness_scores(employer_vals))
 
         logger.log('debug', 'Initializing {} onlooker bees'.format(
             self.__num_employers
         ), call_loc='INIT')
 
         # Generate onlooker bees
-        onlookers = []
-        for _ in range(self.__num_employers):
-
-            chosen_employer = choice(self.__bees, p=employer_probabilities)
-            neighbor_food = chosen_employer.mutate()
-
-            if self.__num_processes > 1:
-                onl_results.append(onl_process_pool.apply_async(
-                    self._start_process,
-                    [neighbor_food, self.__obj_fn, self.__obj_fn_args]
-                ))
-
-            else:
-                onlookers.append(Bee(
-                    neighbor_food,
-                    self.__obj_fn(neighbor_food, self.__obj_fn_args),
-                    len(self.__params) * self.__num_employers
-                ))
-
-        if self.__num_processes > 1:
-            onl_process_pool.close()
-            onl_process_pool.join()
-            for bee in onl_results:
-                onlookers.append(Bee(
-                    bee.get()[0],
-                    bee.get()[1],
-                    len(self.__params) * self.__num_employers
-                ))
+        with self.__stats.time('propose'):
+            chosen = self.__selection.select(self.__num_employers, self.__rng)
+            onlooker_food = self.__neighbor(employer_food[chosen])
+        onlooker_vals = self.__evaluate(onlooker_food)
 
         # Append onlookers to employers
-        self.__bees.extend(onlookers)
+        self.__food = np.concatenate((employer_food, onlooker_food))
+        self.__obj_fn_vals = np.concatenate((employer_vals, onlooker_vals))
+        self.__fitness = calc_fitness_scores(self.__obj_fn_vals)
+        self.__sums = None
+        self.__stay_counts = np.zeros(len(self.__food), dtype=int)
+        self.__is_employer = np.arange(len(self.__food)) \
+            < self.__num_employers
+        self.__generation = 0
+        self.__last_checkpoint = perf_counter()
         self.__determine_best_bee()
+        self.__stats.end_generation()
 
     def search(self):
         '''
@@ -221,255 +593,1417 @@ class Colony:
         generation of bees
         '''
 
-        if len(self.__bees) == 0:
+        if len(self.__food) == 0:
             raise Exception('Initial bee positions must be generated first')
+        if self.__asked or np.isnan(self.__obj_fn_vals).any():
+            raise Exception('Bees have candidates from ask() without results;'
+                            ' tell() their results before searching')
 
         logger.log(
             'info',
             'Running search iteration',
             call_loc='SEARCH'
         )
-        bee_probabilities = self.__calc_bee_probs()
-        next_generation = []
-
-        if self.__num_processes > 1:
-            new_calculations = Pool(processes=self.__num_processes)
-            new_employer_results = []
-            new_onlooker_results = []
-            new_position_results = []
-            current_positions = []
-
-        for bee in self.__bees:
-
-            # If bee is marked for abandonment
-            if bee.abandon:
-
-                # If the bee is an employer, scout for new food source
-                if bee.is_employer:
-
-                    logger.log(
-                        'debug',
-                        'Employer abandoning food: {}'.format(
-                            [bee.param_dict.get(k).value for k in
-                             sorted(bee.param_dict.keys())
-                             if k in bee.param_dict]
-                        ),
-                        call_loc='SEARCH'
-                    )
-                    new_food = self.__create_param_dict()
-
-                    if self.__num_processes > 1:
-                        new_employer_results.append(
-                            new_calculations.apply_async(
-                                self._start_process,
-                                [
-                                    new_food,
-                                    self.__obj_fn,
-                                    self.__obj_fn_args
-                                ]
-                            )
-                        )
+        self.__stats.begin_generation()
+        if self.__steady_state:
+            self.__search_steady_state()
+        else:
+            self.__search_generational()
+        self.__generation += 1
+        with self.__stats.time('checkpoint'):
+            self.__auto_checkpoint()
+        self.__stats.end_generation()
+        if self.__callback is not None:
+            self.__callback(self)
+
+    def run(self, max_generations=None, max_evaluations=None,
+            max_seconds=None, target=None, patience=None, tolerance=0.0):
+        '''
+        Initializes the colony (unless it has a population) and searches
+        until a stopping criterion is met; criteria are checked after each
+        generation, except max_seconds: once it passes, the generation
+        being searched is abandoned and outstanding evaluations are
+        cancelled (see Evaluator.cancel())
 
-                    else:
-                        next_generation.append(Bee(
-                            new_food,
-                            self.__obj_fn(new_food, self.__obj_fn_args),
-                            len(self.__params) * self.__num_employers,
-                            is_employer=True
-                        ))
-
-                # Bee is an onlooker, choose a modified bee to work near
+        Args:
+            max_generations (int): stop after this many generations
+            max_evaluations (int): stop once this many objective function
+                evaluations were made (checked after each generation)
+            max_seconds (float): wall-clock budget of the run
+            target (float): stop once the best objective function value is
+                at or below target
+            patience (int): stop once the best objective function value has
+                not improved by more than tolerance for patience
+                generations
+            tolerance (float): improvement required by patience
+
+        Returns:
+            RunResult: why the run stopped, the best food source, and the
+                generations, evaluations and seconds the run took
+        '''
+
+        if max_generations is None and max_evaluations is None and \
+                max_seconds is None and target is None and patience is None:
+            raise ValueError('Supply at least one stopping criterion')
+
+        start = perf_counter()
+        evaluations = self.__stats.snapshot()['counts']['evaluations']
+        generations = 0
+        history = []
+        stale = 0
+        reason = None
+        if max_seconds is not None:
+            self.__deadline = start + max_seconds
+        try:
+            if len(self.__food) == 0:
+                self.initialize()
+            history.append(self.best_obj_fn_val)
+            reference = history[-1]
+            while True:
+                reason = self.__stop_reason(
+                    generations, max_generations,
+                    self.__stats.snapshot()['counts']['evaluations']
+                    - evaluations, max_evaluations,
+                    perf_counter() - start, max_seconds,
+                    target, stale, patience
+                )
+                if reason is not None:
+                    break
+                self.search()
+                generations += 1
+                history.append(self.best_obj_fn_val)
+                if reference - history[-1] > tolerance:
+                    reference = history[-1]
+                    stale = 0
                 else:
+                    stale += 1
+        except EvaluationCancelled:
+            if self.__deadline is None or perf_counter() < self.__deadline:
+                raise
+            self.__discard_in_flight()
+            reason = 'max_seconds'
+        finally:
+            self.__deadline = None
+
+        logger.log('info', 'Run stopped ({}) after {} generations'.format(
+            reason, generations
+        ), call_loc='RUN')
+        return RunResult(
+            reason,
+            self.__best_fitness,
+            self.__best_params,
+            self.best_obj_fn_val,
+            generations,
+            self.__stats.snapshot()['counts']['evaluations'] - evaluations,
+            perf_counter() - start,
+            history
+        )
 
-                    logger.log(
-                        'debug',
-                        'Onlooker abandoning food: {}'.format(
-                            [bee.param_dict.get(k).value for k in
-                             sorted(bee.param_dict.keys())
-                             if k in bee.param_dict]
-                        ),
-                        call_loc='SEARCH'
-                    )
-                    chosen_bee = choice(self.__bees, p=bee_probabilities)
-                    neighbor_food = chosen_bee.mutate()
-                    logger.log('debug', 'New food: {}'.format(
-                        [neighbor_food.get(k).value for k in
-                         sorted(neighbor_food.keys())
-                         if k in neighbor_food]
-                    ), call_loc='SEARCH')
-
-                    if self.__num_processes > 1:
-                        new_onlooker_results.append(
-                            new_calculations.apply_async(
-                                self._start_process,
-                                [
-                                    neighbor_food,
-                                    self.__obj_fn,
-                                    self.__obj_fn_args
-                                ]
-                            )
+    def iter_search(self, generations=None, evaluations=False):
+        '''
+        Generator running search() generations (initializing the colony
+        first if it has no population) and yielding progress as it is made,
+        e.g. for dashboards; nothing is kept between generations, so a
+        consumer can run indefinitely. Stop by closing the generator (or
+        breaking out of a for loop over it) between generations.
+
+        Each generation yields a summary dictionary: {'event': 'generation',
+        'generation', 'best_fitness', 'best_obj_fn_val', 'best_parameters',
+        'average_fitness', 'ave_obj_fn_val' (kept incrementally, not
+        recomputed over every bee), 'improved' (True if the best food
+        source improved), 'evaluations' (objective function evaluations
+        made in the generation), 'seconds'}.
+
+        Args:
+            generations (int): number of search() generations, unlimited
+                if None
+            evaluations (bool): if True, each generation's summary is
+                preceded by one {'event': 'evaluation', 'parameters',
+                'obj_fn_val', 'seconds'} dictionary per evaluated food
+                source, in the order results arrived; seconds is None for
+                cached or stored values and NaN for timed-out or pruned
+                evaluations
+
+        Yields:
+            dict: evaluation events and generation summaries
+        '''
+
+        if evaluations:
+            self.__events = []
+        try:
+            if len(self.__food) == 0:
+                yield from self.__progress(self.initialize)
+            count = 0
+            while generations is None or count < generations:
+                yield from self.__progress(self.search)
+                count += 1
+        finally:
+            self.__events = None
+
+    def __progress(self, step):
+        '''
+        Runs initialize() or search() for iter_search(), then yields the
+        evaluation events it collected and its summary
+
+        Args:
+            step (callable): self.initialize or self.search
+
+        Yields:
+            dict: evaluation events and the generation summary
+        '''
+
+        best_fitness = self.__best_fitness
+        step()
+        if self.__events:
+            events, self.__events = self.__events, []
+            yield from events
+        last = self.__stats.snapshot()['last_generation']
+        yield {
+            'event': 'generation',
+            'generation': self.__generation,
+            'best_fitness': self.__best_fitness,
+            'best_obj_fn_val': self.best_obj_fn_val,
+            'best_parameters': self.__best_params,
+            'average_fitness': self.average_fitness,
+            'ave_obj_fn_val': self.ave_obj_fn_val,
+            'improved': self.__best_fitness > best_fitness,
+            'evaluations': last['counts']['evaluations'],
+            'seconds': last['counts']['search_seconds']
+        }
+
+    def ask(self, num=1):
+        '''
+        Proposes food sources for the caller to evaluate, e.g. with its own
+        scheduler; results are applied with tell(). Each bee has at most
+        one outstanding candidate, so fewer than num candidates are returned
+        if the other bees are waiting for results (onlookers also wait for
+        every employer's first result). Candidates whose values are in the
+        evaluation cache or store are settled here instead of being
+        returned. If the colony has not been initialized, its population is
+        started from employer food sources (seeded with the best stored
+        food sources, as in initialize()), evaluated through ask() and
+        tell() as well; until every bee has a first result, only those bees
+        are proposed.
+
+        Args:
+            num (int): maximum number of candidates
+
+        Returns:
+            list: list of (bee_id, dictionary of parameter names and
+                Parameter objects) tuples; pass bee_id to tell()
+        '''
+
+        if len(self.__params) == 0:
+            raise Exception(
+                'Parameters must be added before bee positions are found'
+            )
+        if self.__fidelities is not None:
+            raise Exception('ask() is not supported with fidelities')
+        if len(self.__food) == 0:
+            self.__begin_population()
+
+        candidates = []
+        prepared_for = None
+        initializing = np.isnan(self.__obj_fn_vals).any()
+        for _ in range(len(self.__food)):
+            if len(candidates) == num:
+                break
+            idx = self.__next_bee
+            self.__next_bee = (idx + 1) % len(self.__food)
+            if idx in self.__asked or idx in self.__in_flight:
+                continue
+            if initializing and not np.isnan(self.__obj_fn_vals[idx]):
+                continue
+
+            # Bee without a first result: employers evaluate their random
+            #   food source, onlookers follow an employer once every
+            #   employer has a result
+            if np.isnan(self.__obj_fn_vals[idx]):
+                if self.__is_employer[idx]:
+                    proposal = (self.__food[idx].copy(), True)
+                elif np.isnan(
+                    self.__obj_fn_vals[self.__is_employer]
+                ).any():
+                    continue
+                else:
+                    if prepared_for != 'employers':
+                        self.__prepare_selection(
+                            self.__fitness[self.__is_employer]
                         )
+                        prepared_for = 'employers'
+                    chosen = self.__selection.select(1, self.__rng)
+                    proposal = (self.__neighbor(self.__food[chosen])[0], True)
 
-                    else:
-                        next_generation.append(Bee(
-                            neighbor_food,
-                            self.__obj_fn(
-                                neighbor_food,
-                                self.__obj_fn_args
-                            ),
-                            len(self.__params) * self.__num_employers
-                        ))
+            else:
+                if self.__stay_counts[idx] > self.__stay_limit() \
+                        and not self.__is_employer[idx] \
+                        and prepared_for != 'all':
+                    self.__prepare_selection(self.__fitness)
+                    prepared_for = 'all'
+                proposal = self.__propose(idx)
+
+            # Known food source: settled without being handed out
+            obj_fn_val = self.__lookup(proposal[0][None])[0]
+            if not np.isnan(obj_fn_val):
+                if self.__settle(idx, proposal[0], obj_fn_val,
+                                 proposal[1]):
+                    self.__update_best(idx)
+                continue
 
+            self.__asked[idx] = proposal
+
+            # Candidate already handed out for another bee: the bee gets
+            #   that candidate's result from tell()
+            key = proposal[0].tobytes()
+            if key in self.__asked_sharing:
+                self.__asked_sharing[key][1].append(idx)
+                self.__deduplicated += 1
                 continue
+            self.__asked_sharing[key] = (idx, [])
+            candidates.append(
+                (idx, _make_param_dict(self.__params, proposal[0]))
+            )
+        return candidates
+
+    def tell(self, results):
+        '''
+        Applies objective function values of candidates from ask(): bees
+        move to better food sources (abandoning bees move unconditionally),
+        bees that stay count towards abandonment, and the best bee is
+        updated
 
-            # Not marked for abandonment, search for a food source near
-            #   its current one
+        Args:
+            results (iterable): (bee_id, objective function value) tuples
+
+        Returns:
+            int: number of bees settled, including bees that were proposed
+                the same candidate and were not handed out by ask()
+        '''
+
+        settled = 0
+        for idx, obj_fn_val in results:
+            if idx not in self.__asked:
+                raise ValueError('Bee {} has no candidate from ask()'.format(
+                    idx
+                ))
+            food = self.__asked[idx][0]
+            obj_fn_val = self.__replace_nan([obj_fn_val])[0]
+            self.__stats.count('evaluations')
+            self.__remember(food[None], [obj_fn_val], [None])
+            shared = self.__asked_sharing.pop(food.tobytes(), (idx, []))
+            for bee in [idx] + shared[1]:
+                food, replace = self.__asked.pop(bee)
+                if self.__settle(bee, food, obj_fn_val, replace):
+                    self.__update_best(bee)
+                settled += 1
+        return settled
+
+    def emigrants(self, num):
+        '''
+        Copies the colony's best food sources, e.g. to migrate them to
+        another colony
+
+        Args:
+            num (int): number of food sources
+
+        Returns:
+            tuple: (numpy.ndarray: parameter values, shape (num, n_params),
+                columns ordered as param_names; numpy.ndarray: objective
+                function values)
+        '''
+
+        best = np.argsort(-self.__fitness, kind='stable')[:num]
+        return (self.__food[best].copy(), self.__obj_fn_vals[best].copy())
+
+    def immigrate(self, food, obj_fn_vals):
+        '''
+        Moves the colony's worst bees to evaluated food sources from another
+        colony; the best immigrant replaces the worst bee, the second best
+        the second worst and so on, if the immigrant is fitter
+
+        Args:
+            food (numpy.ndarray): parameter values, shape (num, n_params),
+                columns ordered as param_names
+            obj_fn_vals (numpy.ndarray): objective function values of food
+
+        Returns:
+            int: number of bees replaced
+        '''
+
+        if len(self.__food) == 0:
+            raise Exception('Initial bee positions must be generated first')
+        food = np.asarray(food, dtype=float).reshape(-1, len(self.__params))
+        obj_fn_vals = np.asarray(obj_fn_vals, dtype=float)
+        fitness = calc_fitness_scores(obj_fn_vals)
+        order = np.argsort(-fitness, kind='stable')[:len(self.__food)]
+        worst = np.argsort(self.__fitness, kind='stable')[:len(order)]
+        move = fitness[order] > self.__fitness[worst]
+        order, worst = order[move], worst[move]
+        self.__food[worst] = food[order]
+        self.__update_sums(worst, fitness[order], obj_fn_vals[order])
+        self.__obj_fn_vals[worst] = obj_fn_vals[order]
+        self.__fitness[worst] = fitness[order]
+        self.__stay_counts[worst] = 0
+        for idx in worst:
+            self.__update_best(idx)
+        logger.log('debug', '{} immigrants replaced bees'.format(
+            len(worst)
+        ), call_loc='MIGRATE')
+        return len(worst)
+
+    def save_checkpoint(self, path, background=False):
+        '''
+        Saves the colony's state (parameters, population, abandonment
+        counters, best bee, in-flight evaluations and random number
+        generator state) to a file; the file is replaced atomically, so it
+        always holds a complete checkpoint
+
+        Args:
+            path (str): path to the checkpoint file
+            background (bool): if True, the file is written by a background
+                thread (a snapshot of the state is taken first)
+        '''
+
+        if len(self.__food) == 0:
+            raise Exception('Initial bee positions must be generated first')
+        arrays, meta = self.__checkpoint_state()
+        if background:
+            self.__checkpoint_writer.write(path, arrays, meta)
+        else:
+            self.__checkpoint_writer.wait()
+            write_checkpoint(path, arrays, meta)
+        self.__last_checkpoint = perf_counter()
+        logger.log('debug', 'Saved checkpoint of generation {} to {}'.format(
+            self.__generation, path
+        ), call_loc='CHECKPOINT')
+
+    def load_checkpoint(self, path):
+        '''
+        Restores the colony's state from a file written by save_checkpoint();
+        the colony's parameters are replaced by the checkpoint's, and
+        evaluations that were in flight are resubmitted. search() then
+        continues with the same population and random stream.
+
+        Args:
+            path (str): path to the checkpoint file
+        '''
 
-            logger.log(
+        arrays, meta = read_checkpoint(path)
+        # Workers hold a copy of the parameters; restart them on next use
+        self.close()
+        self.__params = [Parameter(*param) for param in meta['params']]
+        self.__space = ParameterSpace(self.__params)
+        self.__num_employers = meta['num_employers']
+        if self.__cache is not None:
+            self.__cache.clear()
+        self.__food = arrays['food']
+        self.__obj_fn_vals = arrays['obj_fn_vals']
+        self.__fitness = arrays['fitness']
+        self.__sums = None
+        self.__stay_counts = arrays['stay_counts']
+        self.__is_employer = arrays['is_employer']
+        self.__best_fitness = meta['best_fitness']
+        self.__best_params = meta['best_params']
+        self.__generation = meta['generation']
+        self.__next_bee = meta['next_bee']
+        bit_generator = getattr(np.random, meta['rng']['bit_generator'])()
+        bit_generator.state = meta['rng']
+        self.__rng = np.random.Generator(bit_generator)
+        self.__last_checkpoint = perf_counter()
+        for idx, food, replace in zip(arrays['in_flight_idx'].tolist(),
+                                      arrays['in_flight_food'],
+                                      arrays['in_flight_replace'].tolist()):
+            self.__in_flight[idx] = (food, replace)
+            self.__submit(idx, food, replace)
+        logger.log('info', 'Loaded checkpoint of generation {} from {}'.format(
+            self.__generation, path
+        ), call_loc='CHECKPOINT')
+
+    def reset(self):
+        '''
+        Discards the colony's population (the best bee found so far is
+        kept); initialize() or ask() starts a new one
+        '''
+
+        self.__discard_in_flight()
+        self.__discard_population()
+
+    def close(self):
+        '''
+        Shuts down the colony's worker pool (or stops its evaluator) if one
+        has been started; it is started again the next time bees are
+        evaluated concurrently. An evaluation store opened by the colony
+        (supplied as a path) is closed and reopened when next written to;
+        a supplied EvaluationStore is only flushed.
+        '''
+
+        if self.__evaluator_started:
+            self.__evaluator.stop()
+            self.__evaluator_started = False
+        self.__discard_in_flight()
+        if self.__store is not None:
+            if self.__owns_store:
+                self.__store.close()
+            else:
+                self.__store.flush()
+        self.__checkpoint_writer.wait()
+
+    def __stop_reason(self, generations, max_generations, evaluations,
+                      max_evaluations, seconds, max_seconds, target, stale,
+                      patience):
+        '''
+        Checks run()'s stopping criteria
+
+        Returns:
+            str or None: name of the first criterion met, None if the run
+                continues
+        '''
+
+        if target is not None and self.best_obj_fn_val <= target:
+            return 'target'
+        if max_evaluations is not None and evaluations >= max_evaluations:
+            return 'max_evaluations'
+        if max_generations is not None and generations >= max_generations:
+            return 'max_generations'
+        if max_seconds is not None and seconds >= max_seconds:
+            return 'max_seconds'
+        if patience is not None and stale >= patience:
+            return 'converged'
+        return None
+
+    def __remaining(self):
+        '''
+        Returns the seconds left before run()'s wall-clock budget is spent;
+        once it is spent, outstanding evaluations are cancelled and
+        EvaluationCancelled is raised
+
+        Returns:
+            float or None: seconds left, None if there is no budget
+        '''
+
+        if self.__deadline is None:
+            return None
+        remaining = self.__deadline - perf_counter()
+        if remaining <= 0:
+            self.__cancel()
+        return remaining
+
+    def __cancel(self):
+        '''
+        Cancels the evaluator's outstanding evaluations and raises
+        EvaluationCancelled
+        '''
+
+        if self.__evaluator_started:
+            self.__evaluator.cancel()
+        raise EvaluationCancelled('Wall-clock budget of run() spent')
+
+    def __search_generational(self):
+        '''
+        Every bee proposes a food source based on the current generation; all
+        proposals are evaluated, then the next generation is created
+        '''
+
+        # Finish evaluations left by a steady-state search
+        while self.__in_flight:
+            self.__settle_next()
+
+        abandon = self.__stay_counts > self.__stay_limit()
+        scouts = np.flatnonzero(abandon & self.__is_employer)
+        followers = np.flatnonzero(abandon & ~self.__is_employer)
+        searchers = np.flatnonzero(~abandon)
+        self.__stats.count('abandonments', len(scouts) + len(followers))
+        self.__stats.count('scouts', len(scouts))
+
+        # Abandoning employers scout for new food sources, abandoning
+        #   onlookers choose a modified bee to work near, all others search
+        #   for a food source near their current one
+        candidates = np.empty_like(self.__food)
+        if log_enabled('debug'):
+            for idx in scouts:
+                logger.log('debug', 'Employer abandoning food: {}'.format(
+                    self.__food_values(self.__food[idx])
+                ), call_loc='SEARCH')
+            for idx in followers:
+                logger.log('debug', 'Onlooker abandoning food: {}'.format(
+                    self.__food_values(self.__food[idx])
+                ), call_loc='SEARCH')
+        with self.__stats.time('propose'):
+            candidates[scouts] = self.__screen(self.__scout, len(scouts))
+        with self.__stats.time('selection'):
+            self.__prepare_selection(self.__fitness)
+        with self.__stats.time('propose'):
+            candidates[followers] = self.__screen(
+                self.__follow, len(followers)
+            )
+            candidates[searchers] = self.__prescreen(self.__food[searchers])
+
+        # One evaluation (or one batch evaluation) for the whole generation;
+        #   neighbor searches can be pruned once they cannot beat the bee's
+        #   current food source
+        obj_fn_vals = self.__evaluate(
+            candidates, np.where(abandon, np.nan, self.__obj_fn_vals)
+        )
+        with self.__stats.time('settle'):
+            self.__move(candidates, obj_fn_vals, abandon)
+
+    def __move(self, candidates, obj_fn_vals, abandon):
+        '''
+        Moves bees to better food sources; abandoning bees move
+        unconditionally. Bees that stay count towards abandonment.
+
+        Args:
+            candidates (numpy.ndarray): food sources proposed by the bees
+            obj_fn_vals (numpy.ndarray): objective function values of the
+                candidates
+            abandon (numpy.ndarray): boolean array, True for abandoning bees
+        '''
+
+        fitness = calc_fitness_scores(obj_fn_vals)
+        move = abandon | (fitness > self.__fitness)
+        if log_enabled('debug'):
+            for idx in np.flatnonzero(move & ~abandon):
+                logger.log(
+                    'debug',
+                    'Found better food: {} -> {}, {} -> {}'.format(
+                        self.__obj_fn_vals[idx],
+                        obj_fn_vals[idx],
+                        self.__food_values(self.__food[idx]),
+                        self.__food_values(candidates[idx])
+                    ),
+                    call_loc='SEARCH'
+                )
+        self.__food[move] = candidates[move]
+        self.__update_sums(move, fitness[move], obj_fn_vals[move])
+        self.__obj_fn_vals[move] = obj_fn_vals[move]
+        self.__fitness[move] = fitness[move]
+        self.__stay_counts[move] = 0
+        self.__stay_counts[~move] += 1
+        self.__determine_best_bee()
+
+    def __search_steady_state(self):
+        '''
+        Settles one food source per bee without a generational barrier: each
+        result is applied as soon as it arrives and the freed worker is given
+        the next bee's proposal; evaluations still running once every bee has
+        been settled carry over to the next call
+        '''
+
+        selection_ready = False
+        for _ in range(len(self.__food)):
+            self.__remaining()
+
+            # Keep every worker busy (bees waiting for another bee's
+            #   evaluation of the same food source do not occupy a worker)
+            while len(self.__in_flight) - self.__waiting < \
+                    self.__concurrency() and \
+                    len(self.__in_flight) < len(self.__food):
+                idx = self.__next_bee
+                self.__next_bee = (idx + 1) % len(self.__food)
+                if idx in self.__in_flight:
+                    continue
+                if self.__stay_counts[idx] > self.__stay_limit() \
+                        and not self.__is_employer[idx] \
+                        and not selection_ready:
+                    with self.__stats.time('selection'):
+                        self.__prepare_selection(self.__fitness)
+                    selection_ready = True
+                with self.__stats.time('propose'):
+                    self.__in_flight[idx] = self.__propose(idx)
+                self.__submit(idx, *self.__in_flight[idx])
+
+            # Apply the next available result
+            if self.__settle_next():
+                selection_ready = False
+
+    def __share_result(self, idx, food, result, obj_fn_val):
+        '''
+        Passes the result of a steady-state evaluation to the bees waiting
+        for the same food source; if the evaluation was pruned, the waiting
+        bees are evaluated themselves (their incumbents may differ)
+
+        Args:
+            idx (int): index of the bee whose evaluation finished
+            food (numpy.ndarray): evaluated parameter values
+            result (tuple): result of the evaluation task
+            obj_fn_val (float): objective function value
+        '''
+
+        shared = self.__sharing.get(food.tobytes())
+        if shared is None or shared[0] != idx:
+            return
+        del self.__sharing[food.tobytes()]
+        self.__waiting -= len(shared[1])
+        pruned = len(result) == 4 and result[3]
+        for waiter in shared[1]:
+            if pruned:
+                self.__deduplicated -= 1
+                self.__submit(waiter, *self.__in_flight[waiter])
+            else:
+                self.__results.put((waiter, (obj_fn_val, None), None))
+
+    def __settle_next(self):
+        '''
+        Waits for the next in-flight evaluation to finish and applies it to
+        the bee that proposed it
+
+        Returns:
+            bool: True if the bee moved to the evaluated food source
+        '''
+
+        with self.__stats.time('evaluate'):
+            try:
+                idx, result, error = self.__results.get(
+                    timeout=self.__remaining()
+                )
+            except Empty:
+                self.__cancel()
+        if isinstance(error, EvaluationTimeout):
+            attempts = self.__attempts.get(idx, 0)
+            if self.__count_timeout(attempts):
+                self.__attempts[idx] = attempts + 1
+                self.__submit(idx, *self.__in_flight[idx])
+                return False
+            result, error = (self.__timeout_penalty, np.nan), None
+        if error is not None:
+            raise error
+        obj_fn_val, seconds = self.__unpack(result)
+        obj_fn_val = self.__replace_nan([obj_fn_val])[0]
+        self.__attempts.pop(idx, None)
+        food, replace = self.__in_flight.pop(idx)
+        self.__share_result(idx, food, result, obj_fn_val)
+        if self.__events is not None:
+            self.__record_event(food, obj_fn_val, seconds)
+        if seconds is not None and not np.isnan(seconds):
+            self.__stats.count('objective_seconds', seconds)
+            self.__remember(food[None], [obj_fn_val], [seconds])
+        with self.__stats.time('settle'):
+            if not self.__settle(idx, food, obj_fn_val, replace):
+                return False
+            self.__update_best(idx)
+        return True
+
+    def __propose(self, idx):
+        '''
+        Chooses the next food source for a bee to evaluate: abandoning
+        employers scout for a new food source, abandoning onlookers follow a
+        well-performing bee (the colony's selection must be prepared), all
+        others search a neighboring food source
+
+        Args:
+            idx (int): index of the bee proposing a food source
+
+        Returns:
+            tuple: (numpy.ndarray: parameter values, bool: True if the food
+                source replaces the bee's current one regardless of fitness)
+        '''
+
+        # If bee is marked for abandonment
+        if self.__stay_counts[idx] > self.__stay_limit():
+            self.__stats.count('abandonments')
+
+            # If the bee is an employer, scout for new food source
+            if self.__is_employer[idx]:
+                self.__stats.count('scouts')
+                log_lazy(
+                    'debug',
+                    lambda: 'Employer abandoning food: {}'.format(
+                        self.__food_values(self.__food[idx])
+                    ),
+                    call_loc='SEARCH'
+                )
+                return (self.__screen(self.__scout, 1)[0], True)
+
+            # Bee is an onlooker, choose a modified bee to work near
+            log_lazy('debug', lambda: 'Onlooker abandoning food: {}'.format(
+                self.__food_values(self.__food[idx])
+            ), call_loc='SEARCH')
+            neighbor_food = self.__screen(self.__follow, 1)[0]
+            log_lazy('debug', lambda: 'New food: {}'.format(
+                self.__food_values(neighbor_food)
+            ), call_loc='SEARCH')
+            return (neighbor_food, True)
+
+        # Not marked for abandonment, search for a food source near
+        #   its current one
+        logger.log(
+            'debug',
+            'Bee searching neighboring food source',
+            call_loc='SEARCH'
+        )
+        return (self.__prescreen(self.__food[[idx]])[0], False)
+
+    def __settle(self, idx, food, obj_fn_val, replace):
+        '''
+        Applies an evaluated food source to the bee that proposed it
+
+        Args:
+            idx (int): index of the bee that proposed the food source
+            food (numpy.ndarray): proposed parameter values
+            obj_fn_val (int or float): objective function value of food
+            replace (bool): if True, the bee moves to food unconditionally
+
+        Returns:
+            bool: True if the bee moved to food
+        '''
+
+        fitness = calc_fitness_scores(obj_fn_val)
+        if not replace:
+
+            # New food not better, check if food source is exhausted
+            #   (if exhausted, it is abandoned in the next proposal)
+            if fitness <= self.__fitness[idx]:
+                logger.log(
+                    'debug',
+                    'Fitness did not improve',
+                    call_loc='SEARCH'
+                )
+                self.__stay_counts[idx] += 1
+                return False
+
+            log_lazy(
                 'debug',
-                'Bee searching neighboring food source',
+                lambda: 'Found better food: {} -> {}, {} -> {}'.format(
+                    self.__obj_fn_vals[idx],
+                    obj_fn_val,
+                    self.__food_values(self.__food[idx]),
+                    self.__food_values(food)
+                ),
                 call_loc='SEARCH'
             )
-            neighbor_food = bee.mutate()
 
-            if self.__num_processes > 1:
-                current_positions.append(bee)
-                new_position_results.append(new_calculations.apply_async(
-                    self._start_process,
-                    [neighbor_food, self.__obj_fn, self.__obj_fn_args]
-                ))
+        self.__food[idx] = food
+        self.__update_sums(idx, fitness, obj_fn_val)
+        self.__obj_fn_vals[idx] = obj_fn_val
+        self.__fitness[idx] = fitness
+        self.__stay_counts[idx] = 0
+        return True
 
-            else:
-                obj_fn_val = self.__obj_fn(
-                    neighbor_food,
-                    self.__obj_fn_args
+    def __evaluate(self, food, incumbents=None):
+        '''
+        Evaluates food sources with the objective function, concurrently if
+        num_processes > 1; cached and stored values are reused, and food
+        sources proposed more than once are evaluated once
+
+        Args:
+            food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+            incumbents (numpy.ndarray): if supplied with a pruner, objective
+                function values each food source has to beat (NaN if it
+                must not be pruned); pruned food sources get infinity
+
+        Returns:
+            numpy.ndarray: objective function values, ordered as food
+        '''
+
+        obj_fn_vals = self.__lookup(food)
+        missing = np.flatnonzero(np.isnan(obj_fn_vals))
+        if len(missing) > 0:
+            first, inverse = _unique_rows(food[missing])
+            unique = missing[first]
+            if len(unique) < len(missing):
+                self.__deduplicated += len(missing) - len(unique)
+                log_lazy('debug', lambda: '{} duplicate food sources '
+                         'evaluated once'.format(len(missing) - len(unique)),
+                         call_loc='EVAL')
+            unique_incumbents = None
+            if incumbents is not None:
+                # Shared evaluations are only pruned if every bee's
+                #   incumbent allows it
+                bounds = np.full(len(unique), -np.inf)
+                np.maximum.at(bounds, inverse, np.where(
+                    np.isnan(incumbents[missing]), np.inf,
+                    incumbents[missing]
+                ))
+                unique_incumbents = np.where(np.isinf(bounds), np.nan, bounds)
+            with self.__stats.time('evaluate'):
+                new_vals, seconds = self.__evaluate_uncached(
+                    food[unique], unique_incumbents
                 )
+            new_vals = self.__replace_nan(new_vals)
+            self.__stats.count('objective_seconds',
+                               float(np.nansum(seconds)))
+            obj_fn_vals[missing] = new_vals[inverse]
+            # Timed-out and pruned evaluations (NaN seconds) are not
+            #   remembered
+            done = ~np.isnan(seconds)
+            self.__remember(food[unique[done]], new_vals[done], seconds[done])
+        if self.__events is not None:
+            all_seconds = np.full(len(food), None)
+            if len(missing) > 0:
+                all_seconds[unique] = seconds
+            for values, obj_fn_val, secs in zip(food, obj_fn_vals,
+                                                all_seconds):
+                self.__record_event(values, obj_fn_val, secs)
+        return obj_fn_vals
+
+    def __evaluate_uncached(self, food, incumbents=None, fidelity=None):
+        '''
+        Evaluates food sources with the objective function, concurrently if
+        the colony has an evaluator (num_processes > 1)
+
+        Args:
+            food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+            incumbents (numpy.ndarray): objective function values each food
+                source has to beat, NaN if it must not be pruned
+            fidelity (any): with fidelities, fidelity to evaluate at (the
+                highest if None)
 
-                # If new food is better than current food
-                if bee.is_better_food(obj_fn_val):
-                    logger.log(
-                        'debug',
-                        'Found better food: {} -> {}, {} -> {}'.format(
-                            bee.obj_fn_val,
-                            obj_fn_val,
-                            [bee.param_dict.get(k).value for k in
-                             sorted(bee.param_dict.keys())
-                             if k in bee.param_dict],
-                            [neighbor_food.get(k).value for k in
-                             sorted(neighbor_food.keys()) if k in
-                             neighbor_food]
-                        ),
-                        call_loc='SEARCH'
+        Returns:
+            tuple: (numpy.ndarray: objective function values, numpy.ndarray:
+                seconds taken per evaluation, NaN if the evaluation timed
+                out or was pruned), ordered as food
+        '''
+
+        if self.__batch:
+            if self.__evaluator is not None:
+                evaluator = self.__get_evaluator()
+                chunks = np.array_split(
+                    food, min(self.__concurrency(), len(food))
+                )
+                results = [evaluator.submit(_evaluate_batch, chunk)
+                           for chunk in chunks]
+                for i, chunk in enumerate(chunks):
+                    results[i] = self.__get_result(
+                        results[i], _evaluate_batch, chunk
                     )
-                    if bee.is_employer:
-                        bee = Bee(
-                            neighbor_food,
-                            obj_fn_val,
-                            len(self.__params) * self.__num_employers,
-                            is_employer=True
+                    if results[i] is None:
+                        results[i] = (
+                            np.full(len(chunk), self.__timeout_penalty),
+                            np.nan
                         )
                     else:
-                        bee = Bee(
-                            neighbor_food,
-                            obj_fn_val,
-                            len(self.__params) * self.__num_employers
-                        )
+                        self.__stats.count('evaluations', len(chunk))
+                obj_fn_vals = np.concatenate([r[0] for r in results])
+                seconds = np.concatenate([
+                    np.full(len(chunk), r[1] / len(chunk))
+                    for chunk, r in zip(chunks, results)
+                ])
+            else:
+                obj_fn_vals, seconds = _timed(
+                    self.__obj_fn, food, self.param_names, self.__obj_fn_args
+                )
+                self.__stats.count('evaluations', len(food))
+                seconds = np.full(len(food), seconds / len(food))
+            obj_fn_vals = np.asarray(obj_fn_vals, dtype=float)
+            if obj_fn_vals.shape != (len(food),):
+                raise ValueError(
+                    'Batch objective function returned shape {}, expected {}'
+                    .format(obj_fn_vals.shape, (len(food),))
+                )
+            return (obj_fn_vals, seconds)
+
+        if incumbents is None:
+            incumbents = np.full(len(food), np.nan)
+        tasks = [self.__task(values, incumbent, fidelity)
+                 for values, incumbent in zip(food, incumbents)]
+        if self.__evaluator is not None:
+            evaluator = self.__get_evaluator()
+            results = [evaluator.submit(task, arg) for task, arg in tasks]
+
+            # Unpacked (and counted) as they arrive, in case the rest are
+            #   cancelled
+            results = [
+                self.__unpack(self.__get_result(result, task, arg) or
+                              (self.__timeout_penalty, np.nan))
+                for result, (task, arg) in zip(results, tasks)
+            ]
+        else:
+            state = self.__local_state()
+            results = []
+            for task, arg in tasks:
+                self.__remaining()
+                results.append(self.__unpack(task(arg, state)))
+        return (
+            np.array([r[0] for r in results], dtype=float),
+            np.array([r[1] for r in results], dtype=float)
+        )
 
-                # New food not better, check if food source is exhausted
-                #   (if exhausted, mark for abandonment)
-                else:
-                    logger.log(
-                        'debug',
-                        'Fitness did not improve',
-                        call_loc='SEARCH'
-                    )
-                    bee.check_abandonment()
+    def __get_result(self, result, task, arg):
+        '''
+        Waits for an evaluation submitted to the colony's evaluator,
+        retrying it up to max_retries times if it times out
 
-                next_generation.append(bee)
+        Args:
+            result (object): result returned by the evaluator's submit()
+            task (callable): task that was submitted
+            arg (any): argument the task was submitted with
+
+        Returns:
+            tuple or None: (objective function value(s), seconds taken), None
+                if every attempt timed out
+        '''
 
-        # If multiprocessing, finish processes, run comparisons, create
-        #   next generation
-        if self.__num_processes > 1:
+        attempts = 0
+        while True:
+            try:
+                return result.get(self.__remaining())
+            except EvaluationTimeout:
+                if not self.__count_timeout(attempts):
+                    return None
+                attempts += 1
+                result = self.__evaluator.submit(task, arg)
+            except TimeoutError:
+                # run()'s wall-clock budget was spent while waiting
+                self.__cancel()
+
+    def __count_timeout(self, attempts):
+        '''
+        Counts a timed-out evaluation
 
-            new_calculations.close()
-            new_calculations.join()
+        Args:
+            attempts (int): number of times the evaluation has been retried
 
-            for bee in new_employer_results:
-                bee = bee.get()
-                next_generation.append(Bee(
-                    bee[0],
-                    bee[1],
-                    len(self.__params) * self.__num_employers,
-                    is_employer=True
-                ))
+        Returns:
+            bool: True if the evaluation should be retried
+        '''
 
-            for bee in new_onlooker_results:
-                bee = bee.get()
-                next_generation.append(Bee(
-                    bee[0],
-                    bee[1],
-                    len(self.__params) * self.__num_employers
-                ))
+        self.__timeouts += 1
+        if attempts < self.__max_retries:
+            self.__retries += 1
+            return True
+        logger.log('warn', 'Evaluation timed out, assigning penalty {}'
+                   .format(self.__timeout_penalty), call_loc='EVAL')
+        return False
 
-            for idx, bee in enumerate(current_positions):
-                new_pos = new_position_results[idx].get()
-                if bee.is_better_food(new_pos[1]):
-                    logger.log(
-                        'debug',
-                        'Found better food: {} -> {}, {} -> {}'.format(
-                            bee.obj_fn_val,
-                            new_pos[1],
-                            [bee.param_dict.get(k).value for k in
-                             sorted(bee.param_dict.keys())
-                             if k in bee.param_dict],
-                            [new_pos[0].get(k).value for k
-                             in sorted(new_pos[0].keys()) if k in new_pos[0]]
-                        ),
-                        call_loc='SEARCH'
+    def __submit(self, idx, food, replace):
+        '''
+        Evaluates a food source, putting (idx, result, error) on the results
+        queue once the evaluation finishes; result is the evaluation task's
+        result (see __unpack), or (obj_fn_val, None) if the value was looked
+        up instead of evaluated (or shared with another bee evaluating the
+        same food source)
+
+        Args:
+            idx (int): index of the bee that proposed the food source
+            food (numpy.ndarray): parameter values
+            replace (bool): True if the bee moves to the food source
+                regardless of fitness (the evaluation is not pruned)
+        '''
+
+        results = self.__results
+        obj_fn_val = self.__lookup(food[None])[0]
+        if not np.isnan(obj_fn_val):
+            results.put((idx, (obj_fn_val, None), None))
+            return
+
+        # Food source already being evaluated for another bee: share its
+        #   result
+        shared = self.__sharing.get(food.tobytes())
+        if shared is not None and shared[0] != idx:
+            shared[1].append(idx)
+            self.__waiting += 1
+            self.__deduplicated += 1
+            return
+        self.__sharing.setdefault(food.tobytes(), (idx, []))
+        task, arg = self.__task(
+            food, np.nan if replace else self.__obj_fn_vals[idx]
+        )
+        if self.__evaluator is not None:
+            self.__get_evaluator().submit(
+                task,
+                arg,
+                callback=lambda res: results.put((idx, res, None)),
+                error_callback=lambda err: results.put((idx, None, err))
+            )
+        else:
+            results.put((idx, task(arg, self.__local_state()), None))
+
+    def __task(self, food, incumbent, fidelity=None):
+        '''
+        Chooses the evaluation task for a food source; with a pruner, every
+        evaluation gets a reporter (one that never prunes if the evaluation
+        must not be pruned), so its intermediate values are recorded
+
+        Args:
+            food (numpy.ndarray): parameter values
+            incumbent (float): objective function value the food source has
+                to beat, NaN if the evaluation must not be pruned
+            fidelity (any): with fidelities, fidelity to evaluate at (the
+                highest if None)
+
+        Returns:
+            tuple: (task, argument for task)
+        '''
+
+        if self.__fidelities is not None:
+            if fidelity is None:
+                fidelity = self.__fidelities[-1]
+            return (_evaluate_fidelity, (food.tolist(), fidelity))
+        if self.__pruner is None:
+            return (_evaluate, food.tolist())
+        if np.isnan(incumbent):
+            return (_evaluate_pruned, (food.tolist(), Reporter()))
+        return (
+            _evaluate_pruned,
+            (food.tolist(), self.__pruner.reporter(float(incumbent)))
+        )
+
+    def __replace_nan(self, obj_fn_vals):
+        '''
+        Gives NaN objective function values the timeout penalty, so they
+        rank as poor food sources (NaN marks bees without a result)
+
+        Args:
+            obj_fn_vals (iterable): objective function values
+
+        Returns:
+            numpy.ndarray: objective function values, NaNs replaced
+        '''
+
+        obj_fn_vals = np.asarray(obj_fn_vals, dtype=float)
+        nan = np.isnan(obj_fn_vals)
+        if nan.any():
+            log_lazy('debug', lambda: '{} NaN objective function values '
+                     'replaced with {}'.format(
+                         np.count_nonzero(nan), self.__timeout_penalty
+                     ), call_loc='EVAL')
+            obj_fn_vals = np.where(nan, self.__timeout_penalty, obj_fn_vals)
+        return obj_fn_vals
+
+    def __unpack(self, result):
+        '''
+        Converts an evaluation task's result to (obj_fn_val, seconds); the
+        values reported by pruned evaluation tasks are recorded by the
+        pruner. Every completed evaluation passes through here, so it is
+        counted here (looked up values and timeout penalties are not).
+
+        Args:
+            result (tuple): result of _evaluate, or of _evaluate_pruned
+
+        Returns:
+            tuple: (objective function value, seconds taken; NaN if the
+                evaluation was pruned)
+        '''
+
+        if len(result) == 2:
+            if result[1] is not None and not np.isnan(result[1]):
+                self.__stats.count('evaluations')
+            return result
+        self.__stats.count('evaluations')
+        obj_fn_val, seconds, values, pruned = result
+        self.__pruner.record(values)
+        if pruned:
+            self.__pruned += 1
+            log_lazy('debug', lambda: 'Pruned evaluation: {}'.format(
+                values[-1]
+            ), call_loc='PRUNE')
+            return (obj_fn_val, np.nan)
+        return (obj_fn_val, seconds)
+
+    def __local_state(self):
+        '''
+        Returns dict: objective function, its arguments and the colony's
+            parameters, for running evaluation tasks in this process
+        '''
+
+        return {
+            'obj_fn': self.__obj_fn,
+            'obj_fn_args': self.__obj_fn_args,
+            'params': self.__params
+        }
+
+    def __lookup(self, food):
+        '''
+        Looks up food sources in the evaluation cache and the values loaded
+        from the evaluation store
+
+        Args:
+            food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+
+        Returns:
+            numpy.ndarray: known objective function values, NaN if unknown
+        '''
+
+        obj_fn_vals = np.full(len(food), np.nan)
+        with self.__stats.time('lookup'):
+            if self.__cache is not None:
+                obj_fn_vals[:] = [
+                    self.__cache.get(key) for key in self.__cache_keys(food)
+                ]
+            if self.__stored_vals:
+                for idx in np.flatnonzero(np.isnan(obj_fn_vals)):
+                    obj_fn_val = self.__stored_vals.get(
+                        tuple(food[idx].tolist())
                     )
-                    if bee.is_employer:
-                        next_generation.append(Bee(
-                            new_pos[0],
-                            new_pos[1],
-                            len(self.__params) * self.__num_employers,
-                            is_employer=True
-                        ))
-                    else:
-                        next_generation.append(Bee(
-                            new_pos[0],
-                            new_pos[1],
-                            len(self.__params) * self.__num_employers
-                        ))
+                    if obj_fn_val is not None:
+                        obj_fn_vals[idx] = obj_fn_val
+                        self.__store_hits += 1
+        return obj_fn_vals
 
-                else:
-                    logger.log(
-                        'debug',
-                        'Fitness did not improve',
-                        call_loc='SEARCH'
+    def __remember(self, food, obj_fn_vals, seconds):
+        '''
+        Adds newly evaluated food sources to the evaluation cache, store and
+        surrogate
+
+        Args:
+            food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+            obj_fn_vals (iterable): objective function values
+            seconds (iterable): seconds taken per evaluation (None if
+                unknown)
+        '''
+
+        with self.__stats.time('remember'):
+            if self.__cache is not None:
+                for key, obj_fn_val in zip(self.__cache_keys(food),
+                                           obj_fn_vals):
+                    self.__cache.put(key, obj_fn_val)
+            if self.__store is not None:
+                if self.__owns_store and self.__store.closed:
+                    self.__store = EvaluationStore(self.__store.path)
+                for values, obj_fn_val, secs in zip(food, obj_fn_vals,
+                                                    seconds):
+                    self.__store.record(
+                        dict(self.__food_values(values)),
+                        float(obj_fn_val),
+                        None if secs is None else float(secs)
                     )
-                    bee.check_abandonment()
-                    next_generation.append(bee)
+            if self.__surrogate is not None:
+                self.__surrogate.update(self.__space.normalize(food),
+                                        obj_fn_vals)
 
-        # New bees = bees generated this iteration
-        self.__bees = next_generation
-        self.__determine_best_bee()
+    def __load_store(self):
+        '''
+        Loads stored evaluations of the colony's parameters (skipping food
+        sources outside the current bounds) for reuse
+
+        Returns:
+            numpy.ndarray: distinct stored food sources, best first
+        '''
+
+        names = self.param_names
+        self.__stored_vals = {}
+        for params, obj_fn_val, _ in self.__store.records():
+            if obj_fn_val is None or sorted(params) != sorted(names):
+                continue
+            values = tuple(float(params[name]) for name in names)
+            if values not in self.__stored_vals \
+                    and self.__space.contains(values)[0]:
+                self.__stored_vals[values] = obj_fn_val
+        logger.log('debug', 'Loaded {} stored evaluations'.format(
+            len(self.__stored_vals)
+        ), call_loc='STORE')
+        return np.array(
+            list(self.__stored_vals), dtype=float
+        ).reshape(-1, len(names))
+
+    def __auto_checkpoint(self):
+        '''
+        Saves a checkpoint in the background if one is due
+        '''
 
-    @staticmethod
-    def _start_process(param_dict, obj_fn, obj_fn_args):
+        if self.__checkpoint is None:
+            return
+        if (self.__checkpoint_every is not None and
+                self.__generation % self.__checkpoint_every == 0) or \
+            (self.__checkpoint_interval is not None and
+                perf_counter() - self.__last_checkpoint
+                >= self.__checkpoint_interval):
+            self.save_checkpoint(self.__checkpoint, background=True)
+
+    def __checkpoint_state(self):
+        '''
+        Takes a snapshot of the colony's state for save_checkpoint()
+
+        Returns:
+            tuple: (dict: names and NumPy arrays, dict: JSON-serializable
+                state)
         '''
-        Static method: starts a process to evalutate parameters
+
+        in_flight = sorted(self.__in_flight.items())
+        arrays = {
+            'food': self.__food.copy(),
+            'obj_fn_vals': self.__obj_fn_vals.copy(),
+            'fitness': self.__fitness.copy(),
+            'stay_counts': self.__stay_counts.copy(),
+            'is_employer': self.__is_employer.copy(),
+            'in_flight_idx': np.array([i for i, _ in in_flight], dtype=int),
+            'in_flight_food': np.array(
+                [p[0] for _, p in in_flight], dtype=float
+            ).reshape(-1, len(self.__params)),
+            'in_flight_replace': np.array(
+                [p[1] for _, p in in_flight], dtype=bool
+            )
+        }
+        meta = {
+            'params': [[p.name, p.min_val, p.max_val, p.restrict]
+                       for p in self.__params],
+            'num_employers': self.__num_employers,
+            'best_fitness': self.__best_fitness,
+            'best_params': self.__best_params,
+            'generation': self.__generation,
+            'next_bee': self.__next_bee,
+            'rng': self.__rng.bit_generator.state
+        }
+        return (arrays, meta)
+
+    def __cache_keys(self, food):
+        '''
+        Evaluation cache keys for food sources
 
         Args:
-            param_dict (dictionary): dictionary of Parameter objects
-            obj_fn (callable): objective function for evaluating Parameters
-            obj_fn_args (any): any additional arguments for obj_fn
+            food (numpy.ndarray): parameter values, one or more food sources
+
+        Returns:
+            list: one key per food source
+        '''
+
+        return self.__cache.keys(food, ~self.__space.is_int)
+
+    def __discard_in_flight(self):
+        '''
+        Forgets evaluations started by steady-state searches (results that
+        arrive later are put on a queue that is no longer read) and
+        candidates handed out by ask()
+        '''
+
+        self.__results = Queue()
+        self.__in_flight = {}
+        self.__attempts = {}
+        self.__sharing = {}
+        self.__waiting = 0
+        self.__asked = {}
+        self.__asked_sharing = {}
+        self.__next_bee = 0
+
+    def __begin_population(self):
+        '''
+        Starts a population for ask(): employers at the best stored food
+        sources (if warm starting) and random food sources, onlookers not
+        yet placed; bees without results have NaN objective
+        function values
+        '''
+
+        stored_food = np.empty((0, len(self.__params)))
+        if self.__store is not None and self.__warm_start:
+            stored_food = self.__load_store()[:self.__num_employers]
+            logger.log('info', 'Seeded {} employers from stored evaluations'
+                       .format(len(stored_food)), call_loc='INIT')
+        num_bees = self.__num_employers * 2
+        self.__food = np.full((num_bees, len(self.__params)), np.nan)
+        self.__food[:self.__num_employers] = np.concatenate((
+            stored_food,
+            self.__scout(self.__num_employers - len(stored_food))
+        ))
+        self.__obj_fn_vals = np.full(num_bees, np.nan)
+        self.__fitness = np.zeros(num_bees)
+        self.__sums = None
+        self.__stay_counts = np.zeros(num_bees, dtype=int)
+        self.__is_employer = np.arange(num_bees) < self.__num_employers
+        self.__generation = 0
+
+    def __discard_population(self):
+        '''
+        Empties the colony's population arrays; initialize() must be called
+        before searching again
+        '''
+
+        self.__food = np.empty((0, len(self.__params)))
+        self.__obj_fn_vals = np.empty(0)
+        self.__fitness = np.empty(0)
+        self.__sums = None
+        self.__stay_counts = np.empty(0, dtype=int)
+        self.__is_employer = np.empty(0, dtype=bool)
+        self.__generation = 0
+        self.__discard_in_flight()
+
+    def __default_evaluator(self):
+        '''
+        Returns Evaluator: evaluator for num_processes workers of the
+            colony's backend, or None if bees are evaluated one at a time in
+            this process
+        '''
+
+        if self.__timeout is not None:
+            return PoolEvaluator(self.__num_processes, self.__share_arrays,
+                                 self.__timeout)
+        if self.__num_processes < 2 or self.__backend == 'serial':
+            return None
+        if self.__backend == 'thread':
+            return ThreadEvaluator(self.__num_processes)
+        return PoolEvaluator(self.__num_processes, self.__share_arrays)
+
+    def __get_evaluator(self):
+        '''
+        Returns the colony's evaluator, starting it if it is not running;
+        the evaluator is reused for every evaluation until close() is called
 
         Returns:
-            tuple: (param_dict, value derived from objective function)
+            Evaluator: the colony's evaluator
         '''
 
-        obj_fn_val = obj_fn(param_dict, obj_fn_args)
-        return (param_dict, obj_fn_val)
+        if not self.__evaluator_started:
+            with self.__stats.time('evaluator_start'):
+                self.__evaluator.start(
+                    self.__obj_fn, self.__obj_fn_args, self.__params
+                )
+            self.__evaluator_started = True
+        return self.__evaluator
+
+    def __concurrency(self):
+        '''
+        Returns int: number of evaluations the colony runs concurrently
+        '''
+
+        if self.__evaluator is None:
+            return 1
+        return max(self.__evaluator.num_workers, 1)
+
+    def __record_event(self, food, obj_fn_val, seconds):
+        '''
+        Records an evaluation event for iter_search()
+
+        Args:
+            food (numpy.ndarray): parameter values
+            obj_fn_val (float): objective function value
+            seconds (float): seconds taken, None if the value was looked up
+        '''
+
+        self.__events.append({
+            'event': 'evaluation',
+            'parameters': dict(self.__food_values(food)),
+            'obj_fn_val': float(obj_fn_val),
+            'seconds': None if seconds is None else float(seconds)
+        })
+
+    def __population_sums(self):
+        '''
+        Returns tuple: (sum of the bees' fitness scores, sum of their
+            objective function values), kept up to date by __update_sums
+        '''
+
+        if self.__sums is None:
+            self.__sums = (float(self.__fitness.sum()),
+                           float(self.__obj_fn_vals.sum()), 0)
+        return self.__sums[:2]
+
+    def __update_sums(self, idx, fitness, obj_fn_vals):
+        '''
+        Updates the population sums for bees about to move to new food
+        sources (call before the bees' arrays are updated); the sums are
+        recomputed once about as many bees moved as the colony has, which
+        bounds rounding error, or if they are no longer finite
+
+        Args:
+            idx (int or numpy.ndarray): index, indices or mask of the bees
+            fitness (float or numpy.ndarray): new fitness scores
+            obj_fn_vals (float or numpy.ndarray): new objective function
+                values
+        '''
+
+        if self.__sums is None:
+            return
+        fitness_sum, obj_fn_val_sum, updates = self.__sums
+        fitness_sum += float(np.sum(fitness) - np.sum(self.__fitness[idx]))
+        obj_fn_val_sum += float(
+            np.sum(obj_fn_vals) - np.sum(self.__obj_fn_vals[idx])
+        )
+        updates += np.size(fitness)
+        if updates >= len(self.__fitness) or not (
+            np.isfinite(fitness_sum) and np.isfinite(obj_fn_val_sum)
+        ):
+            self.__sums = None
+        else:
+            self.__sums = (fitness_sum, obj_fn_val_sum, updates)
 
     def __determine_best_bee(self):
         '''
@@ -477,58 +2011,201 @@ class Colony:
         than the best bee so far; updates object properties
         '''
 
-        for bee in self.__bees:
-            if bee.fitness_score > self.__best_fitness:
-                logger.log(
-                    'info',
-                    'New best performer: {}, {}'.format(
-                        bee.obj_fn_val,
-                        [(k, bee.param_dict.get(k).value) for k in
-                         sorted(bee.param_dict.keys()) if k in bee.param_dict]
-                    ),
-                    call_loc='UPDATE'
-                )
-                self.__best_fitness = bee.fitness_score
-                params = {}
-                for param in bee.param_dict:
-                    params[param] = bee.param_dict[param].value
-                self.__best_params = params
+        self.__update_best(int(np.argmax(self.__fitness)))
 
-    def __calc_bee_probs(self):
+    def __update_best(self, idx):
         '''
-        Determines probabilities that bees will be followed by onlookers
+        Updates the best fitness and parameters if a bee has performed better
+        than the best bee so far
 
-        Returns:
-            list: list of probabilities (float), sum = 1
+        Args:
+            idx (int): index of the bee to compare against the best bee
         '''
 
-        bee_probabilities = []
-        for bee in self.__bees:
-            bee_probabilities.append(
-                bee.fitness_score / sum(b.fitness_score for b in self.__bees)
+        if self.__fitness[idx] > self.__best_fitness:
+            log_lazy(
+                'info',
+                lambda: 'New best performer: {}, {}'.format(
+                    self.__obj_fn_vals[idx],
+                    self.__food_values(self.__food[idx])
+                ),
+                call_loc='UPDATE'
             )
+            self.__best_fitness = float(self.__fitness[idx])
+            self.__best_params = dict(self.__food_values(self.__food[idx]))
+
+    def __prepare_selection(self, fitness):
+        '''
+        Prepares the colony's selection scheme for choosing bees that
+        onlookers follow (done once per generation)
+
+        Args:
+            fitness (numpy.ndarray): fitness scores of the bees
+        '''
+
+        self.__selection.prepare(fitness)
         logger.log(
             'debug',
             'Onlooker choice probabilities generated',
             call_loc='CALC'
         )
-        return bee_probabilities
 
-    def __create_param_dict(self):
+    def __stay_limit(self):
+        '''
+        Returns int: how many neighboring food sources a bee searches before
+            its current one is abandoned
+        '''
+
+        return len(self.__params) * self.__num_employers
+
+    def __food_values(self, food):
+        '''
+        Pairs parameter values with their names, sorted by name
+
+        Args:
+            food (numpy.ndarray): parameter values
+
+        Returns:
+            list: list of (name, value) tuples
+        '''
+
+        return sorted(
+            (p.name, p.dtype(value)) for p, value in zip(self.__params, food)
+        )
+
+    def __scout(self, num_food):
+        '''
+        Generates random food sources, random assignments for each Colony
+        parameter
+
+        Args:
+            num_food (int): number of food sources to generate
+
+        Returns:
+            numpy.ndarray: parameter values, shape (num_food, n_params)
+        '''
+
+        food = self.__space.random_food(num_food, self.__rng)
+        if log_enabled('debug'):
+            for values in food:
+                logger.log('debug', 'Generated random parameters: {}'.format(
+                    self.__food_values(values)
+                ), call_loc='CREATE')
+        return food
+
+    def __follow(self, num_food):
+        '''
+        Generates food sources near bees chosen by the colony's selection
+        (which must be prepared), for abandoning onlookers
+
+        Args:
+            num_food (int): number of food sources to generate
+
+        Returns:
+            numpy.ndarray: parameter values, shape (num_food, n_params)
+        '''
+
+        chosen = self.__selection.select(num_food, self.__rng)
+        return self.__neighbor(self.__food[chosen])
+
+    def __screen(self, propose, num_food):
         '''
-        Generates a new parameter dictionary, random assignments for each
-        Colony parameter
+        Chooses food sources by successive halving: proposes
+        reduction_factor ** (len(fidelities) - 1) candidates per food
+        source, evaluates them at the lowest fidelity, promotes the best
+        1/reduction_factor to the next fidelity, and so on; the survivors
+        are left for full evaluation. Without fidelities, proposes num_food
+        food sources.
+
+        Args:
+            propose (callable): generates n candidates, called as
+                propose(n) (e.g. __scout)
+            num_food (int): number of food sources to choose
 
         Returns:
-            dictionary: dictionary of parameter names and Parameter objects
-        '''
-
-        param_dict = {}
-        for param in self.__params:
-            param_dict[param.name] = deepcopy(param)
-            param_dict[param.name].generate_rand_val()
-        logger.log('debug', 'Generated random parameters: {}'.format(
-            [param_dict.get(k).value for k in
-             sorted(param_dict.keys()) if k in param_dict]
-        ), call_loc='CREATE')
-        return param_dict
+            numpy.ndarray: parameter values, shape (num_food, n_params)
+        '''
+
+        if self.__fidelities is None or num_food == 0:
+            return propose(num_food)
+
+        rungs = self.__fidelities[:-1]
+        factor = self.__reduction_factor
+        food = propose(num_food * factor ** len(rungs))
+        for rung, fidelity in enumerate(rungs):
+            obj_fn_vals, seconds = self.__evaluate_uncached(
+                food, fidelity=fidelity
+            )
+            self.__stats.count('objective_seconds', float(np.nansum(seconds)))
+            self.__screened += len(food)
+            keep = num_food * factor ** (len(rungs) - rung - 1)
+            food = food[np.argsort(obj_fn_vals, kind='stable')[:keep]]
+            log_lazy('debug', lambda: 'Promoted {} of {} candidates from '
+                     'fidelity {}'.format(keep, len(obj_fn_vals), fidelity),
+                     call_loc='SCREEN')
+        return food
+
+    def __prescreen(self, food):
+        '''
+        Generates a neighboring food source for each food source; with a
+        surrogate (once it is ready), surrogate_candidates neighbors are
+        generated per food source and the one with the best predicted
+        objective function value is kept
+
+        Args:
+            food (numpy.ndarray): current parameter values, shape
+                (num_food, n_params)
+
+        Returns:
+            numpy.ndarray: new parameter values, one row per food source
+        '''
+
+        if self.__surrogate is None or not self.__surrogate.ready \
+                or len(food) == 0:
+            return self.__neighbor(food)
+
+        num = self.__surrogate_candidates
+        candidates = self.__neighbor(np.repeat(food, num, axis=0))
+        predicted = self.__surrogate.predict(
+            self.__space.normalize(candidates)
+        ).reshape(len(food), num)
+        best = np.argmin(np.where(np.isnan(predicted), np.inf, predicted),
+                         axis=1)
+        return candidates[np.arange(len(food)) * num + best]
+
+    def __neighbor(self, food):
+        '''
+        Generates neighboring food sources by mutating one random parameter
+        of each food source
+
+        Args:
+            food (numpy.ndarray): current parameter values, shape
+                (num_food, n_params)
+
+        Returns:
+            numpy.ndarray: new parameter values, one mutated parameter per row
+        '''
+
+        return self.__space.neighbor_food(food, self.__rng)
+
+
+def _unique_rows(food):
+    '''
+    Finds the distinct rows of an array, in order of first appearance
+
+    Args:
+        food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+
+    Returns:
+        tuple: (numpy.ndarray: index of the first appearance of each
+            distinct row, numpy.ndarray: index into the first array for
+            each row of food)
+    '''
+
+    _, first, inverse = np.unique(
+        food, axis=0, return_index=True, return_inverse=True
+    )
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return (first[order], rank[inverse.reshape(-1)])
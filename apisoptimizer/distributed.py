@@ -0,0 +1,350 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# distributed.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+# Evaluator whose workers connect over TCP; start workers on any machine
+#   that can import the objective function with:
+#
+#   python -m apisoptimizer.distributed HOST:PORT --authkey KEY --workers N
+#
+# Messages are pickled (multiprocessing.connection), and connections are
+#   authenticated with authkey: only use on trusted networks.
+#
+
+# Stdlib imports
+from argparse import ArgumentParser
+from multiprocessing import Process
+from multiprocessing.connection import Client, Listener
+from os import getpid
+from pickle import PicklingError
+from queue import Queue, Empty
+from socket import gethostname
+from threading import Condition, Lock, Thread
+from time import perf_counter
+
+# ApisOptimizer imports
+from apisoptimizer.evaluators import EvaluationCancelled, EvaluationResult, \
+    EvaluationTimeout, Evaluator, _init_worker
+from apisoptimizer.logging import logger
+
+
+class TCPEvaluator(Evaluator):
+
+    def __init__(self, authkey, address=('', 0), poll_interval=0.1,
+                 timeout=None):
+        '''
+        TCPEvaluator object: coordinator that evaluates tasks on worker
+        processes connecting over TCP (see run_worker()); workers may join
+        and leave at any time, and the task a worker was running when its
+        connection was lost is queued again
+
+        Args:
+            authkey (bytes): key workers must present to connect
+            address (tuple): (host, port) to listen on; port 0 picks a free
+                port (see address)
+            poll_interval (float): seconds between checks for shutdown by
+                idle worker connections
+            timeout (float): if supplied, seconds an evaluation may take;
+                slower evaluations fail with EvaluationTimeout and their
+                worker is disconnected
+        '''
+
+        super().__init__()
+        self.__listener = Listener(address, authkey=authkey)
+        self.__poll_interval = poll_interval
+        self.__timeout = timeout
+        self.__tasks = Queue()
+        self.__lock = Lock()
+        self.__workers_changed = Condition(self.__lock)
+        self.__pending = {}
+        self.__next_task = 0
+        self.__objective = None
+        self.__version = 0
+        self.__workers = []
+        self.__closed = False
+        self.__acceptor = Thread(target=self.__accept, daemon=True)
+        self.__acceptor.start()
+        logger.log('info', 'Listening for workers on {}'.format(
+            self.address
+        ), call_loc='TCP')
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.shutdown()
+
+    @property
+    def address(self):
+        '''
+        (host, port) the coordinator listens on
+        '''
+
+        return self.__listener.address
+
+    @property
+    def num_workers(self):
+
+        with self.__lock:
+            return sum(1 for w in self.__workers if w['connected'])
+
+    @property
+    def workers(self):
+        '''
+        Statistics of every worker that has connected: list of dictionaries
+        with keys 'host', 'pid', 'connected', 'completed' (tasks),
+        'busy_seconds' and 'throughput' (tasks per second connected)
+        '''
+
+        now = perf_counter()
+        with self.__lock:
+            workers = [dict(w) for w in self.__workers]
+        for worker in workers:
+            elapsed = (worker.pop('left') or now) - worker.pop('joined')
+            worker['throughput'] = worker['completed'] / elapsed \
+                if elapsed > 0 else 0.0
+        return workers
+
+    def wait_for_workers(self, num, timeout=None):
+        '''
+        Blocks until at least num workers are connected
+
+        Args:
+            num (int): number of workers
+            timeout (float): seconds to wait, forever if None
+
+        Returns:
+            bool: True if num workers are connected
+        '''
+
+        with self.__lock:
+            return self.__workers_changed.wait_for(
+                lambda: sum(1 for w in self.__workers if w['connected'])
+                >= num,
+                timeout
+            )
+
+    def start(self, obj_fn, obj_fn_args, params):
+
+        with self.__lock:
+            self.__objective = (obj_fn, obj_fn_args, params)
+            self.__version += 1
+
+    def submit(self, task, arg, callback=None, error_callback=None):
+
+        result = EvaluationResult(callback, error_callback)
+        with self.__lock:
+            if self.__objective is None:
+                raise Exception('Evaluator has not been started')
+            task_id = self.__next_task
+            self.__next_task += 1
+            self.__pending[task_id] = result
+        self.__tasks.put((task_id, task, arg))
+        return result
+
+    def stop(self):
+
+        with self.__lock:
+            self.__objective = None
+        self.__discard(Exception('Evaluator stopped'))
+
+    def cancel(self):
+
+        # Workers running cancelled tasks finish them; their replies are
+        #   ignored
+        self.__discard(EvaluationCancelled('Evaluation cancelled'))
+
+    def shutdown(self):
+        '''
+        Stops the evaluator, disconnects every worker (idle workers exit)
+        and stops listening
+        '''
+
+        self.stop()
+        self.__closed = True
+        self.__listener.close()
+        logger.log('info', 'Coordinator shut down', call_loc='TCP')
+
+    def __discard(self, error):
+        '''
+        Discards queued and running tasks, failing their results
+
+        Args:
+            error (Exception): error set on the discarded results
+        '''
+
+        with self.__lock:
+            pending, self.__pending = self.__pending, {}
+        while True:
+            try:
+                self.__tasks.get_nowait()
+            except Empty:
+                break
+        for result in pending.values():
+            result.set_error(error)
+
+    def __accept(self):
+        '''
+        Background thread: accepts worker connections, serving each on its
+        own thread
+        '''
+
+        while not self.__closed:
+            try:
+                conn = self.__listener.accept()
+            except Exception:
+                # Listener closed, or a client failed authentication
+                continue
+            Thread(target=self.__serve, args=(conn,), daemon=True).start()
+
+    def __serve(self, conn):
+        '''
+        Background thread: sends queued tasks to one worker, one at a time,
+        until the coordinator shuts down or the connection is lost
+
+        Args:
+            conn (multiprocessing.connection.Connection): worker connection
+        '''
+
+        task = None
+        try:
+            _, host, pid = conn.recv()
+            worker = {'host': host, 'pid': pid, 'connected': True,
+                      'completed': 0, 'busy_seconds': 0.0,
+                      'joined': perf_counter(), 'left': None}
+            with self.__lock:
+                self.__workers.append(worker)
+                self.__workers_changed.notify_all()
+            logger.log('info', 'Worker joined: {}:{}'.format(host, pid),
+                       call_loc='TCP')
+        except Exception:
+            conn.close()
+            return
+
+        version = None
+        try:
+            while not self.__closed:
+                try:
+                    task = self.__tasks.get(timeout=self.__poll_interval)
+                except Empty:
+                    continue
+                with self.__lock:
+                    result = self.__pending.get(task[0])
+                    objective, current = self.__objective, self.__version
+                if result is None:
+                    # Discarded by stop()
+                    task = None
+                    continue
+                if version != current:
+                    conn.send(('init', objective))
+                    version = current
+                start = perf_counter()
+                conn.send(('task', task[1], task[2]))
+                if not conn.poll(self.__timeout):
+                    with self.__lock:
+                        self.__pending.pop(task[0], None)
+                    task = None
+                    logger.log('warn', 'Worker {}:{} exceeded {} seconds, '
+                               'disconnecting it'.format(
+                                   host, pid, self.__timeout
+                               ), call_loc='TCP')
+                    result.set_error(EvaluationTimeout(
+                        'Evaluation exceeded {} seconds'.format(self.__timeout)
+                    ))
+                    break
+                kind, value = conn.recv()
+                with self.__lock:
+                    worker['completed'] += 1
+                    worker['busy_seconds'] += perf_counter() - start
+                    self.__pending.pop(task[0], None)
+                task = None
+                if kind == 'result':
+                    result.set_result(value)
+                else:
+                    result.set_error(value)
+            conn.send(('stop', None))
+        except (EOFError, OSError):
+            if task is not None:
+                logger.log('warn', 'Lost worker {}:{}, queueing its task '
+                           'again'.format(host, pid), call_loc='TCP')
+                self.__tasks.put(task)
+        finally:
+            conn.close()
+            with self.__lock:
+                worker['connected'] = False
+                worker['left'] = perf_counter()
+                self.__workers_changed.notify_all()
+            logger.log('info', 'Worker left: {}:{}'.format(host, pid),
+                       call_loc='TCP')
+
+
+def run_worker(address, authkey):
+    '''
+    Connects to a TCPEvaluator and evaluates its tasks until the coordinator
+    shuts down or the connection is lost
+
+    Args:
+        address (tuple): (host, port) of the coordinator
+        authkey (bytes): key the coordinator was created with
+    '''
+
+    conn = Client(address, authkey=authkey)
+    conn.send(('hello', gethostname(), getpid()))
+    while True:
+        try:
+            kind, *message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if kind == 'stop':
+            break
+        if kind == 'init':
+            _init_worker(*message[0])
+            continue
+        task, arg = message
+        try:
+            reply = ('result', task(arg))
+        except Exception as error:
+            reply = ('error', error)
+        try:
+            conn.send(reply)
+        except (PicklingError, AttributeError, TypeError):
+            conn.send(('error', Exception(repr(reply[1]))))
+    conn.close()
+
+
+def _parse_address(address):
+    '''
+    Parses a HOST:PORT string
+
+    Args:
+        address (str): HOST:PORT
+
+    Returns:
+        tuple: (host, port)
+    '''
+
+    host, port = address.rsplit(':', 1)
+    return (host, int(port))
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser()
+    parser.add_argument('address', help='coordinator address, HOST:PORT')
+    parser.add_argument('--authkey', required=True)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of worker processes to start')
+    args = parser.parse_args()
+
+    worker_args = (_parse_address(args.address), args.authkey.encode())
+    workers = [Process(target=run_worker, args=worker_args)
+               for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
@@ -0,0 +1,644 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# evaluators.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from multiprocessing import Pipe, Process
+from queue import Queue, Empty
+from threading import Event, Lock, Thread, current_thread
+from pickle import PicklingError
+from time import perf_counter
+
+# ApisOptimizer imports
+from apisoptimizer.logging import logger
+from apisoptimizer.pruning import EvaluationPruned
+from apisoptimizer.shared import share_arrays, attach_arrays,\
+    release_segments
+
+BACKENDS = ('process', 'thread', 'serial')
+
+# Objective function, its arguments and the colony's parameters, installed
+#   once in each worker process by _init_worker
+_worker_state = {}
+
+
+def _init_worker(obj_fn, obj_fn_args, params):
+    '''
+    Worker initializer: stores the objective function, its arguments and the
+    colony's parameters so that they are not sent with every task
+
+    Args:
+        obj_fn (callable): objective function for evaluating Parameters
+        obj_fn_args (any): any additional arguments for obj_fn
+        params (list): list of the colony's Parameter objects
+    '''
+
+    _worker_state['obj_fn'] = obj_fn
+    _worker_state['segments'] = []
+    _worker_state['obj_fn_args'] = attach_arrays(
+        obj_fn_args, _worker_state['segments']
+    )
+    _worker_state['params'] = params
+
+
+def _evaluate(values, state=_worker_state):
+    '''
+    Evaluates parameter values in a worker
+
+    Args:
+        values (list): parameter values, ordered as the colony's parameters
+        state (dict): objective function, its arguments and the colony's
+            parameters; defaults to those installed by _init_worker
+
+    Returns:
+        tuple: (value derived from objective function, seconds taken)
+    '''
+
+    return _timed(
+        state['obj_fn'],
+        _make_param_dict(state['params'], values),
+        state['obj_fn_args']
+    )
+
+
+def _evaluate_pruned(values_reporter, state=_worker_state):
+    '''
+    Evaluates parameter values in a worker with an objective function that
+    reports intermediate values, called as obj_fn(params, args, reporter)
+
+    Args:
+        values_reporter (tuple): (list: parameter values, ordered as the
+            colony's parameters; apisoptimizer.pruning.Reporter)
+        state (dict): objective function, its arguments and the colony's
+            parameters; defaults to those installed by _init_worker
+
+    Returns:
+        tuple: (value derived from objective function (infinity if pruned),
+            seconds taken, list of reported (step, value) tuples, bool: True
+            if the evaluation was pruned)
+    '''
+
+    values, reporter = values_reporter
+    start = perf_counter()
+    try:
+        obj_fn_val = state['obj_fn'](
+            _make_param_dict(state['params'], values),
+            state['obj_fn_args'],
+            reporter
+        )
+        pruned = False
+    except EvaluationPruned:
+        obj_fn_val = float('inf')
+        pruned = True
+    return (obj_fn_val, perf_counter() - start, reporter.values, pruned)
+
+
+def _evaluate_fidelity(values_fidelity, state=_worker_state):
+    '''
+    Evaluates parameter values in a worker with a multi-fidelity objective
+    function, called as obj_fn(params, args, fidelity)
+
+    Args:
+        values_fidelity (tuple): (list: parameter values, ordered as the
+            colony's parameters; fidelity (e.g. number of epochs) to
+            evaluate at)
+        state (dict): objective function, its arguments and the colony's
+            parameters; defaults to those installed by _init_worker
+
+    Returns:
+        tuple: (value derived from objective function, seconds taken)
+    '''
+
+    values, fidelity = values_fidelity
+    return _timed(
+        state['obj_fn'],
+        _make_param_dict(state['params'], values),
+        state['obj_fn_args'],
+        fidelity
+    )
+
+
+def _evaluate_batch(food, state=_worker_state):
+    '''
+    Evaluates a block of food sources with a batch objective function in a
+    worker
+
+    Args:
+        food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+        state (dict): objective function, its arguments and the colony's
+            parameters; defaults to those installed by _init_worker
+
+    Returns:
+        tuple: (values derived from objective function, seconds taken)
+    '''
+
+    return _timed(
+        state['obj_fn'],
+        food,
+        [p.name for p in state['params']],
+        state['obj_fn_args']
+    )
+
+
+def _run_worker_process(conn, obj_fn, obj_fn_args, params):
+    '''
+    Worker process target: installs the objective function, then runs the
+    (task, arg) pairs received through conn until it receives None
+
+    Args:
+        conn (multiprocessing.connection.Connection): pipe to the evaluator
+        obj_fn (callable): objective function for evaluating Parameters
+        obj_fn_args (any): any additional arguments for obj_fn
+        params (list): list of the colony's Parameter objects
+    '''
+
+    _init_worker(obj_fn, obj_fn_args, params)
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        task, arg = message
+        try:
+            reply = (task(arg), None)
+        except Exception as error:
+            reply = (None, error)
+        try:
+            conn.send(reply)
+        except (PicklingError, AttributeError, TypeError):
+            conn.send((None, Exception(repr(reply[1]))))
+    conn.close()
+
+
+def _timed(obj_fn, *args):
+    '''
+    Calls an objective function, measuring its wall-clock time
+
+    Args:
+        obj_fn (callable): objective function
+        *args: arguments for obj_fn
+
+    Returns:
+        tuple: (value returned by obj_fn, seconds taken)
+    '''
+
+    start = perf_counter()
+    obj_fn_val = obj_fn(*args)
+    return (obj_fn_val, perf_counter() - start)
+
+
+def _make_param_dict(params, values):
+    '''
+    Builds the dictionary of Parameter objects passed to objective functions
+
+    Args:
+        params (list): list of the colony's Parameter objects
+        values (iterable): parameter values, ordered as params
+
+    Returns:
+        dictionary: dictionary of parameter names and Parameter objects
+    '''
+
+    param_dict = {}
+    for param, value in zip(params, values):
+        param_dict[param.name] = copy(param)
+        param_dict[param.name].value = param.dtype(value)
+    return param_dict
+
+
+class EvaluationTimeout(TimeoutError):
+    '''
+    Raised for an evaluation that exceeded its evaluator's timeout
+    '''
+
+    pass
+
+
+class EvaluationCancelled(Exception):
+    '''
+    Raised for an evaluation discarded by its evaluator's cancel()
+    '''
+
+    pass
+
+
+class EvaluationResult:
+
+    def __init__(self, callback=None, error_callback=None):
+        '''
+        EvaluationResult object: result of a task submitted to an Evaluator,
+        set once by the evaluator (same interface as
+        multiprocessing.pool.AsyncResult)
+
+        Args:
+            callback (callable): called with the result when it is set
+            error_callback (callable): called with the exception if the task
+                raised one
+        '''
+
+        self.__callback = callback
+        self.__error_callback = error_callback
+        self.__ready = Event()
+        self.__lock = Lock()
+        self.__value = None
+        self.__error = None
+
+    def ready(self):
+        '''
+        Returns bool: True if the result has been set
+        '''
+
+        return self.__ready.is_set()
+
+    def get(self, timeout=None):
+        '''
+        Waits for the result
+
+        Args:
+            timeout (float): seconds to wait, forever if None
+
+        Returns:
+            any: value returned by the task; the task's exception is raised
+                if it raised one
+        '''
+
+        if not self.__ready.wait(timeout):
+            raise TimeoutError('Evaluation not finished after {} seconds'
+                               .format(timeout))
+        if self.__error is not None:
+            raise self.__error
+        return self.__value
+
+    def set_result(self, value):
+        '''
+        Sets the task's return value; ignored if the result is already set
+
+        Args:
+            value (any): value returned by the task
+        '''
+
+        if self.__set(value, None) and self.__callback is not None:
+            self.__callback(value)
+
+    def set_error(self, error):
+        '''
+        Sets the task's exception; ignored if the result is already set
+
+        Args:
+            error (Exception): exception raised by the task
+        '''
+
+        if self.__set(None, error) and self.__error_callback is not None:
+            self.__error_callback(error)
+
+    def __set(self, value, error):
+        '''
+        Sets the result once
+
+        Returns:
+            bool: True if the result was set by this call
+        '''
+
+        with self.__lock:
+            if self.__ready.is_set():
+                return False
+            self.__value = value
+            self.__error = error
+            self.__ready.set()
+            return True
+
+
+class Evaluator:
+
+    def __init__(self):
+        '''
+        Evaluator object: runs evaluation tasks for a Colony. start() installs
+        the objective function in the evaluator's workers, submit() runs a
+        task (_evaluate or _evaluate_batch) asynchronously, and stop()
+        releases the workers; an evaluator can be started again after
+        stop(), e.g. once the colony's parameters change
+        '''
+
+        pass
+
+    @property
+    def num_workers(self):
+        '''
+        Returns int: number of tasks the evaluator runs concurrently
+        '''
+
+        raise NotImplementedError
+
+    def start(self, obj_fn, obj_fn_args, params):
+        '''
+        Installs the objective function in the evaluator's workers
+
+        Args:
+            obj_fn (callable): objective function
+            obj_fn_args (any): any additional arguments for obj_fn
+            params (list): list of the colony's Parameter objects
+        '''
+
+        raise NotImplementedError
+
+    def submit(self, task, arg, callback=None, error_callback=None):
+        '''
+        Runs task(arg) in a worker
+
+        Args:
+            task (callable): _evaluate or _evaluate_batch
+            arg (any): argument for task
+            callback (callable): called with the result when it is ready
+            error_callback (callable): called with the exception if the task
+                raises one
+
+        Returns:
+            object: result with a get() method, e.g. EvaluationResult
+        '''
+
+        raise NotImplementedError
+
+    def stop(self):
+        '''
+        Releases the evaluator's workers
+        '''
+
+        raise NotImplementedError
+
+    def cancel(self):
+        '''
+        Discards every submitted evaluation that has not finished: their
+        results fail with EvaluationCancelled and, where the evaluator can,
+        the workers running them are freed; the evaluator stays started.
+        The base evaluator only lets evaluations finish unobserved.
+        '''
+
+        pass
+
+
+class PoolEvaluator(Evaluator):
+
+    def __init__(self, num_processes, share_arrays=False, timeout=None):
+        '''
+        PoolEvaluator object: evaluates with a pool of worker processes,
+        reused for every evaluation until stop() is called; each worker is
+        fed by its own dispatcher thread, so a worker that exceeds the
+        timeout (or dies) is killed and replaced without stopping the others
+
+        Args:
+            num_processes (int): number of worker processes
+            share_arrays (bool): if True, NumPy arrays in obj_fn_args (found
+                in dictionaries, lists and tuples) are placed in shared
+                memory and passed to worker processes as read-only views
+            timeout (float): if supplied, seconds an evaluation may take;
+                slower evaluations fail with EvaluationTimeout
+        '''
+
+        super().__init__()
+        self.__num_processes = num_processes
+        self.__share_arrays = share_arrays
+        self.__timeout = timeout
+        self.__shared_segments = []
+        self.__initargs = None
+        self.__tasks = None
+        self.__dispatchers = []
+        self.__lock = Lock()
+        self.__running = {}
+
+    @property
+    def num_workers(self):
+
+        return self.__num_processes
+
+    def start(self, obj_fn, obj_fn_args, params):
+
+        logger.log('debug', 'Starting worker pool with {} processes'.format(
+            self.__num_processes
+        ), call_loc='POOL')
+        if self.__share_arrays:
+            obj_fn_args = share_arrays(obj_fn_args, self.__shared_segments)
+            logger.log('debug', 'Placed {} arrays in shared memory'.format(
+                len(self.__shared_segments)
+            ), call_loc='POOL')
+        self.__initargs = (obj_fn, obj_fn_args, params)
+        self.__tasks = Queue()
+        self.__dispatchers = [
+            Thread(target=self.__dispatch, args=(self.__start_worker(),),
+                   daemon=True)
+            for _ in range(self.__num_processes)
+        ]
+        for dispatcher in self.__dispatchers:
+            dispatcher.start()
+
+    def submit(self, task, arg, callback=None, error_callback=None):
+
+        result = EvaluationResult(callback, error_callback)
+        self.__tasks.put((task, arg, result))
+        return result
+
+    def stop(self):
+
+        if self.__dispatchers:
+            logger.log('debug', 'Closing worker pool', call_loc='POOL')
+            # Tasks not yet started are discarded
+            while True:
+                try:
+                    self.__tasks.get_nowait()[2].set_error(
+                        Exception('Evaluator stopped')
+                    )
+                except Empty:
+                    break
+            for _ in self.__dispatchers:
+                self.__tasks.put(None)
+            for dispatcher in self.__dispatchers:
+                dispatcher.join()
+            self.__dispatchers = []
+        release_segments(self.__shared_segments, unlink=True)
+
+    def cancel(self):
+
+        if not self.__dispatchers:
+            return
+        cancelled = EvaluationCancelled('Evaluation cancelled')
+        while True:
+            try:
+                self.__tasks.get_nowait()[2].set_error(cancelled)
+            except Empty:
+                break
+        # Workers running cancelled evaluations are killed; their
+        #   dispatchers replace them
+        with self.__lock:
+            for process, result in self.__running.values():
+                result.set_error(cancelled)
+                process.kill()
+
+    def __start_worker(self):
+        '''
+        Starts a worker process
+
+        Returns:
+            tuple: (multiprocessing.Process, multiprocessing.connection.
+                Connection: pipe to the worker)
+        '''
+
+        conn, worker_conn = Pipe()
+        process = Process(
+            target=_run_worker_process,
+            args=(worker_conn, *self.__initargs),
+            daemon=True
+        )
+        process.start()
+        worker_conn.close()
+        return (process, conn)
+
+    def __dispatch(self, worker):
+        '''
+        Dispatcher thread: sends queued tasks to one worker process, one at
+        a time, replacing the worker if it times out or dies
+
+        Args:
+            worker (tuple): (process, pipe) returned by __start_worker
+        '''
+
+        process, conn = worker
+        me = current_thread()
+        while True:
+            item = self.__tasks.get()
+            if item is None:
+                break
+            task, arg, result = item
+            with self.__lock:
+                self.__running[me] = (process, result)
+            failure = None
+            try:
+                conn.send((task, arg))
+                if not conn.poll(self.__timeout):
+                    raise EvaluationTimeout(
+                        'Evaluation exceeded {} seconds'.format(self.__timeout)
+                    )
+                value, error = conn.recv()
+                with self.__lock:
+                    del self.__running[me]
+                    # Killed by cancel() after finishing its evaluation
+                    killed = result.ready()
+            except (EvaluationTimeout, EOFError, OSError) as lost:
+                with self.__lock:
+                    del self.__running[me]
+                if result.ready():
+                    logger.log('debug', 'Evaluation cancelled; replacing '
+                               'worker process {}'.format(process.pid),
+                               call_loc='POOL')
+                else:
+                    if not isinstance(lost, EvaluationTimeout):
+                        lost = Exception('Worker process {} died'.format(
+                            process.pid
+                        ))
+                    logger.log('warn', '{}; replacing worker process {}'
+                               .format(lost, process.pid), call_loc='POOL')
+                # "lost" is unbound once the except block ends
+                failure = lost
+                killed = True
+            if killed:
+                process.kill()
+                process.join()
+                conn.close()
+                process, conn = self.__start_worker()
+                if not result.ready():
+                    result.set_error(failure)
+                continue
+            if error is not None:
+                result.set_error(error)
+            else:
+                result.set_result(value)
+        conn.send(None)
+        process.join()
+        conn.close()
+
+
+class ThreadEvaluator(Evaluator):
+
+    def __init__(self, num_threads):
+        '''
+        ThreadEvaluator object: evaluates with a pool of threads in this
+        process; suited to objective functions that release the GIL (e.g.
+        NumPy/BLAS-heavy functions). Nothing is pickled, so lambdas and
+        closures can be used as objective functions.
+
+        Args:
+            num_threads (int): number of worker threads
+        '''
+
+        super().__init__()
+        self.__num_threads = num_threads
+        self.__state = {}
+        self.__executor = None
+        self.__lock = Lock()
+        self.__unfinished = {}
+
+    @property
+    def num_workers(self):
+
+        return self.__num_threads
+
+    def start(self, obj_fn, obj_fn_args, params):
+
+        logger.log('debug', 'Starting worker pool with {} threads'.format(
+            self.__num_threads
+        ), call_loc='POOL')
+        self.__state = {
+            'obj_fn': obj_fn,
+            'obj_fn_args': obj_fn_args,
+            'params': params
+        }
+        self.__executor = ThreadPoolExecutor(self.__num_threads)
+
+    def submit(self, task, arg, callback=None, error_callback=None):
+
+        result = EvaluationResult(callback, error_callback)
+        future = self.__executor.submit(task, arg, self.__state)
+        with self.__lock:
+            self.__unfinished[future] = result
+        future.add_done_callback(self.__done)
+        return result
+
+    def cancel(self):
+
+        # Evaluations already running in a thread cannot be stopped; they
+        #   finish unobserved
+        with self.__lock:
+            unfinished, self.__unfinished = self.__unfinished, {}
+        for future, result in unfinished.items():
+            future.cancel()
+            result.set_error(EvaluationCancelled('Evaluation cancelled'))
+
+    def __done(self, future):
+        '''
+        Sets the result of a finished (or cancelled) evaluation
+
+        Args:
+            future (concurrent.futures.Future): the evaluation's future
+        '''
+
+        with self.__lock:
+            result = self.__unfinished.pop(future, None)
+        if result is None or future.cancelled():
+            return
+        if future.exception() is not None:
+            result.set_error(future.exception())
+        else:
+            result.set_result(future.result())
+
+    def stop(self):
+
+        if self.__executor is not None:
+            logger.log('debug', 'Closing worker pool', call_loc='POOL')
+            self.__executor.shutdown()
+            self.__executor = None
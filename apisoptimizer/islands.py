@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# islands.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+from multiprocessing import Pipe, Process
+
+# 3rd party, open src. imports
+import numpy as np
+
+# ApisOptimizer imports
+from apisoptimizer.colony import Colony
+from apisoptimizer.logging import logger
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def _run_island(conn, colony_args, colony_kwargs, params):
+    '''
+    Island process target: builds a Colony and runs the commands received
+    from the controlling Islands object until told to close
+
+    Args:
+        conn (multiprocessing.connection.Connection): command pipe
+        colony_args (tuple): positional arguments for Colony
+        colony_kwargs (dict): keyword arguments for Colony
+        params (list): (name, min_val, max_val, restrict) of each parameter
+    '''
+
+    with Colony(*colony_args, **colony_kwargs) as colony:
+        for param in params:
+            colony.add_param(*param)
+        while True:
+            command, args = conn.recv()
+            if command == 'close':
+                break
+            try:
+                if command == 'initialize':
+                    colony.initialize()
+                elif command == 'search':
+                    for _ in range(args[0]):
+                        colony.search()
+                elif command == 'emigrants':
+                    result = colony.emigrants(*args)
+                elif command == 'immigrate':
+                    result = colony.immigrate(*args)
+                if command in ('initialize', 'search'):
+                    result = (colony.best_fitness, colony.best_parameters)
+                conn.send((result, None))
+            except Exception as error:
+                conn.send((None, error))
+    conn.close()
+
+
+class Islands:
+
+    def __init__(self, num_islands, num_employers, objective_fn,
+                 obj_fn_args=None, migration_interval=10, num_migrants=1,
+                 topology='ring', seed=None, **colony_kwargs):
+        '''
+        Islands object: runs independent Colony objects in separate
+        processes, periodically migrating the best food sources of each
+        colony (island) to its neighbors
+
+        Args:
+            num_islands (int): number of colonies, each in its own process
+            num_employers (int): number of employer bees per colony
+            objective_fn (callable): user supplied function to determine
+                                     fitness (must be picklable)
+            obj_fn_args (any): any additional arguments for user's objective
+                               function
+            migration_interval (int): generations between migrations
+            num_migrants (int): number of food sources each island sends to
+                                each of its neighbors
+            topology (str): 'ring' (island i sends to island i + 1) or
+                            'full' (every island sends to every other one)
+            seed (int): seed from which each colony's seed is derived
+            **colony_kwargs: additional keyword arguments for each Colony
+                             (e.g. num_processes, selection)
+        '''
+
+        if not callable(objective_fn):
+            raise ValueError('Supplied objective function not callable!')
+        if num_islands < 1:
+            raise ValueError('Number of islands must be at least 1: {}'
+                             .format(num_islands))
+        if topology not in TOPOLOGIES:
+            raise ValueError('Unsupported topology: use {}'.format(
+                TOPOLOGIES
+            ))
+        if migration_interval < 1:
+            raise ValueError('Migration interval must be at least 1: {}'
+                             .format(migration_interval))
+        self.__num_islands = num_islands
+        self.__colony_args = (num_employers, objective_fn, obj_fn_args)
+        self.__colony_kwargs = colony_kwargs
+        self.__migration_interval = migration_interval
+        self.__num_migrants = num_migrants
+        self.__topology = topology
+        self.__seeds = np.random.SeedSequence(seed).spawn(num_islands)
+        self.__params = []
+        self.__islands = []
+        self.__generation = 0
+        self.__best_fitness = 0
+        self.__best_params = None
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    @property
+    def num_islands(self):
+        '''
+        Number of colonies (islands)
+        '''
+
+        return self.__num_islands
+
+    @property
+    def generation(self):
+        '''
+        Number of generations each island has searched since initialize()
+        '''
+
+        return self.__generation
+
+    @property
+    def best_fitness(self):
+        '''
+        Fitness score of best performing bee so far, over all islands
+        '''
+
+        return self.__best_fitness
+
+    @property
+    def best_parameters(self):
+        '''
+        Parameters of best performing bee so far, over all islands
+        '''
+
+        return self.__best_params
+
+    def add_param(self, name, min_val, max_val, restrict=True):
+        '''
+        Add a parameter for every island's Colony to optimize
+
+        Args:
+            name (str): name of the parameter
+            min_val (int or float): minimum value allowed
+            max_val (int or float): maximum value allowed
+            restrict (bool): if True, restricts random values to specified
+                bounds; otherwise, no restricting
+        '''
+
+        # Islands are built with their parameters; rebuild them
+        self.close()
+        self.__params.append((name, min_val, max_val, restrict))
+
+    def initialize(self):
+        '''
+        Starts a process per island and initializes every island's
+        population
+        '''
+
+        if len(self.__params) == 0:
+            raise Exception(
+                'Parameters must be added before bee positions are found'
+            )
+        self.close()
+        logger.log('info', 'Starting {} islands'.format(self.__num_islands),
+                   call_loc='ISLANDS')
+        for seed in self.__seeds:
+            conn, island_conn = Pipe()
+            process = Process(
+                target=_run_island,
+                args=(
+                    island_conn,
+                    self.__colony_args,
+                    dict(self.__colony_kwargs, seed=seed),
+                    self.__params
+                )
+            )
+            process.start()
+            island_conn.close()
+            self.__islands.append((process, conn))
+        self.__generation = 0
+        self.__best_fitness = 0
+        self.__best_params = None
+        self.__update_best(self.__broadcast('initialize'))
+
+    def search(self, generations=None):
+        '''
+        Runs every island's search/follow/abandon process; islands search
+        independently between migrations
+
+        Args:
+            generations (int): number of generations to search, defaults to
+                               migration_interval
+        '''
+
+        if len(self.__islands) == 0:
+            raise Exception('Initial bee positions must be generated first')
+        if generations is None:
+            generations = self.__migration_interval
+        while generations > 0:
+            until_migration = self.__migration_interval - \
+                self.__generation % self.__migration_interval
+            chunk = min(generations, until_migration)
+            logger.log('info', 'Running {} search iterations'.format(chunk),
+                       call_loc='ISLANDS')
+            self.__update_best(self.__broadcast('search', chunk))
+            self.__generation += chunk
+            generations -= chunk
+            if chunk == until_migration:
+                self.__migrate()
+
+    def close(self):
+        '''
+        Stops every island's process
+        '''
+
+        for process, conn in self.__islands:
+            conn.send(('close', ()))
+            process.join()
+            conn.close()
+        self.__islands = []
+
+    def __migrate(self):
+        '''
+        Sends each island's best food sources to its neighbors
+        '''
+
+        if self.__num_islands == 1:
+            return
+        emigrants = self.__broadcast('emigrants', self.__num_migrants)
+        for dest in range(self.__num_islands):
+            if self.__topology == 'ring':
+                sources = [(dest - 1) % self.__num_islands]
+            else:
+                sources = [s for s in range(self.__num_islands) if s != dest]
+            self.__islands[dest][1].send(('immigrate', (
+                np.concatenate([emigrants[s][0] for s in sources]),
+                np.concatenate([emigrants[s][1] for s in sources])
+            )))
+        replaced = self.__receive()
+        logger.log('debug', 'Migration replaced {} bees'.format(
+            sum(replaced)
+        ), call_loc='MIGRATE')
+
+    def __broadcast(self, command, *args):
+        '''
+        Sends a command to every island and waits for their results
+
+        Args:
+            command (str): command name
+            *args: arguments for the command
+
+        Returns:
+            list: one result per island
+        '''
+
+        for _, conn in self.__islands:
+            conn.send((command, args))
+        return self.__receive()
+
+    def __receive(self):
+        '''
+        Waits for a result from every island, raising the first error
+
+        Returns:
+            list: one result per island
+        '''
+
+        replies = [conn.recv() for _, conn in self.__islands]
+        for _, error in replies:
+            if error is not None:
+                raise error
+        return [result for result, _ in replies]
+
+    def __update_best(self, island_bests):
+        '''
+        Updates the best fitness and parameters from the islands' bests
+
+        Args:
+            island_bests (list): (best_fitness, best_parameters) per island
+        '''
+
+        for best_fitness, best_params in island_bests:
+            if best_fitness > self.__best_fitness:
+                self.__best_fitness = best_fitness
+                self.__best_params = best_params
+                logger.log('info', 'New best performer: {}'.format(
+                    best_params
+                ), call_loc='ISLANDS')
@@ -48,3 +48,44 @@ except:
             warn('ColorLogging is not installed')
 
     logger = NoLogger()
+
+# Logging levels, from most to least verbose
+LEVELS = ['debug', 'info', 'warn', 'error', 'crit']
+
+
+def log_enabled(level):
+    '''
+    Determines whether a message logged at the supplied level would be
+    emitted by the stream or file handler
+
+    Args:
+        level (str): logging level, e.g. 'debug'
+
+    Returns:
+        bool: True if the message would be emitted
+    '''
+
+    for handler_level in (logger.stream_level, logger.file_level):
+        if handler_level is None or handler_level == 'disable':
+            continue
+        if handler_level not in LEVELS or level not in LEVELS:
+            return True
+        if LEVELS.index(level) >= LEVELS.index(handler_level):
+            return True
+    return False
+
+
+def log_lazy(level, build_message, call_loc=None):
+    '''
+    Logs a message that is only built if the supplied level is enabled; use
+    this for messages that are expensive to format
+
+    Args:
+        level (str): logging level, e.g. 'debug'
+        build_message (callable): called without arguments, returns the
+            message (str)
+        call_loc (str): location tag passed to the logger
+    '''
+
+    if log_enabled(level):
+        logger.log(level, build_message(), call_loc=call_loc)
@@ -8,7 +8,9 @@
 
 # Stdlib imports
 from random import randint, uniform
-from copy import deepcopy
+
+# 3rd party, open src. imports
+import numpy as np
 
 SUPPORTED_DTYPES = {
     int: randint,
@@ -18,6 +20,8 @@ SUPPORTED_DTYPES = {
 
 class Parameter:
 
+    __slots__ = ('value', 'name', 'min_val', 'max_val', 'restrict', 'dtype')
+
     def __init__(self, name, min_val, max_val, restrict):
         '''
         Parameter object: houses information for a parameter added to a Colony
@@ -56,7 +60,7 @@ class Parameter:
         Mutate parameter (find neighbor)
         '''
 
-        curr_val = deepcopy(self.value)
+        curr_val = self.value
         self.value = self.dtype(
             self.value + uniform(-1, 1) * (self.value - self.__randval())
         )
@@ -75,3 +79,173 @@ class Parameter:
         '''
 
         return SUPPORTED_DTYPES[self.dtype](self.min_val, self.max_val)
+
+
+class ParameterSpace:
+
+    def __init__(self, params):
+        '''
+        ParameterSpace object: immutable, array-based description of a
+        colony's parameters, used to generate and mutate food sources for
+        many bees at once; food sources are float64 arrays with one column per
+        parameter (integer parameters hold integral values)
+
+        Args:
+            params (list): list of Parameter objects
+        '''
+
+        self.__names = tuple(p.name for p in params)
+        self.__min_vals = self.__frozen([p.min_val for p in params], float)
+        self.__max_vals = self.__frozen([p.max_val for p in params], float)
+        self.__is_int = self.__frozen([p.dtype is int for p in params], bool)
+        self.__restrict = self.__frozen([p.restrict for p in params], bool)
+
+    def __len__(self):
+
+        return len(self.__names)
+
+    @property
+    def names(self):
+        '''
+        Parameter names, i.e. the column order of food sources
+        '''
+
+        return self.__names
+
+    @property
+    def is_int(self):
+        '''
+        Read-only boolean array, True for integer parameters
+        '''
+
+        return self.__is_int
+
+    def contains(self, food):
+        '''
+        Determines which food sources are valid for the parameters: integer
+        parameters hold integral values and restricted parameters are within
+        their bounds
+
+        Args:
+            food (numpy.ndarray): food sources, shape (num_food, num_params)
+
+        Returns:
+            numpy.ndarray: boolean array, True for valid food sources
+        '''
+
+        food = np.asarray(food, dtype=float).reshape(-1, len(self))
+        integral = ~self.__is_int | (np.trunc(food) == food)
+        in_bounds = ~self.__restrict | (
+            (food >= self.__min_vals) & (food <= self.__max_vals)
+        )
+        return np.all(integral & in_bounds, axis=1)
+
+    def normalize(self, food):
+        '''
+        Scales food sources to the unit hypercube, 0 at each parameter's
+        min_val and 1 at its max_val, e.g. for distances between food
+        sources
+
+        Args:
+            food (numpy.ndarray): food sources, shape (num_food, num_params)
+
+        Returns:
+            numpy.ndarray: scaled food sources, shape (num_food, num_params)
+        '''
+
+        span = self.__max_vals - self.__min_vals
+        return (np.asarray(food, dtype=float) - self.__min_vals) / \
+            np.where(span > 0, span, 1.0)
+
+    def random_food(self, num_food, rng):
+        '''
+        Generates random food sources, values between each parameter's
+        min_val and max_val
+
+        Args:
+            num_food (int): number of food sources to generate
+            rng (numpy.random.Generator): random number generator
+
+        Returns:
+            numpy.ndarray: food sources, shape (num_food, num_params)
+        '''
+
+        cols = np.tile(np.arange(len(self)), num_food)
+        return self.__random_values(cols, rng).reshape(num_food, len(self))
+
+    def neighbor_food(self, food, rng, max_tries=100):
+        '''
+        Finds a neighbor for each food source by mutating one random
+        parameter (vectorized form of Parameter.mutate)
+
+        Args:
+            food (numpy.ndarray): food sources, shape (num_food, num_params)
+            rng (numpy.random.Generator): random number generator
+            max_tries (int): restricted parameters whose mutation is undone
+                by clamping are mutated again, at most max_tries times
+
+        Returns:
+            numpy.ndarray: new food sources, one mutated parameter per row
+        '''
+
+        food = np.array(food, dtype=float)
+        rows = np.arange(len(food))
+        cols = rng.integers(0, len(self), len(food))
+        curr_vals = food[rows, cols]
+        new_vals = curr_vals.copy()
+        pending = rows
+        for _ in range(max_tries):
+            pending_cols = cols[pending]
+            vals = curr_vals[pending]
+            mutated = vals + rng.uniform(-1, 1, len(pending)) * (
+                vals - self.__random_values(pending_cols, rng)
+            )
+            mutated = np.where(
+                self.__is_int[pending_cols], np.trunc(mutated), mutated
+            )
+            restrict = self.__restrict[pending_cols]
+            mutated = np.where(restrict, np.clip(
+                mutated,
+                self.__min_vals[pending_cols],
+                self.__max_vals[pending_cols]
+            ), mutated)
+            new_vals[pending] = mutated
+            pending = pending[restrict & (mutated == vals)]
+            if len(pending) == 0:
+                break
+        food[rows, cols] = new_vals
+        return food
+
+    def __random_values(self, cols, rng):
+        '''
+        Random values for a sequence of parameter (column) indices
+
+        Args:
+            cols (numpy.ndarray): parameter indices
+            rng (numpy.random.Generator): random number generator
+
+        Returns:
+            numpy.ndarray: one random value per index
+        '''
+
+        min_vals = self.__min_vals[cols]
+        max_vals = self.__max_vals[cols]
+        vals = rng.uniform(min_vals, max_vals)
+        is_int = self.__is_int[cols]
+        if is_int.any():
+            vals[is_int] = rng.integers(
+                min_vals[is_int].astype(np.int64),
+                max_vals[is_int].astype(np.int64),
+                endpoint=True
+            )
+        return vals
+
+    @staticmethod
+    def __frozen(values, dtype):
+        '''
+        Read-only array from a list of values
+        '''
+
+        array = np.array(values, dtype=dtype)
+        array.flags.writeable = False
+        return array
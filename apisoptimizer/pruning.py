@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# pruning.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+from bisect import bisect_left, insort
+from collections import deque
+
+# 3rd party, open src. imports
+import numpy as np
+
+
+class EvaluationPruned(Exception):
+    '''
+    Raised by Reporter.report() to stop an evaluation that should be pruned
+    '''
+
+    pass
+
+
+class Reporter:
+
+    def __init__(self, thresholds=None, bound=float('inf'), warmup_steps=0):
+        '''
+        Reporter object: passed to objective functions of colonies with a
+        pruner, which report intermediate values (e.g. validation loss per
+        epoch) with report(); report() raises EvaluationPruned once the
+        evaluation should be stopped. Reporters are picklable snapshots of
+        their pruner's rule, so they work in any worker.
+
+        Args:
+            thresholds (dict): steps and values; a value above its step's
+                threshold is pruned
+            bound (float): values at or above bound are pruned (e.g. the
+                objective function value of the bee's current food source)
+            warmup_steps (int): steps before warmup_steps are never pruned
+        '''
+
+        self.values = []
+        self.__thresholds = {} if thresholds is None else thresholds
+        self.__bound = bound
+        self.__warmup_steps = warmup_steps
+
+    def report(self, step, value):
+        '''
+        Reports an intermediate objective function value
+
+        Args:
+            step (int): step (e.g. epoch) the value was reached at
+            value (float): intermediate objective function value (lower is
+                better)
+        '''
+
+        self.values.append((step, value))
+        if step < self.__warmup_steps:
+            return
+        if value >= self.__bound or \
+                value > self.__thresholds.get(step, float('inf')):
+            raise EvaluationPruned('Pruned at step {}: {}'.format(
+                step, value
+            ))
+
+
+class Pruner:
+
+    def __init__(self, warmup_steps=0):
+        '''
+        Pruner object: decides which evaluations a colony stops early;
+        reporter() is called for each prunable evaluation and record() with
+        the intermediate values of each finished (or pruned) evaluation. The
+        base pruner never prunes.
+
+        Args:
+            warmup_steps (int): steps before warmup_steps are never pruned
+        '''
+
+        self._warmup_steps = warmup_steps
+
+    def reporter(self, incumbent):
+        '''
+        Creates the Reporter for an evaluation
+
+        Args:
+            incumbent (float): objective function value of the food source
+                the evaluated candidate has to beat
+
+        Returns:
+            Reporter: reporter passed to the objective function
+        '''
+
+        return Reporter(warmup_steps=self._warmup_steps)
+
+    def record(self, values):
+        '''
+        Records the intermediate values of an evaluation
+
+        Args:
+            values (list): (step, value) tuples reported by the evaluation
+        '''
+
+        pass
+
+
+class IncumbentPruner(Pruner):
+
+    def __init__(self, warmup_steps=0):
+        '''
+        Incumbent pruner: stops an evaluation once an intermediate value is
+        no better than the bee's current food source, which the candidate
+        could then only beat if its values improved later; suited to
+        objectives that improve with every step (e.g. training loss)
+
+        Args:
+            warmup_steps (int): steps before warmup_steps are never pruned
+        '''
+
+        super().__init__(warmup_steps)
+
+    def reporter(self, incumbent):
+
+        return Reporter(bound=incumbent, warmup_steps=self._warmup_steps)
+
+
+class PercentilePruner(Pruner):
+
+    def __init__(self, percentile=50.0, warmup_steps=0, min_evaluations=5,
+                 window=1000):
+        '''
+        Percentile pruner: stops an evaluation if an intermediate value is
+        worse than the given percentile of the values the most recent
+        previous evaluations reported at the same step (lower percentiles
+        prune more)
+
+        Args:
+            percentile (float): percentile of previous values, 0-100
+            warmup_steps (int): steps before warmup_steps are never pruned
+            min_evaluations (int): steps reported by fewer evaluations are
+                never pruned
+            window (int): most recent values per step the percentile is
+                computed from; values are kept sorted as they are recorded,
+                so thresholds cost O(window) per recorded value to update
+                (NaN values are ignored)
+        '''
+
+        super().__init__(warmup_steps)
+        if not 0 <= percentile <= 100:
+            raise ValueError('Percentile must be between 0 and 100: {}'
+                             .format(percentile))
+        if window < min_evaluations:
+            raise ValueError('Window must hold at least min_evaluations '
+                             'values: {}'.format(window))
+        self.__percentile = percentile
+        self.__min_evaluations = min_evaluations
+        self.__window = window
+        self.__history = {}
+        self.__thresholds = {}
+        self.__stale = set()
+
+    def reporter(self, incumbent):
+
+        # Only steps with new values are recomputed; reporters keep the
+        #   thresholds they were created with
+        if self.__stale:
+            thresholds = dict(self.__thresholds)
+            for step in self.__stale:
+                ordered = self.__history[step][1]
+                if len(ordered) >= self.__min_evaluations:
+                    thresholds[step] = _percentile(ordered, self.__percentile)
+            self.__thresholds = thresholds
+            self.__stale = set()
+        return Reporter(self.__thresholds, warmup_steps=self._warmup_steps)
+
+    def record(self, values):
+
+        for step, value in values:
+            if np.isnan(value):
+                continue
+            if step not in self.__history:
+                self.__history[step] = (deque(), [])
+            recent, ordered = self.__history[step]
+            if len(recent) == self.__window:
+                del ordered[bisect_left(ordered, recent.popleft())]
+            recent.append(value)
+            insort(ordered, value)
+            self.__stale.add(step)
+
+
+class MedianPruner(PercentilePruner):
+
+    def __init__(self, warmup_steps=0, min_evaluations=5, window=1000):
+        '''
+        Median pruner: stops an evaluation if an intermediate value is worse
+        than the median of the values the most recent previous evaluations
+        reported at the same step
+
+        Args:
+            warmup_steps (int): steps before warmup_steps are never pruned
+            min_evaluations (int): steps reported by fewer evaluations are
+                never pruned
+            window (int): most recent values per step the median is
+                computed from
+        '''
+
+        super().__init__(50.0, warmup_steps, min_evaluations, window)
+
+
+PRUNERS = {
+    'incumbent': IncumbentPruner,
+    'median': MedianPruner,
+    'percentile': PercentilePruner
+}
+
+
+def get_pruner(pruner):
+    '''
+    Returns the Pruner object for a pruner name or object
+
+    Args:
+        pruner (str or Pruner): name of a pruner in PRUNERS, or a Pruner
+            object
+
+    Returns:
+        Pruner: pruner object
+    '''
+
+    if isinstance(pruner, Pruner):
+        return pruner
+    if pruner not in PRUNERS:
+        raise ValueError('Unsupported pruner: use {} or a Pruner object'
+                         .format(list(PRUNERS)))
+    return PRUNERS[pruner]()
+
+
+def _percentile(ordered, percentile):
+    '''
+    Percentile of sorted values, interpolated linearly between the closest
+    ranks (as numpy.percentile)
+
+    Args:
+        ordered (list): sorted values
+        percentile (float): percentile, 0-100
+
+    Returns:
+        float: percentile of the values
+    '''
+
+    rank = (len(ordered) - 1) * percentile / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return float(ordered[lower] + (ordered[upper] - ordered[lower]) *
+                 (rank - lower))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# selection.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# 3rd party, open src. imports
+import numpy as np
+
+
+class Selection:
+
+    def __init__(self):
+        '''
+        Selection object: chooses the bees that onlookers follow; prepare()
+        is called once with the colony's fitness scores, after which select()
+        draws any number of bee indices
+        '''
+
+        self._fitness = np.empty(0)
+
+    def prepare(self, fitness):
+        '''
+        Precomputes whatever the scheme needs from the fitness scores
+
+        Args:
+            fitness (numpy.ndarray): fitness scores of the colony's bees
+        '''
+
+        self._fitness = np.asarray(fitness, dtype=float)
+
+    def select(self, num, rng):
+        '''
+        Draws bee indices
+
+        Args:
+            num (int): number of indices to draw
+            rng (numpy.random.Generator): random number generator
+
+        Returns:
+            numpy.ndarray: indices of chosen bees
+        '''
+
+        raise NotImplementedError
+
+
+class RouletteSelection(Selection):
+
+    def __init__(self):
+        '''
+        Fitness-proportional (roulette wheel) selection: a bee is chosen with
+        probability fitness / sum(fitness); O(n) to prepare, O(log n) per
+        draw
+        '''
+
+        super().__init__()
+        self.__cumulative = np.empty(0)
+
+    def prepare(self, fitness):
+        '''
+        Computes the cumulative fitness of the colony
+
+        Args:
+            fitness (numpy.ndarray): fitness scores of the colony's bees
+        '''
+
+        super().prepare(fitness)
+        self.__cumulative = np.cumsum(self._fitness)
+
+    def select(self, num, rng):
+
+        return _spin(self.__cumulative, num, rng)
+
+
+class RankSelection(Selection):
+
+    def __init__(self):
+        '''
+        Linear rank selection: a bee is chosen with probability proportional
+        to its rank (1 = worst, n = best), which keeps selection pressure
+        independent of the scale of the fitness scores; O(n log n) to
+        prepare, O(log n) per draw
+        '''
+
+        super().__init__()
+        self.__cumulative = np.empty(0)
+
+    def prepare(self, fitness):
+        '''
+        Ranks the colony's bees and computes their cumulative rank
+
+        Args:
+            fitness (numpy.ndarray): fitness scores of the colony's bees
+        '''
+
+        super().prepare(fitness)
+        ranks = np.empty(len(self._fitness))
+        ranks[np.argsort(self._fitness, kind='stable')] = np.arange(
+            1, len(self._fitness) + 1
+        )
+        self.__cumulative = np.cumsum(ranks)
+
+    def select(self, num, rng):
+
+        return _spin(self.__cumulative, num, rng)
+
+
+class TournamentSelection(Selection):
+
+    def __init__(self, size=2):
+        '''
+        Tournament selection: each draw picks the fittest of `size` bees
+        chosen uniformly at random; O(1) to prepare, O(size) per draw
+
+        Args:
+            size (int): number of bees competing in each tournament
+        '''
+
+        super().__init__()
+        if size < 1:
+            raise ValueError('Tournament size must be at least 1: {}'.format(
+                size
+            ))
+        self.__size = size
+
+    def select(self, num, rng):
+
+        entrants = rng.integers(0, len(self._fitness), (num, self.__size))
+        winners = np.argmax(self._fitness[entrants], axis=1)
+        return entrants[np.arange(num), winners]
+
+
+SELECTION_SCHEMES = {
+    'roulette': RouletteSelection,
+    'rank': RankSelection,
+    'tournament': TournamentSelection
+}
+
+
+def get_selection(selection):
+    '''
+    Returns the Selection object for a scheme name or object
+
+    Args:
+        selection (str or Selection): name of a scheme in SELECTION_SCHEMES,
+            or a Selection object
+
+    Returns:
+        Selection: selection object
+    '''
+
+    if isinstance(selection, Selection):
+        return selection
+    if selection not in SELECTION_SCHEMES:
+        raise ValueError('Unsupported selection scheme: use {} or a '
+                         'Selection object'.format(list(SELECTION_SCHEMES)))
+    return SELECTION_SCHEMES[selection]()
+
+
+def _spin(cumulative, num, rng):
+    '''
+    Draws indices with probability proportional to the increments of a
+    cumulative sum
+
+    Args:
+        cumulative (numpy.ndarray): cumulative sum of the weights
+        num (int): number of indices to draw
+        rng (numpy.random.Generator): random number generator
+
+    Returns:
+        numpy.ndarray: drawn indices
+    '''
+
+    if cumulative[-1] <= 0:
+        return rng.integers(0, len(cumulative), num)
+    idx = np.searchsorted(
+        cumulative, rng.random(num) * cumulative[-1], side='right'
+    )
+    return np.minimum(idx, len(cumulative) - 1)
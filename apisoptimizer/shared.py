@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# shared.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+from multiprocessing.shared_memory import SharedMemory
+
+# 3rd party, open src. imports
+from numpy import ndarray
+
+
+class SharedArray:
+
+    def __init__(self, name, shape, dtype):
+        '''
+        SharedArray object: lightweight, picklable reference to a NumPy array
+        stored in a shared memory block
+
+        Args:
+            name (str): name of the shared memory block
+            shape (tuple): shape of the array
+            dtype (numpy.dtype): data type of the array
+        '''
+
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+def share_arrays(obj, segments):
+    '''
+    Copies every NumPy array found in obj (searching through dictionaries,
+    lists and tuples) into shared memory, replacing it with a SharedArray
+    reference
+
+    Args:
+        obj (any): object to search for NumPy arrays
+        segments (list): SharedMemory blocks created are appended to this
+            list; the caller is responsible for unlinking them
+
+    Returns:
+        any: copy of obj with NumPy arrays replaced by SharedArray references
+    '''
+
+    if isinstance(obj, ndarray):
+        shm = SharedMemory(create=True, size=max(obj.nbytes, 1))
+        segments.append(shm)
+        shared = ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)
+        shared[...] = obj
+        return SharedArray(shm.name, obj.shape, obj.dtype)
+    if isinstance(obj, dict):
+        return {k: share_arrays(v, segments) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(share_arrays(v, segments) for v in obj)
+    return obj
+
+
+def attach_arrays(obj, segments):
+    '''
+    Replaces every SharedArray reference found in obj with a read-only NumPy
+    view of its shared memory block
+
+    Args:
+        obj (any): object returned by share_arrays
+        segments (list): attached SharedMemory blocks are appended to this
+            list; they must stay referenced for as long as the views are used
+
+    Returns:
+        any: copy of obj with SharedArray references replaced by arrays
+    '''
+
+    if isinstance(obj, SharedArray):
+        shm = SharedMemory(name=obj.name)
+        segments.append(shm)
+        view = ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)
+        view.flags.writeable = False
+        return view
+    if isinstance(obj, dict):
+        return {k: attach_arrays(v, segments) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(attach_arrays(v, segments) for v in obj)
+    return obj
+
+
+def release_segments(segments, unlink=False):
+    '''
+    Closes (and optionally unlinks) shared memory blocks
+
+    Args:
+        segments (list): SharedMemory blocks; emptied by this function
+        unlink (bool): if True, the blocks are destroyed as well
+    '''
+
+    while segments:
+        shm = segments.pop()
+        shm.close()
+        if unlink:
+            shm.unlink()
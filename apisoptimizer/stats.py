@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# stats.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+from contextlib import nullcontext
+from time import perf_counter
+
+# Counters every colony keeps, timed or not
+COUNTERS = ('evaluations', 'objective_seconds', 'search_seconds',
+            'abandonments', 'scouts')
+
+# Shared by every untimed phase: entering and exiting it does nothing
+_UNTIMED = nullcontext()
+
+
+class _PhaseTimer:
+
+    __slots__ = ('__seconds', '__phase', '__start')
+
+    def __init__(self, seconds, phase):
+        '''
+        Context manager adding the wall-clock time spent in its block to
+        seconds[phase]
+
+        Args:
+            seconds (dict): phase names and seconds spent in each phase
+            phase (str): name of the timed phase
+        '''
+
+        self.__seconds = seconds
+        self.__phase = phase
+
+    def __enter__(self):
+
+        self.__start = perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.__seconds[self.__phase] = self.__seconds.get(self.__phase, 0.0) \
+            + perf_counter() - self.__start
+
+
+class ColonyStats:
+
+    def __init__(self, timed=False):
+        '''
+        ColonyStats object: counters of a colony's work (see COUNTERS) and,
+        if timed, wall-clock seconds spent in each phase of its generations
+        (e.g. 'propose', 'selection', 'lookup', 'evaluate', 'settle');
+        totals since the last reset() and the changes during the last
+        generation
+
+        Args:
+            timed (bool): if True, phases are timed; otherwise time() returns
+                a context manager that does nothing
+        '''
+
+        self.__timed = timed
+        self.reset()
+
+    @property
+    def timed(self):
+        '''
+        True if phases are timed
+        '''
+
+        return self.__timed
+
+    def reset(self):
+        '''
+        Zeroes every counter and phase time
+        '''
+
+        self.__counts = dict.fromkeys(COUNTERS, 0)
+        self.__seconds = {}
+        self.__begun = None
+        self.__last = None
+
+    def count(self, counter, num=1):
+        '''
+        Increments a counter
+
+        Args:
+            counter (str): name of a counter in COUNTERS
+            num (int or float): amount to add
+        '''
+
+        self.__counts[counter] += num
+
+    def time(self, phase):
+        '''
+        Times a phase: use as "with stats.time('phase'):"
+
+        Args:
+            phase (str): name of the phase
+
+        Returns:
+            context manager: adds the time spent in its block to the phase
+        '''
+
+        if not self.__timed:
+            return _UNTIMED
+        return _PhaseTimer(self.__seconds, phase)
+
+    def begin_generation(self):
+        '''
+        Marks the start of a generation (or of initialization)
+        '''
+
+        self.__begun = (perf_counter(), dict(self.__counts),
+                        dict(self.__seconds))
+
+    def end_generation(self):
+        '''
+        Marks the end of the generation begun last; its duration is counted
+        as search_seconds
+        '''
+
+        start, counts, seconds = self.__begun
+        self.__counts['search_seconds'] += perf_counter() - start
+        self.__last = {
+            'counts': {name: self.__counts[name] - counts[name]
+                       for name in COUNTERS},
+            'phases': {phase: self.__seconds[phase] - seconds.get(phase, 0.0)
+                       for phase in self.__seconds}
+        }
+        self.__begun = None
+
+    def snapshot(self):
+        '''
+        Returns dict: {'counts': counter totals, 'phases': seconds per phase
+            (empty if not timed), 'last_generation': {'counts', 'phases'} of
+            the last generation (None before the first one ends)}
+        '''
+
+        return {
+            'counts': dict(self.__counts),
+            'phases': dict(self.__seconds),
+            'last_generation': self.__last
+        }
+
+
+class RunResult:
+
+    def __init__(self, reason, best_fitness, best_parameters, best_obj_fn_val,
+                 generations, evaluations, seconds, history):
+        '''
+        RunResult object: outcome of Colony.run()
+
+        Args:
+            reason (str): stopping criterion that ended the run: 'target',
+                'max_evaluations', 'max_generations', 'max_seconds' or
+                'converged'
+            best_fitness (float): fitness score of the best food source
+            best_parameters (dict): parameter names and values of the best
+                food source
+            best_obj_fn_val (float): objective function value of the best
+                food source
+            generations (int): search() generations completed by the run
+            evaluations (int): objective function evaluations made by the run
+            seconds (float): wall-clock seconds the run took
+            history (list): best objective function value when the search
+                started (after initialization, if the run initialized the
+                colony) and after each generation
+        '''
+
+        self.reason = reason
+        self.best_fitness = best_fitness
+        self.best_parameters = best_parameters
+        self.best_obj_fn_val = best_obj_fn_val
+        self.generations = generations
+        self.evaluations = evaluations
+        self.seconds = seconds
+        self.history = history
+
+    def __repr__(self):
+
+        return 'RunResult(reason={!r}, best_obj_fn_val={}, generations={}, ' \
+            'evaluations={}, seconds={:.3f})'.format(
+                self.reason, self.best_obj_fn_val, self.generations,
+                self.evaluations, self.seconds
+            )
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# store.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# Stdlib imports
+import atexit
+import json
+import sqlite3
+from queue import Queue, Empty
+from threading import Thread
+from time import time
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY,
+    params TEXT NOT NULL,
+    obj_fn_val REAL,
+    seconds REAL,
+    created REAL NOT NULL
+)
+'''
+
+
+class EvaluationStore:
+
+    def __init__(self, path, batch_size=64, flush_interval=1.0):
+        '''
+        EvaluationStore object: append-only SQLite file of evaluated food
+        sources; records are written in batches by a background thread
+
+        Args:
+            path (str): path to the SQLite file (created if it does not
+                exist)
+            batch_size (int): maximum number of records written per
+                transaction
+            flush_interval (float): seconds to wait for a batch to fill
+                before writing it anyway
+        '''
+
+        self.__path = path
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval
+        self.__queue = Queue()
+        self.__closed = False
+        with sqlite3.connect(path) as connection:
+            connection.execute(_SCHEMA)
+        connection.close()
+        self.__writer = Thread(target=self.__write_records, daemon=True)
+        self.__writer.start()
+        atexit.register(self.close)
+
+    @property
+    def path(self):
+        '''
+        Path to the SQLite file
+        '''
+
+        return self.__path
+
+    @property
+    def closed(self):
+        '''
+        True once close() has been called
+        '''
+
+        return self.__closed
+
+    def record(self, params, obj_fn_val, seconds=None):
+        '''
+        Queues an evaluated food source for writing
+
+        Args:
+            params (dict): parameter names and values
+            obj_fn_val (int or float): objective function value
+            seconds (float): wall-clock seconds the evaluation took
+        '''
+
+        if self.__closed:
+            raise Exception('Evaluation store has been closed')
+        self.__queue.put((json.dumps(params), obj_fn_val, seconds, time()))
+
+    def records(self):
+        '''
+        Reads every stored record (queued records are written first), best
+        (lowest objective function value) first
+
+        Returns:
+            list: list of (params (dict), obj_fn_val, seconds) tuples
+        '''
+
+        self.flush()
+        connection = sqlite3.connect(self.__path)
+        try:
+            rows = connection.execute(
+                'SELECT params, obj_fn_val, seconds FROM evaluations '
+                'ORDER BY obj_fn_val'
+            ).fetchall()
+        finally:
+            connection.close()
+        return [(json.loads(row[0]), row[1], row[2]) for row in rows]
+
+    def flush(self):
+        '''
+        Blocks until every queued record has been written
+        '''
+
+        self.__queue.join()
+
+    def close(self):
+        '''
+        Writes queued records and stops the background writer
+        '''
+
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__queue.put(None)
+        self.__writer.join()
+
+    def __write_records(self):
+        '''
+        Background writer: groups queued records into transactions of up to
+        batch_size records
+        '''
+
+        connection = sqlite3.connect(self.__path)
+        stop = False
+        while not stop:
+            batch = [self.__queue.get()]
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get(
+                        timeout=self.__flush_interval
+                    ))
+                except Empty:
+                    break
+            if None in batch:
+                stop = True
+            rows = [row for row in batch if row is not None]
+            if rows:
+                with connection:
+                    connection.executemany(
+                        'INSERT INTO evaluations '
+                        '(params, obj_fn_val, seconds, created) '
+                        'VALUES (?, ?, ?, ?)',
+                        rows
+                    )
+            for _ in batch:
+                self.__queue.task_done()
+        connection.close()
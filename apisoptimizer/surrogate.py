@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# surrogate.py (0.3.2)
+#
+# Developed in 2019 by Travis Kessler <travis.j.kessler@gmail.com>
+#
+
+# 3rd party, open src. imports
+import numpy as np
+
+
+class Surrogate:
+
+    def __init__(self, min_samples=10, max_samples=1000, window=100):
+        '''
+        Surrogate object: cheap model of the objective function, trained on
+        the colony's evaluation history and used to choose which of several
+        neighboring food sources a bee evaluates; update() is called with
+        every evaluation and predict() with candidate food sources (both
+        scaled to the unit hypercube). Before adding new evaluations,
+        update() compares them with the model's predictions, so accuracy
+        statistics are measured on unseen food sources.
+
+        Args:
+            min_samples (int): evaluations required before predicting
+            max_samples (int): most recent evaluations the model is fit to
+            window (int): most recent predictions accuracy statistics are
+                computed from
+        '''
+
+        self._min_samples = min_samples
+        self._max_samples = max_samples
+        self._window = window
+        self._food = np.empty((0, 0))
+        self._obj_fn_vals = np.empty(0)
+        self._num_added = 0
+        self.__new_food = []
+        self.__new_vals = []
+        self.__predicted = np.empty(0)
+        self.__actual = np.empty(0)
+        self.__num_predictions = 0
+        self.__stale = False
+
+    @property
+    def num_samples(self):
+        '''
+        Number of evaluations the model is fit to
+        '''
+
+        self.__merge()
+        return len(self._obj_fn_vals)
+
+    @property
+    def ready(self):
+        '''
+        True if the model has enough evaluations to predict
+        '''
+
+        return self.num_samples >= self._min_samples
+
+    @property
+    def num_predictions(self):
+        '''
+        Number of evaluations whose values were predicted before they were
+        added to the model
+        '''
+
+        return self.__num_predictions
+
+    @property
+    def mean_abs_error(self):
+        '''
+        Mean absolute error of the most recent predictions (NaN if there
+        are none)
+        '''
+
+        if len(self.__actual) == 0:
+            return np.nan
+        return float(np.mean(np.abs(self.__predicted - self.__actual)))
+
+    @property
+    def rank_correlation(self):
+        '''
+        Spearman rank correlation between the most recent predictions and
+        the values evaluated, i.e. how well the model orders food sources
+        (NaN if undefined)
+        '''
+
+        if len(self.__actual) < 2:
+            return np.nan
+        ranks = [np.argsort(np.argsort(v)) for v in
+                 (self.__predicted, self.__actual)]
+        if ranks[0].std() == 0 or ranks[1].std() == 0:
+            return np.nan
+        return float(np.corrcoef(ranks[0], ranks[1])[0, 1])
+
+    def update(self, food, obj_fn_vals):
+        '''
+        Adds evaluations to the model; infinite and NaN values (e.g. timed
+        out evaluations) are ignored
+
+        Args:
+            food (numpy.ndarray): scaled food sources, shape (n, n_params)
+            obj_fn_vals (numpy.ndarray): objective function values
+        '''
+
+        obj_fn_vals = np.asarray(obj_fn_vals, dtype=float)
+        finite = np.isfinite(obj_fn_vals)
+        if not finite.any():
+            return
+        food, obj_fn_vals = food[finite], obj_fn_vals[finite]
+        if self.ready:
+            self.__predicted = np.concatenate(
+                (self.__predicted, self.predict(food))
+            )[-self._window:]
+            self.__actual = np.concatenate(
+                (self.__actual, obj_fn_vals)
+            )[-self._window:]
+            self.__num_predictions += len(obj_fn_vals)
+        self.__new_food.append(food)
+        self.__new_vals.append(obj_fn_vals)
+
+    def predict(self, food):
+        '''
+        Predicts objective function values (the model must be ready)
+
+        Args:
+            food (numpy.ndarray): scaled food sources, shape (n, n_params)
+
+        Returns:
+            numpy.ndarray: predicted objective function values
+        '''
+
+        self.__merge()
+        if self.__stale:
+            self._fit()
+            self.__stale = False
+        return self._predict(food)
+
+    def _fit(self):
+        '''
+        Refits the model to _food and _obj_fn_vals; called lazily, before
+        the first prediction after new evaluations were added
+        '''
+
+        pass
+
+    def _predict(self, food):
+        '''
+        Predicts objective function values with the fitted model
+
+        Args:
+            food (numpy.ndarray): scaled food sources, shape (n, n_params)
+
+        Returns:
+            numpy.ndarray: predicted objective function values
+        '''
+
+        raise NotImplementedError
+
+    def __merge(self):
+        '''
+        Appends evaluations added since the last merge to the model's
+        samples, keeping the most recent max_samples; the model is refit
+        before the next prediction
+        '''
+
+        if not self.__new_vals:
+            return
+        if len(self._obj_fn_vals) == 0:
+            self._food = np.empty((0, self.__new_food[0].shape[1]))
+        self._food = np.concatenate(
+            [self._food] + self.__new_food
+        )[-self._max_samples:]
+        self._num_added += sum(len(vals) for vals in self.__new_vals)
+        self._obj_fn_vals = np.concatenate(
+            [self._obj_fn_vals] + self.__new_vals
+        )[-self._max_samples:]
+        self.__new_food, self.__new_vals = [], []
+        self.__stale = True
+
+
+class KNNSurrogate(Surrogate):
+
+    def __init__(self, k=5, min_samples=10, max_samples=1000, window=100):
+        '''
+        k-nearest-neighbor surrogate: predicts the inverse-distance weighted
+        mean of the k nearest evaluations; nothing to refit, O(n) per
+        prediction
+
+        Args:
+            k (int): number of neighbors
+            min_samples (int): evaluations required before predicting
+            max_samples (int): most recent evaluations the model is fit to
+            window (int): most recent predictions accuracy statistics are
+                computed from
+        '''
+
+        super().__init__(max(k, min_samples), max_samples, window)
+        self.__k = k
+
+    def _predict(self, food):
+
+        dists = np.sqrt(_sq_dists(food, self._food))
+        nearest = np.argpartition(dists, self.__k - 1, axis=1)[:, :self.__k]
+        dists = np.take_along_axis(dists, nearest, axis=1)
+        weights = 1.0 / np.maximum(dists, 1e-12)
+        return (weights * self._obj_fn_vals[nearest]).sum(axis=1) / \
+            weights.sum(axis=1)
+
+
+class RBFSurrogate(Surrogate):
+
+    def __init__(self, smoothing=1e-3, refit_every=10, min_samples=10,
+                 max_samples=300, window=100):
+        '''
+        Radial basis function surrogate: Gaussian kernel interpolation of
+        the evaluations (width: mean distance to the nearest evaluation);
+        a refit costs O(max_samples ** 3), so the model is only refit once
+        refit_every evaluations were added
+
+        Args:
+            smoothing (float): regularization added to the kernel matrix's
+                diagonal; larger values smooth noisy objective functions
+            refit_every (int): evaluations added between refits
+            min_samples (int): evaluations required before predicting
+            max_samples (int): most recent evaluations the model is fit to
+            window (int): most recent predictions accuracy statistics are
+                computed from
+        '''
+
+        super().__init__(min_samples, max_samples, window)
+        self.__smoothing = smoothing
+        self.__refit_every = refit_every
+        self.__fit_at = None
+        self.__centers = np.empty((0, 0))
+        self.__width = 1.0
+        self.__mean = 0.0
+        self.__weights = np.empty(0)
+
+    def _fit(self):
+
+        if self.__fit_at is not None and \
+                self._num_added - self.__fit_at < self.__refit_every:
+            return
+        self.__fit_at = self._num_added
+        self.__centers = self._food
+        sq_dists = _sq_dists(self.__centers, self.__centers)
+        np.fill_diagonal(sq_dists, np.inf)
+        self.__width = max(
+            float(np.mean(np.sqrt(sq_dists.min(axis=1)))), 1e-6
+        )
+        np.fill_diagonal(sq_dists, 0.0)
+        kernel = np.exp(-sq_dists / (2 * self.__width ** 2))
+        kernel[np.diag_indices_from(kernel)] += self.__smoothing
+        self.__mean = float(np.mean(self._obj_fn_vals))
+        self.__weights = np.linalg.solve(
+            kernel, self._obj_fn_vals - self.__mean
+        )
+
+    def _predict(self, food):
+
+        kernel = np.exp(
+            -_sq_dists(food, self.__centers) / (2 * self.__width ** 2)
+        )
+        return self.__mean + kernel @ self.__weights
+
+
+SURROGATES = {
+    'knn': KNNSurrogate,
+    'rbf': RBFSurrogate
+}
+
+
+def get_surrogate(surrogate):
+    '''
+    Returns the Surrogate object for a surrogate name or object
+
+    Args:
+        surrogate (str or Surrogate): name of a surrogate in SURROGATES, or
+            a Surrogate object
+
+    Returns:
+        Surrogate: surrogate object
+    '''
+
+    if isinstance(surrogate, Surrogate):
+        return surrogate
+    if surrogate not in SURROGATES:
+        raise ValueError('Unsupported surrogate: use {} or a Surrogate '
+                         'object'.format(list(SURROGATES)))
+    return SURROGATES[surrogate]()
+
+
+def _sq_dists(food, samples):
+    '''
+    Squared Euclidean distances between two sets of food sources
+
+    Args:
+        food (numpy.ndarray): food sources, shape (n, n_params)
+        samples (numpy.ndarray): food sources, shape (m, n_params)
+
+    Returns:
+        numpy.ndarray: squared distances, shape (n, m)
+    '''
+
+    return np.maximum(
+        (food ** 2).sum(axis=1)[:, None] + (samples ** 2).sum(axis=1) -
+        2 * food @ samples.T, 0.0
+    )
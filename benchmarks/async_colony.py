@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# async_colony.py
+#
+# Benchmark script, runs an AsyncColony against a local stand-in model
+#   server (an asyncio TCP server that answers after a fixed latency) and
+#   measures wall-clock time per search generation and the Python memory
+#   allocated per in-flight evaluation (client and stand-in server), for
+#   several concurrency limits
+#
+
+# Stdlib imports
+import asyncio
+from argparse import ArgumentParser
+from time import perf_counter
+import tracemalloc
+
+# ApisOptimizer imports
+from apisoptimizer import AsyncColony
+
+
+async def handle_request(reader, writer, latency):
+    ''' Stand-in model server: reads "x y" and answers with the sum of
+    squares after latency seconds
+
+    Args:
+        reader (asyncio.StreamReader): request stream
+        writer (asyncio.StreamWriter): response stream
+        latency (float): seconds to wait before answering
+    '''
+
+    x, y = map(float, (await reader.readline()).split())
+    await asyncio.sleep(latency)
+    writer.write('{}\n'.format(x ** 2 + y ** 2).encode())
+    await writer.drain()
+    writer.close()
+
+
+async def query_server(params, args):
+    ''' Objective function: asks the stand-in server for the value
+
+    Args:
+        params (dict): dictionary of apisoptimizer.Parameter objects
+        args (dict): {'port': int}
+
+    Returns:
+        float: value computed by the server
+    '''
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', args['port'])
+    writer.write('{} {}\n'.format(
+        params['x'].value, params['y'].value
+    ).encode())
+    await writer.drain()
+    obj_fn_val = float(await reader.readline())
+    writer.close()
+    return obj_fn_val
+
+
+async def time_search(port, num_employers, max_concurrency, num_generations):
+    ''' Times an AsyncColony's search generations
+
+    Args:
+        port (int): port of the stand-in server
+        num_employers (int): number of employer bees
+        max_concurrency (int): maximum number of evaluations in flight
+        num_generations (int): number of search() calls to time
+
+    Returns:
+        tuple: (mean seconds per generation, peak KiB of Python memory
+            allocated per in-flight evaluation)
+    '''
+
+    abc = AsyncColony(num_employers, query_server, {'port': port},
+                      max_concurrency=max_concurrency, seed=0)
+    abc.add_param('x', -10.0, 10.0)
+    abc.add_param('y', -10.0, 10.0)
+    await abc.initialize()
+    start = perf_counter()
+    for _ in range(num_generations):
+        await abc.search()
+    seconds = (perf_counter() - start) / num_generations
+
+    # Memory is traced in a separate generation; tracing slows the search
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    await abc.search()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    in_flight = min(max_concurrency, num_employers * 2)
+    return (seconds, peak / in_flight / 1024)
+
+
+async def main(args):
+    ''' Starts the stand-in server and prints the benchmark table
+
+    Args:
+        args (argparse.Namespace): parsed command line arguments
+    '''
+
+    server = await asyncio.start_server(
+        lambda r, w: handle_request(r, w, args.latency), '127.0.0.1', 0,
+        backlog=1024
+    )
+    port = server.sockets[0].getsockname()[1]
+    print('Server latency: {} s, {} bees'.format(
+        args.latency, args.employers * 2
+    ))
+    print('{:>15} {:>20} {:>20}'.format(
+        'concurrency', 'seconds/generation', 'KiB/evaluation'
+    ))
+    for max_concurrency in args.concurrency:
+        seconds, kib = await time_search(
+            port, args.employers, max_concurrency, args.generations
+        )
+        print('{:>15} {:>20.3f} {:>20.1f}'.format(
+            max_concurrency, seconds, kib
+        ))
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser()
+    parser.add_argument('--employers', type=int, default=250)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--generations', type=int, default=3)
+    parser.add_argument('--concurrency', type=int, nargs='+',
+                        default=[16, 128, 500])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# backends.py
+#
+# Benchmark script, compares the 'process', 'thread' and 'serial' evaluation
+#   backends: evaluations per second and the private memory of this process
+#   plus its worker processes (Linux only, reads /proc/<pid>/smaps_rollup),
+#   for the cheap objective of examples/minimize_integers.py and for a
+#   NumPy/BLAS-heavy objective that releases the GIL
+#
+
+# Stdlib imports
+from argparse import ArgumentParser
+from multiprocessing import active_children
+from os import getpid
+from time import perf_counter
+
+# 3rd party, open src. imports
+import numpy as np
+
+# ApisOptimizer imports
+from apisoptimizer import Colony
+
+
+def minimize_integers(integers, args=None):
+    ''' Objective function of examples/minimize_integers.py: sum of three
+    integers
+
+    Args:
+        integers (dict): dictionary of apisoptimizer.Parameter objects
+        args (None): there are no additional arguments for this function
+
+    Returns:
+        int: sum of three integer values
+    '''
+
+    return (
+        integers['int1'].value +
+        integers['int2'].value +
+        integers['int3'].value
+    )
+
+
+def ridge_error(params, args):
+    ''' GIL-releasing objective function: fits ridge regression weights with
+    regularization strength 10 ** log_alpha and returns the validation error
+
+    Args:
+        params (dict): dictionary of apisoptimizer.Parameter objects
+        args (dict): {'x': numpy.ndarray, 'y': numpy.ndarray}
+
+    Returns:
+        float: mean squared error on the second half of the data
+    '''
+
+    x, y = args['x'], args['y']
+    half = len(x) // 2
+    gram = x[:half].T @ x[:half]
+    gram[np.diag_indices_from(gram)] += 10 ** params['log_alpha'].value
+    weights = np.linalg.solve(gram, x[:half].T @ y[:half])
+    return float(np.mean((x[half:] @ weights - y[half:]) ** 2))
+
+
+def private_mib(pid):
+    ''' Private memory (clean + dirty) of a process in MiB
+
+    Args:
+        pid (int): process ID
+
+    Returns:
+        float: private memory in MiB
+    '''
+
+    total_kib = 0
+    with open('/proc/{}/smaps_rollup'.format(pid)) as smaps:
+        for line in smaps:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                total_kib += int(line.split()[1])
+    return total_kib / 1024
+
+
+def run_backend(objective, backend, args):
+    ''' Times a colony's search generations with one backend
+
+    Args:
+        objective (str): 'integers' or 'ridge'
+        backend (str): Colony backend
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        tuple: (evaluations per second, MiB of private memory of this process
+            and its workers)
+    '''
+
+    if objective == 'integers':
+        abc = Colony(args.employers, minimize_integers,
+                     num_processes=args.workers, backend=backend)
+        for name in ('int1', 'int2', 'int3'):
+            abc.add_param(name, 0, 10)
+    else:
+        rng = np.random.default_rng(0)
+        x = rng.random((args.samples, args.features))
+        y = x @ rng.random(args.features) + rng.normal(0, 0.1, args.samples)
+        abc = Colony(args.employers, ridge_error, {'x': x, 'y': y},
+                     num_processes=args.workers, backend=backend)
+        abc.add_param('log_alpha', -6.0, 2.0)
+    with abc:
+        abc.initialize()
+        start = perf_counter()
+        for _ in range(args.generations):
+            abc.search()
+        seconds = perf_counter() - start
+        memory = private_mib(getpid()) + sum(
+            private_mib(p.pid) for p in active_children()
+        )
+    return (args.generations * args.employers * 2 / seconds, memory)
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser()
+    parser.add_argument('--employers', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--samples', type=int, default=4000)
+    parser.add_argument('--features', type=int, default=400)
+    args = parser.parse_args()
+
+    print('{:>10} {:>10} {:>20} {:>15}'.format(
+        'objective', 'backend', 'evaluations/second', 'memory (MiB)'
+    ))
+    for objective in ('integers', 'ridge'):
+        for backend in ('serial', 'thread', 'process'):
+            evals_per_sec, memory = run_backend(objective, backend, args)
+            print('{:>10} {:>10} {:>20.1f} {:>15.1f}'.format(
+                objective, backend, evals_per_sec, memory
+            ))
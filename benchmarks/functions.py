@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# functions.py
+#
+# Standard test functions for benchmarks/suite.py: Sphere, Rastrigin,
+#   Rosenbrock, Ackley and Griewank, vectorized over the last axis (one
+#   point, or an array of points with one row per point); each has a global
+#   minimum of 0
+#
+
+# 3rd party, open src. imports
+import numpy as np
+
+
+def sphere(x):
+    ''' Sphere function, minimum 0 at x = 0 '''
+
+    return np.sum(x ** 2, axis=-1)
+
+
+def rastrigin(x):
+    ''' Rastrigin function, minimum 0 at x = 0 '''
+
+    return 10 * x.shape[-1] + np.sum(
+        x ** 2 - 10 * np.cos(2 * np.pi * x), axis=-1
+    )
+
+
+def rosenbrock(x):
+    ''' Rosenbrock function, minimum 0 at x = 1 '''
+
+    return np.sum(
+        100 * (x[..., 1:] - x[..., :-1] ** 2) ** 2 + (1 - x[..., :-1]) ** 2,
+        axis=-1
+    )
+
+
+def ackley(x):
+    ''' Ackley function, minimum 0 at x = 0 '''
+
+    return -20 * np.exp(-0.2 * np.sqrt(np.mean(x ** 2, axis=-1))) - np.exp(
+        np.mean(np.cos(2 * np.pi * x), axis=-1)
+    ) + 20 + np.e
+
+
+def griewank(x):
+    ''' Griewank function, minimum 0 at x = 0 '''
+
+    i = np.arange(1, x.shape[-1] + 1)
+    return 1 + np.sum(x ** 2, axis=-1) / 4000 - np.prod(
+        np.cos(x / np.sqrt(i)), axis=-1
+    )
+
+
+# Name: (function, search domain bound: each parameter is searched in
+#   [-bound, bound])
+FUNCTIONS = {
+    'sphere': (sphere, 5.12),
+    'rastrigin': (rastrigin, 5.12),
+    'rosenbrock': (rosenbrock, 2.048),
+    'ackley': (ackley, 32.768),
+    'griewank': (griewank, 600.0)
+}
+
+
+def param_names(dim):
+    ''' Names of a benchmark colony's parameters
+
+    Args:
+        dim (int): number of parameters
+
+    Returns:
+        list: parameter names, 'x0' to 'x<dim - 1>'
+    '''
+
+    return ['x{}'.format(i) for i in range(dim)]
+
+
+def objective(params, name):
+    ''' Objective function for Colony: evaluates a test function
+
+    Args:
+        params (dict): dictionary of apisoptimizer.Parameter objects
+        name (str): name of a function in FUNCTIONS
+
+    Returns:
+        float: function value
+    '''
+
+    x = np.array([params['x{}'.format(i)].value for i in range(len(params))])
+    return float(FUNCTIONS[name][0](x))
+
+
+def batch_objective(food, names, name):
+    ''' Batch objective function for Colony(batch=True): evaluates a test
+    function for every food source at once
+
+    Args:
+        food (numpy.ndarray): parameter values, shape (n_bees, n_params)
+        names (list): parameter names, the column order of food
+        name (str): name of a function in FUNCTIONS
+
+    Returns:
+        numpy.ndarray: function values
+    '''
+
+    return FUNCTIONS[name][0](food)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# pool_overhead.py
+#
+# Benchmark script, measures the per-generation overhead of evaluating bees
+#   with multiple processes when the colony's worker pool is reused across
+#   generations versus when a new pool is started for every generation
+#
+
+# Stdlib imports
+from argparse import ArgumentParser
+from time import perf_counter
+
+# ApisOptimizer imports
+from apisoptimizer import Colony
+
+
+def sum_of_squares(params, args=None):
+    ''' Cheap objective function: the cost of evaluating it is negligible
+    compared to the cost of starting worker processes
+
+    Args:
+        params (dict): dictionary of apisoptimizer.Parameter objects
+        args (None): there are no additional arguments for this function
+
+    Returns:
+        float: sum of squared parameter values
+    '''
+
+    return sum(params[p].value ** 2 for p in params)
+
+
+def time_generations(num_employers, num_processes, num_generations,
+                     restart_pool):
+    ''' Times a colony's search generations
+
+    Args:
+        num_employers (int): number of employer bees
+        num_processes (int): number of worker processes
+        num_generations (int): number of search() calls to time
+        restart_pool (bool): if True, close the pool after every generation
+            (a new pool is started for each generation)
+
+    Returns:
+        float: mean wall-clock seconds per generation
+    '''
+
+    with Colony(num_employers, sum_of_squares,
+                num_processes=num_processes) as abc:
+        for idx in range(3):
+            abc.add_param('x{}'.format(idx), -10.0, 10.0)
+        abc.initialize()
+        if restart_pool:
+            abc.close()
+        start = perf_counter()
+        for _ in range(num_generations):
+            abc.search()
+            if restart_pool:
+                abc.close()
+        return (perf_counter() - start) / num_generations
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser()
+    parser.add_argument('--employers', type=int, default=20)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--generations', type=int, default=20)
+    args = parser.parse_args()
+
+    per_gen_restart = time_generations(
+        args.employers, args.processes, args.generations, True
+    )
+    per_gen_reuse = time_generations(
+        args.employers, args.processes, args.generations, False
+    )
+    print('New pool per generation:   {:.4f} s/generation'.format(
+        per_gen_restart
+    ))
+    print('Persistent pool:           {:.4f} s/generation'.format(
+        per_gen_reuse
+    ))
+    print('Overhead removed:          {:.4f} s/generation ({:.1f}x)'.format(
+        per_gen_restart - per_gen_reuse,
+        per_gen_restart / per_gen_reuse
+    ))
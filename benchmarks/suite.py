@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# suite.py
+#
+# Benchmark suite: runs colonies on standard test functions (see
+#   functions.py) for every combination of function, dimension, colony size
+#   and mode ('serial', 'process': num_processes > 1, 'batch': a batch
+#   objective function), and reports per case:
+#
+#   evals_per_sec        objective function evaluations per second of
+#                          search()
+#   overhead_us          framework overhead per evaluation in microseconds:
+#                          wall-clock time per evaluation minus the time the
+#                          test function itself takes (divided by the
+#                          number of workers in 'process' mode)
+#   peak_rss_mib         peak resident memory of the process running the
+#                          case (each case runs in a fresh process)
+#   peak_worker_rss_mib  peak resident memory of its largest worker
+#   evals_to_target      evaluations until the best value was at or below
+#                          --target (null if it was not reached)
+#
+# Results are saved as JSON; pass a previous run's JSON file to --compare
+#   to print changes and exit with status 1 if a case got slower than
+#   --tolerance allows. Examples:
+#
+#   python benchmarks/suite.py --output before.json
+#   python benchmarks/suite.py --output after.json --compare before.json
+#   python benchmarks/suite.py --dims 2 10 100 1000 \
+#       --employers 10 100 1000 10000 --output full.json
+#
+
+# Stdlib imports
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from itertools import product
+import json
+from multiprocessing import cpu_count, get_context
+import platform
+from resource import RUSAGE_CHILDREN, RUSAGE_SELF, getrusage
+import sys
+from time import perf_counter
+
+# 3rd party, open src. imports
+import numpy as np
+
+# ApisOptimizer imports
+import apisoptimizer
+from apisoptimizer import Colony
+
+from functions import FUNCTIONS, batch_objective, objective, param_names
+
+MODES = ('serial', 'process', 'batch')
+
+
+def raw_seconds_per_eval(name, dim, mode, num_food):
+    ''' Times the test function alone, called the way the colony calls it
+
+    Args:
+        name (str): name of a function in FUNCTIONS
+        dim (int): number of parameters
+        mode (str): 'serial', 'process' or 'batch'
+        num_food (int): number of food sources per generation
+
+    Returns:
+        float: seconds per evaluation
+    '''
+
+    fn, bound = FUNCTIONS[name]
+    food = np.random.default_rng(0).uniform(-bound, bound, (num_food, dim))
+    start = perf_counter()
+    if mode == 'batch':
+        fn(food)
+    else:
+        for x in food[:200]:
+            float(fn(np.array(x.tolist())))
+        num_food = min(num_food, 200)
+    return (perf_counter() - start) / num_food
+
+
+def run_case(name, dim, employers, mode, args):
+    ''' Runs one benchmark case
+
+    Args:
+        name (str): name of a function in FUNCTIONS
+        dim (int): number of parameters
+        employers (int): number of employer bees
+        mode (str): 'serial', 'process' or 'batch'
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        dict: case description and measurements
+    '''
+
+    num_food = employers * 2
+    generations = max(1, min(args.generations,
+                             args.max_evaluations // num_food - 1))
+    processes = args.processes if mode == 'process' else 1
+    if mode == 'batch':
+        abc = Colony(employers, batch_objective, name, batch=True,
+                     seed=args.seed)
+    else:
+        abc = Colony(employers, objective, name, num_processes=processes,
+                     seed=args.seed)
+    bound = FUNCTIONS[name][1]
+    for param in param_names(dim):
+        abc.add_param(param, -bound, bound)
+
+    evals_to_target = None
+    with abc:
+        abc.initialize()
+        initial = abc.stats['counts']['evaluations']
+        if 1 / abc.best_fitness - 1 <= args.target:
+            evals_to_target = initial
+        start = perf_counter()
+        for _ in range(generations):
+            abc.search()
+            if evals_to_target is None and \
+                    1 / abc.best_fitness - 1 <= args.target:
+                evals_to_target = abc.stats['counts']['evaluations']
+        seconds = perf_counter() - start
+        best_value = 1 / abc.best_fitness - 1
+        evaluations = abc.stats['counts']['evaluations']
+
+    # Objective function evaluations made (food sources shared by several
+    #   bees are evaluated once)
+    searched = evaluations - initial
+    raw = raw_seconds_per_eval(name, dim, mode, num_food)
+    return {
+        'function': name,
+        'dim': dim,
+        'employers': employers,
+        'mode': mode,
+        'processes': processes,
+        'generations': generations,
+        'evaluations': evaluations,
+        'seconds': seconds,
+        'evals_per_sec': searched / seconds,
+        'overhead_us': (seconds / searched - raw / processes) * 1e6,
+        'peak_rss_mib': getrusage(RUSAGE_SELF).ru_maxrss / 1024,
+        'peak_worker_rss_mib': getrusage(RUSAGE_CHILDREN).ru_maxrss / 1024,
+        'best_value': best_value,
+        'evals_to_target': evals_to_target
+    }
+
+
+def _case_process(conn, case, args):
+    ''' Process target: runs a case and sends its result (or error) '''
+
+    try:
+        conn.send(run_case(*case, args))
+    except Exception as error:
+        conn.send({'error': repr(error)})
+    conn.close()
+
+
+def run_isolated(case, args):
+    ''' Runs a case in a fresh process, so its peak memory is its own
+
+    Args:
+        case (tuple): (function name, dim, employers, mode)
+        args (argparse.Namespace): parsed command line arguments
+
+    Returns:
+        dict: result of run_case()
+    '''
+
+    ctx = get_context('spawn')
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_case_process, args=(send_conn, case, args))
+    process.start()
+    send_conn.close()
+    try:
+        result = recv_conn.recv()
+    except EOFError:
+        result = {'error': 'exit code {}'.format(process.exitcode)}
+    process.join()
+    if 'error' in result:
+        result.update(zip(('function', 'dim', 'employers', 'mode'), case))
+    return result
+
+
+def case_key(result):
+    ''' Key identifying a case across runs '''
+
+    return (result['function'], result['dim'], result['employers'],
+            result['mode'])
+
+
+def compare(results, baseline, tolerance):
+    ''' Prints changes relative to a previous run
+
+    Args:
+        results (list): results of this run
+        baseline (dict): contents of a previous run's JSON file
+        tolerance (float): relative slowdown in evaluations per second
+            counted as a regression
+
+    Returns:
+        int: number of regressions
+    '''
+
+    previous = {case_key(r): r for r in baseline['results']
+                if 'error' not in r}
+    regressions = 0
+    print('\n{:>10} {:>5} {:>9} {:>8} {:>14} {:>14}'.format(
+        'function', 'dim', 'employers', 'mode', 'evals/sec', 'overhead'
+    ))
+    for result in results:
+        old = previous.get(case_key(result))
+        if old is None or 'error' in result:
+            continue
+        speedup = result['evals_per_sec'] / old['evals_per_sec']
+        regressed = speedup < 1 - tolerance
+        regressions += regressed
+        print('{:>10} {:>5} {:>9} {:>8} {:>13.2f}x {:>+11.1f} us{}'.format(
+            *case_key(result), speedup,
+            result['overhead_us'] - old['overhead_us'],
+            '  REGRESSION' if regressed else ''
+        ))
+    return regressions
+
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser()
+    parser.add_argument('--functions', nargs='+', default=list(FUNCTIONS),
+                        choices=list(FUNCTIONS))
+    parser.add_argument('--dims', type=int, nargs='+', default=[2, 10, 100])
+    parser.add_argument('--employers', type=int, nargs='+',
+                        default=[10, 100])
+    parser.add_argument('--modes', nargs='+', default=list(MODES),
+                        choices=MODES)
+    parser.add_argument('--processes', type=int,
+                        default=max(2, min(4, cpu_count())))
+    parser.add_argument('--generations', type=int, default=20)
+    parser.add_argument('--max-evaluations', type=int, default=200000,
+                        help='fewer generations are run for large colonies')
+    parser.add_argument('--target', type=float, default=1e-2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--compare', help='JSON file of a previous run')
+    parser.add_argument('--tolerance', type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = []
+    print('{:>10} {:>5} {:>9} {:>8} {:>12} {:>13} {:>10} {:>12}'.format(
+        'function', 'dim', 'employers', 'mode', 'evals/sec', 'overhead (us)',
+        'peak MiB', 'to target'
+    ))
+    for case in product(args.functions, args.dims, args.employers,
+                        args.modes):
+        result = run_isolated(case, args)
+        results.append(result)
+        if 'error' in result:
+            print('{:>10} {:>5} {:>9} {:>8}  failed: {}'.format(
+                *case, result['error']
+            ))
+            continue
+        print('{:>10} {:>5} {:>9} {:>8} {:>12.0f} {:>13.1f} {:>10.1f} '
+              '{:>12}'.format(
+                  *case, result['evals_per_sec'], result['overhead_us'],
+                  result['peak_rss_mib'], str(result['evals_to_target'])
+              ))
+
+    report = {
+        'meta': {
+            'apisoptimizer': apisoptimizer.__version__,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': cpu_count(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'args': {k: v for k, v in vars(args).items()
+                     if k not in ('output', 'compare')}
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+    print('\nSaved {} results to {}'.format(len(results), args.output))
+
+    if args.compare is not None:
+        with open(args.compare) as baseline:
+            regressions = compare(results, json.load(baseline),
+                                  args.tolerance)
+        if regressions > 0:
+            print('{} case(s) slower than the baseline'.format(regressions))
+            sys.exit(1)
@@ -56,10 +56,14 @@ if __name__ == '__main__':
     abc.add_param('decay', 0.0, 1.0)
     abc.add_param('hidden_1', 1, 50)
     abc.add_param('hidden_2', 1, 50)
-    abc.initialize()
-    for i in range(10):
-        abc.search()
-        print('\nAverage colony fitness: {}'.format(abc.average_fitness))
-        print('Average return value: {}'.format(abc.ave_obj_fn_val))
-        print('Best fitness: {}'.format(abc.best_fitness))
-        print('Best parameters: {}\n'.format(abc.best_parameters))
+
+    # The worker pool is reused across generations; leaving the "with"
+    #   block shuts it down
+    with abc:
+        abc.initialize()
+        for i in range(10):
+            abc.search()
+            print('\nAverage colony fitness: {}'.format(abc.average_fitness))
+            print('Average return value: {}'.format(abc.ave_obj_fn_val))
+            print('Best fitness: {}'.format(abc.best_fitness))
+            print('Best parameters: {}\n'.format(abc.best_parameters))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# test_async_colony.py
+#
+# Checks AsyncColony against a local stand-in model server (an asyncio TCP
+#   server answering after a short latency): the concurrency limit, that
+#   initialize()/search() return with no evaluations outstanding, and that
+#   unsupported Colony options are rejected
+#
+
+# Stdlib imports
+import asyncio
+import random
+
+# 3rd party, open src. imports
+import pytest
+
+# ApisOptimizer imports
+from apisoptimizer import AsyncColony
+from apisoptimizer.async_colony import UNSUPPORTED
+
+
+class StandInServer:
+
+    def __init__(self, max_latency=0.01):
+        '''
+        Stand-in model server: reads "x y" lines and answers with the sum
+        of squares after a random latency of up to max_latency seconds (so
+        results arrive out of order), tracking requests in flight
+        '''
+
+        self.rng = random.Random(0)
+        self.max_latency = max_latency
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.requests += 1
+        x, y = map(float, (await reader.readline()).split())
+        await asyncio.sleep(self.rng.uniform(0, self.max_latency))
+        writer.write('{}\n'.format(x ** 2 + y ** 2).encode())
+        await writer.drain()
+        writer.close()
+        self.in_flight -= 1
+
+
+async def _query(params, args):
+
+    args['evaluating'] += 1
+    reader, writer = await asyncio.open_connection('127.0.0.1', args['port'])
+    writer.write('{} {}\n'.format(
+        params['x'].value, params['y'].value
+    ).encode())
+    await writer.drain()
+    obj_fn_val = float(await reader.readline())
+    writer.close()
+    args['evaluating'] -= 1
+    return obj_fn_val
+
+
+def _run(max_concurrency, min_val, max_val, generations=5):
+    '''
+    Runs an AsyncColony against a stand-in server
+
+    Returns:
+        tuple: (StandInServer, AsyncColony, list: evaluations outstanding
+            after initialize() and each search())
+    '''
+
+    server = StandInServer()
+
+    async def main():
+
+        stand_in = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+        args = {'port': stand_in.sockets[0].getsockname()[1], 'evaluating': 0}
+        abc = AsyncColony(10, _query, args, max_concurrency=max_concurrency,
+                          seed=0)
+        abc.add_param('x', min_val, max_val)
+        abc.add_param('y', min_val, max_val)
+        outstanding = []
+        await abc.initialize()
+        outstanding.append(args['evaluating'])
+        for _ in range(generations):
+            await abc.search()
+            outstanding.append(args['evaluating'])
+        stand_in.close()
+        await stand_in.wait_closed()
+        return abc, outstanding
+
+    abc, outstanding = asyncio.run(main())
+    return server, abc, outstanding
+
+
+def test_concurrency_limit():
+
+    server, abc, outstanding = _run(4, -10.0, 10.0)
+    assert server.peak == 4
+    assert abc.stats['counts']['evaluations'] == server.requests
+
+
+def test_no_evaluations_outstanding_on_return():
+
+    # A small integer space: bees often share a candidate, and one result
+    #   settles several bees
+    server, abc, outstanding = _run(16, 0, 2, generations=10)
+    assert abc.deduplicated > 0
+    assert outstanding == [0] * 11
+    assert abc.best_obj_fn_val == 0
+
+
+@pytest.mark.parametrize('option', UNSUPPORTED)
+def test_unsupported_options_are_rejected(option):
+
+    with pytest.raises(ValueError, match=option):
+        AsyncColony(10, _query, **{option: None})
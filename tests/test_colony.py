@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# test_colony.py
+#
+# Regression checks for Colony: objective functions returning NaN, and
+#   the evaluations counted in stats
+#
+
+# Stdlib imports
+import math
+import os
+from time import sleep
+from uuid import uuid4
+
+# ApisOptimizer imports
+from apisoptimizer import Colony
+
+
+def _nan_region(params, args=None):
+
+    if params['x'].value > 0:
+        return float('nan')
+    return params['x'].value ** 2 + params['y'].value ** 2
+
+
+def _colony(**kwargs):
+
+    colony = Colony(4, _nan_region, seed=0, **kwargs)
+    colony.add_param('x', -5, 5)
+    colony.add_param('y', -5, 5)
+    return colony
+
+
+def test_search_continues_after_nan_values():
+
+    for kwargs in ({}, {'steady_state': True}):
+        colony = _colony(timeout_penalty=1e9, **kwargs)
+        colony.initialize()
+        for _ in range(10):
+            colony.search()
+        assert colony.best_obj_fn_val == 0
+        assert colony.best_parameters['x'] <= 0
+
+
+def test_ask_tell_continues_after_nan_values():
+
+    colony = _colony()
+    asked = set()
+    for _ in range(50):
+        candidates = colony.ask(4)
+        asked.update(bee_id for bee_id, _ in candidates)
+        colony.tell([(bee_id, _nan_region(params))
+                     for bee_id, params in candidates])
+    assert asked == set(range(8))
+    assert colony.best_obj_fn_val == 0
+    assert not math.isnan(colony.ave_obj_fn_val)
+
+
+def _slow_or_hung(params, args):
+
+    # Records each call that completes
+    done_dir, seconds = args
+    if params['x'].value > 6:
+        sleep(30)
+    sleep(seconds)
+    open(os.path.join(done_dir, uuid4().hex), 'w').close()
+    return params['x'].value ** 2 + params['y'].value ** 2
+
+
+def _completed(done_dir):
+
+    return len(os.listdir(done_dir))
+
+
+def test_evaluations_count_completed_calls(tmp_path):
+
+    for kwargs in ({}, {'steady_state': True}):
+        done_dir = tmp_path / str(len(kwargs))
+        done_dir.mkdir()
+        colony = Colony(4, _slow_or_hung, (str(done_dir), 0.01),
+                        num_processes=2,
+                        timeout=0.5, max_retries=1, timeout_penalty=1e9,
+                        seed=0, **kwargs)
+        colony.add_param('x', 0, 10)
+        colony.add_param('y', 0, 10)
+        with colony:
+            colony.initialize()
+            for _ in range(3):
+                colony.search()
+            stats = colony.stats['counts']
+        assert stats['retries'] > 0
+        assert stats['evaluations'] == _completed(done_dir)
+
+
+def test_cancelled_evaluations_are_not_counted(tmp_path):
+
+    # Evaluations complete about 0.3 and 0.6 seconds in, well clear of
+    #   the deadline
+    colony = Colony(4, _slow_or_hung, (str(tmp_path), 0.3), num_processes=2,
+                    seed=0)
+    colony.add_param('x', 0, 6)
+    colony.add_param('y', 0, 10)
+    with colony:
+        result = colony.run(max_seconds=0.45)
+    assert result.reason == 'max_seconds'
+    assert result.evaluations == _completed(tmp_path)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# test_distributed.py
+#
+# Checks TCPEvaluator on one host: run_worker processes connect over
+#   127.0.0.1, one is killed while evaluating, and its task must be queued
+#   again so that the colony matches a serial run
+#
+
+# Stdlib imports
+from multiprocessing import Process
+import os
+from threading import Thread
+from time import sleep
+
+# ApisOptimizer imports
+from apisoptimizer import Colony
+from apisoptimizer.distributed import TCPEvaluator, run_worker
+
+AUTHKEY = b'apisoptimizer-test'
+
+
+def _slow_sphere(params, busy_dir):
+
+    # The marker file exists while this process is evaluating
+    busy = os.path.join(busy_dir, str(os.getpid()))
+    open(busy, 'w').close()
+    sleep(0.05)
+    os.remove(busy)
+    return params['x'].value ** 2 + params['y'].value ** 2
+
+
+def _kill_when_busy(pid, busy_dir):
+
+    busy = os.path.join(busy_dir, str(pid))
+    while not os.path.exists(busy):
+        sleep(0.001)
+    os.kill(pid, 9)
+
+
+def _colony(busy_dir, **kwargs):
+
+    colony = Colony(6, _slow_sphere, str(busy_dir), seed=0, **kwargs)
+    colony.add_param('x', -5.0, 5.0)
+    colony.add_param('y', -5.0, 5.0)
+    return colony
+
+
+def _search(colony, generations):
+
+    colony.initialize()
+    for _ in range(generations):
+        colony.search()
+    return colony.best_obj_fn_val, colony.best_parameters
+
+
+def test_killed_worker_task_is_queued_again(tmp_path):
+
+    expected = _search(_colony(tmp_path), 4)
+
+    with TCPEvaluator(AUTHKEY, address=('127.0.0.1', 0)) as coordinator:
+        workers = [Process(target=run_worker,
+                           args=(coordinator.address, AUTHKEY), daemon=True)
+                   for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        assert coordinator.wait_for_workers(3, timeout=10)
+
+        colony = _colony(tmp_path, evaluator=coordinator)
+        assert colony.stats['workers'] == 3
+
+        # Kill a worker in the middle of an evaluation
+        victim = workers[0]
+        killer = Thread(target=_kill_when_busy, args=(victim.pid, tmp_path),
+                        daemon=True)
+        killer.start()
+        try:
+            result = _search(colony, 4)
+        finally:
+            killer.join(5)
+        victim.join(5)
+
+        # The victim's task was lost with it; the colony still finished
+        #   only because the task was queued again
+        assert os.path.exists(os.path.join(tmp_path, str(victim.pid)))
+        assert result == expected
+        assert colony.stats['workers'] == 2
+        stats = {w['pid']: w for w in coordinator.workers}
+        assert len(stats) == 3
+        assert not stats[victim.pid]['connected']
+        assert all(stats[w.pid]['connected'] for w in workers[1:])
+
+        # Every evaluation was completed once, the lost one by a survivor
+        evaluations = colony.stats['counts']['evaluations']
+        assert sum(w['completed'] for w in stats.values()) == evaluations
+
+    for worker in workers[1:]:
+        worker.join(5)
+        assert not worker.is_alive()
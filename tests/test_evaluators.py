@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# test_evaluators.py
+#
+# Regression checks for PoolEvaluator: an evaluation that times out, or
+#   whose worker process dies, must fail its result (not hang) and leave
+#   the pool usable; run with "python -m pytest tests"
+#
+
+# Stdlib imports
+import os
+from time import sleep
+
+# ApisOptimizer imports
+from apisoptimizer import Colony, Parameter
+from apisoptimizer.evaluators import EvaluationTimeout, PoolEvaluator, \
+    _evaluate
+
+
+def _sleepy(params, args=None):
+
+    if params['x'].value > 8:
+        sleep(30)
+    return params['x'].value
+
+
+def _dies(params, args=None):
+
+    if params['x'].value > 8:
+        os._exit(1)
+    return params['x'].value
+
+
+def _pool(obj_fn):
+
+    pool = PoolEvaluator(1, timeout=0.5)
+    pool.start(obj_fn, None, [Parameter('x', 0, 10, True)])
+    return pool
+
+
+def _get_error(result):
+
+    try:
+        result.get(10)
+    except Exception as error:
+        return error
+    raise AssertionError('Evaluation did not fail')
+
+
+def test_timeout_fails_result_and_replaces_worker():
+
+    pool = _pool(_sleepy)
+    try:
+        error = _get_error(pool.submit(_evaluate, [9]))
+        assert isinstance(error, EvaluationTimeout)
+        assert pool.submit(_evaluate, [1]).get(10)[0] == 1
+    finally:
+        pool.stop()
+
+
+def test_dead_worker_fails_result_and_replaces_worker():
+
+    pool = _pool(_dies)
+    try:
+        error = _get_error(pool.submit(_evaluate, [9]))
+        assert 'died' in str(error)
+        assert pool.submit(_evaluate, [1]).get(10)[0] == 1
+    finally:
+        pool.stop()
+
+
+def test_colony_timeouts_are_penalized():
+
+    colony = Colony(5, _sleepy, num_processes=2, timeout=0.5,
+                    timeout_penalty=1e9, seed=0)
+    colony.add_param('x', 0, 10)
+    with colony:
+        colony.initialize()
+        colony.search()
+        assert colony.stats['counts']['timeouts'] > 0
+        assert colony.best_obj_fn_val <= 8
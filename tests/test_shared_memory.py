@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# test_shared_memory.py
+#
+# Checks that worker processes read arrays passed with share_arrays=True
+#   from shared memory: their private memory (Linux only, read from
+#   /proc/<pid>/smaps_rollup) must not grow with the array. Workers are
+#   spawned, so unshared arrays would be pickled into each of them.
+#
+
+# Stdlib imports
+import multiprocessing
+from multiprocessing import active_children
+import os
+
+# 3rd party, open src. imports
+import numpy as np
+import pytest
+
+# ApisOptimizer imports
+from apisoptimizer import Colony
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists('/proc/self/smaps_rollup'),
+    reason='requires /proc/<pid>/smaps_rollup'
+)
+
+
+def _weighted_sum(params, args):
+
+    means = args['data'].mean(axis=0)
+    return abs(params['w0'].value * means[0] + params['w1'].value * means[1])
+
+
+def _private_mib(pid):
+
+    total_kib = 0
+    with open('/proc/{}/smaps_rollup'.format(pid)) as smaps:
+        for line in smaps:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                total_kib += int(line.split()[1])
+    return total_kib / 1024
+
+
+def _worker_mib(megabytes, share):
+    '''
+    Runs a generation reading an array of the given size in every worker
+
+    Returns:
+        float: largest private memory of the colony's workers in MiB
+    '''
+
+    data = np.random.default_rng(0).random((megabytes * 2 ** 16, 2))
+    with Colony(4, _weighted_sum, obj_fn_args={'data': data},
+                num_processes=2, share_arrays=share, seed=0) as abc:
+        abc.add_param('w0', -1.0, 1.0)
+        abc.add_param('w1', -1.0, 1.0)
+        abc.initialize()
+        abc.search()
+        return max(_private_mib(p.pid) for p in active_children())
+
+
+@pytest.fixture
+def spawn():
+
+    method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method('spawn', force=True)
+    yield
+    multiprocessing.set_start_method(method, force=True)
+
+
+def test_shared_arrays_keep_worker_memory_flat(spawn):
+
+    small, large = 8, 128
+    growth = _worker_mib(large, True) - _worker_mib(small, True)
+    assert growth < 0.25 * (large - small)
+
+
+def test_copied_arrays_grow_worker_memory(spawn):
+
+    small, large = 8, 128
+    growth = _worker_mib(large, False) - _worker_mib(small, False)
+    assert growth > 0.75 * (large - small)